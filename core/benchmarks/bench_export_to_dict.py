@@ -0,0 +1,183 @@
+"""Benchmark export_to_dict on a frame of 10 interactions against the previous recursive version.
+
+Frames and interactions are modelled with dataclasses shaped like the Frame, Interaction and
+InteractionResponse archetypes, so the benchmark runs without a graph database.
+
+Usage: python benchmarks/bench_export_to_dict.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, List, Optional, Set
+
+from jivas.agent.modules.data.serialization import export_to_dict, json_dumps
+
+
+def legacy_export_to_dict(
+    data: object | dict, ignore_keys: Optional[List[str]] = None
+) -> dict:
+    """The recursive export_to_dict this benchmark compares against."""
+    if ignore_keys is None:
+        ignore_keys = ["__jac__"]
+
+    memo: Set[int] = set()
+
+    def _convert(obj: object) -> object:
+        obj_id = id(obj)
+        if obj_id in memo:
+            return "<cycle detected>"
+        memo.add(obj_id)
+        try:
+            if obj is None or isinstance(obj, (bool, int, float, str)):
+                return obj
+            if isinstance(obj, Enum):
+                return _convert(obj.value)
+            if hasattr(obj, "_asdict") and callable(obj._asdict):
+                return _convert(obj._asdict())
+            if isinstance(obj, dict):
+                return {k: _convert(v) for k, v in obj.items() if k not in ignore_keys}
+            if isinstance(obj, (list, tuple, set, frozenset)):
+                return [_convert(item) for item in obj]
+            if hasattr(obj, "__dict__"):
+                return _convert(obj.__dict__)
+            return str(obj)
+        finally:
+            memo.discard(obj_id)
+
+    result = _convert(data)
+    return result if isinstance(result, dict) else {"value": result}
+
+
+class MessageType(str, Enum):
+    """Stand-in for the interaction message types."""
+
+    TEXT = "TEXT"
+
+
+@dataclass
+class Anchor:
+    """Stand-in for the __jac__ anchor, which exports skip."""
+
+    id: str = "anchor"
+    edges: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class Message:
+    """Stand-in for TextInteractionMessage."""
+
+    message_type: MessageType = MessageType.TEXT
+    content: str = ""
+    mime: str = ""
+    data: Any = None
+
+
+@dataclass
+class Response:
+    """Stand-in for InteractionResponse."""
+
+    session_id: str = ""
+    message_type: MessageType = MessageType.TEXT
+    message: Optional[Message] = None
+    tokens: int = 0
+
+
+@dataclass
+class Interaction:
+    """Stand-in for the Interaction node."""
+
+    id: str = ""
+    agent_id: str = "agent"
+    frame_id: str = "frame"
+    channel: str = "default"
+    utterance: str = ""
+    tokens: int = 0
+    time_stamp: str = "2025-01-01T00:00:00+00:00"
+    trail: List[str] = field(default_factory=list)
+    intents: List[str] = field(default_factory=list)
+    functions: dict = field(default_factory=dict)
+    directives: List[str] = field(default_factory=list)
+    events: List[Any] = field(default_factory=list)
+    response: Optional[Response] = None
+    data: dict = field(default_factory=dict)
+    closed: bool = True
+    _context: dict = field(default_factory=dict)
+
+
+@dataclass
+class Frame:
+    """Stand-in for the Frame node."""
+
+    id: str = "frame"
+    agent_id: str = "agent"
+    session_id: str = "session"
+    user_name: str = ""
+    variables: dict = field(default_factory=dict)
+    interactions: List[Interaction] = field(default_factory=list)
+    _context: dict = field(default_factory=dict)
+
+
+def make_frame(interactions: int = 10) -> Frame:
+    """Build a frame holding a realistic transcript of interactions."""
+    frame = Frame(variables={"user": {"name": "Ada", "plan": "pro"}})
+    for i in range(interactions):
+        interaction = Interaction(
+            id=f"interaction-{i}",
+            utterance=f"question {i} about the knowledge base " * 3,
+            tokens=850 + i,
+            trail=["IntentInteractAction", "RetrievalInteractAction", "PersonaAction"],
+            intents=["RetrievalInteractAction"],
+            directives=["Use CONTEXT as your knowledge base. " * 8],
+            events=[{"type": "retrieval", "documents": 3}],
+            response=Response(
+                session_id="session",
+                message=Message(content=f"answer {i} " * 40),
+                tokens=850 + i,
+            ),
+            data={
+                "RetrievalInteractAction": {
+                    "query": f"question {i}",
+                    "sources": [f"doc-{i}-{j}" for j in range(3)],
+                    "context": [
+                        {"content": "retrieved passage " * 30, "metadata": {"page": j}}
+                        for j in range(3)
+                    ],
+                }
+            },
+        )
+        interaction.__dict__["__jac__"] = Anchor()
+        frame.interactions.append(interaction)
+    frame.__dict__["__jac__"] = Anchor()
+    return frame
+
+
+def main() -> None:
+    """Run the benchmark and print the time per export."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    frame = make_frame()
+    ignore_keys = ["__jac__", "protected_attrs", "transient_attrs", "package_path"]
+    assert export_to_dict(frame, ignore_keys) == legacy_export_to_dict(
+        frame, ignore_keys
+    )
+
+    cases = {
+        "legacy export_to_dict": lambda: legacy_export_to_dict(frame, ignore_keys),
+        "export_to_dict": lambda: export_to_dict(frame, ignore_keys),
+        "legacy export + json.dumps": lambda: json.dumps(
+            legacy_export_to_dict(frame, ignore_keys)
+        ),
+        "export + json_dumps": lambda: json_dumps(export_to_dict(frame, ignore_keys)),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=5))
+        print(f"{name:<28} {seconds / args.number * 1e6:9.1f} us/export")
+
+
+if __name__ == "__main__":
+    main()
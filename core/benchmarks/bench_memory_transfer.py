@@ -0,0 +1,128 @@
+"""Benchmark memory import and export throughput against the previous per-frame versions.
+
+Frames are imported into the memory of a fresh agent with Memory.import_frames and
+exported with Memory.export_memory_stream, and the same is done with the previous
+import (a get_frame lookup and commit per frame) and export (every frame loaded, then
+one yaml_dumps of the whole dump). Frames are written to the datasource jac-cloud is
+configured with: MongoDB when DATABASE_HOST is set, otherwise its local database. The
+local database scans its collection on every upsert, so only MongoDB gives meaningful
+numbers at the default sizes.
+
+Usage: DATABASE_HOST=mongodb://... python benchmarks/bench_memory_transfer.py [--frames N ...] [--no-legacy]
+"""
+
+import argparse
+import io
+import time
+from typing import Any, Callable, Iterator
+
+import jaclang  # noqa: F401
+from jac_cloud.core.context import JaseciContext
+from jac_cloud.jaseci.main import FastAPI
+from jaclang.runtimelib.machine import JacMachineInterface as Jac
+
+from jivas.agent.modules.data.serialization import yaml_dumps
+
+
+def make_frames(count: int) -> Iterator[dict]:
+    """Yield count exported frame entries with distinct sessions."""
+    for i in range(count):
+        yield {
+            "frame": {
+                "context": {
+                    "session_id": f"session-{i}",
+                    "label": f"user {i}",
+                    "user_name": f"user-{i}",
+                    "interactions": [],
+                }
+            }
+        }
+
+
+def new_memory(name: str) -> Any:
+    """Return the memory of a new agent connected to the current root."""
+    from jivas.agent.core.agent import Agent
+
+    agent = Agent(name=name)
+    Jac.connect(left=JaseciContext.get().root_state.archetype, right=agent)
+    memory = agent.get_memory()
+    JaseciContext.get().mem.commit()
+    return memory
+
+
+def legacy_import_frames(memory: Any, frames: Iterator[dict]) -> None:
+    """The per-frame import this benchmark compares against."""
+    agent_id = memory.get_agent().id
+    for frame_data in frames:
+        context = frame_data["frame"]["context"]
+        frame_node = memory.get_frame(
+            agent_id=agent_id, session_id=context["session_id"], force_session=True
+        )
+        frame_node.update(context)
+    JaseciContext.get().mem.commit()
+
+
+def legacy_export_memory(memory: Any) -> str:
+    """The export this benchmark compares against: all frames dumped as one YAML document."""
+    return yaml_dumps(
+        {
+            "memory": [
+                {"frame": {"context": frame_node.export()}}
+                for frame_node in memory.get_frames()
+            ]
+        }
+    )
+
+
+def timed(name: str, frames: int, case: Callable[[], Any]) -> Any:
+    """Run case once, printing the time it took and the frames per second; returns its result."""
+    start = time.perf_counter()
+    result = case()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {elapsed:8.2f} s {frames / elapsed:10.0f} frames/s")
+    return result
+
+
+def run(count: int, legacy: bool) -> None:
+    """Import and export count frames with each path, printing their throughput."""
+    print(f"{count} frames")
+    memory = new_memory(f"bench-{count}")
+    imported = timed(
+        "import_frames",
+        count,
+        lambda: memory.import_frames(make_frames(count), overwrite=False),
+    )
+    assert imported
+    exported = timed(
+        "export_memory_stream",
+        count,
+        lambda: memory.export_memory_stream(io.BytesIO()),
+    )
+    assert exported == count
+
+    if legacy:
+        legacy_memory = new_memory(f"bench-legacy-{count}")
+        timed(
+            "legacy import",
+            count,
+            lambda: legacy_import_frames(legacy_memory, make_frames(count)),
+        )
+        timed("legacy export", count, lambda: legacy_export_memory(legacy_memory))
+
+
+def main() -> None:
+    """Run the benchmark for each frame count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--no-legacy", action="store_true")
+    args = parser.parse_args()
+
+    FastAPI.enable()
+    JaseciContext.create(None)
+
+    for count in args.frames:
+        run(count, legacy=not args.no_legacy)
+
+
+if __name__ == "__main__":
+    main()
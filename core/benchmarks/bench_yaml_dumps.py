@@ -0,0 +1,110 @@
+"""Benchmark yaml_dumps and yaml_loads on a memory export against the pure Python dumper and loader.
+
+The export is shaped like the frames and interactions written by a memory export and is
+grown to the requested size, 50 MB by default.
+
+Usage: python benchmarks/bench_yaml_dumps.py [--megabytes N]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+from jivas.agent.modules.data.serialization import (
+    LongStringDumper,
+    LongStringRepresenter,
+    yaml_dumps,
+    yaml_loads,
+)
+
+
+class PyLongStringDumper(LongStringRepresenter, yaml.SafeDumper):
+    """LongStringDumper built on the pure Python SafeDumper."""
+
+    yaml_representers = LongStringDumper.yaml_representers
+    yaml_multi_representers = LongStringDumper.yaml_multi_representers
+
+
+def make_interaction(i: int) -> dict:
+    """Build an exported interaction with a long response and retrieved context."""
+    return {
+        "id": f"interaction-{i}",
+        "utterance": f"question {i} about the knowledge base",
+        "tokens": 850 + i,
+        "trail": ["IntentInteractAction", "RetrievalInteractAction", "PersonaAction"],
+        "directives": ["Use CONTEXT as your knowledge base. " * 8],
+        "response": {
+            "session_id": "session",
+            "message_type": "TEXT",
+            "message": {"content": f"answer {i}\n" + "the answer goes on. " * 40},
+        },
+        "data": {
+            "RetrievalInteractAction": {
+                "query": f"question {i}",
+                "context": [
+                    {"content": "retrieved passage " * 30, "metadata": {"page": j}}
+                    for j in range(3)
+                ],
+            }
+        },
+    }
+
+
+def make_memory_export(megabytes: float) -> dict:
+    """Build a memory export of frames of 10 interactions, of about megabytes of YAML."""
+    frame_size = len(
+        yaml_dumps({"frames": [{"interactions": [make_interaction(0)] * 10}]}) or ""
+    )
+    frames: List[dict] = []
+    for f in range(max(1, int(megabytes * 1024 * 1024 / frame_size))):
+        frames.append(
+            {
+                "id": f"frame-{f}",
+                "session_id": f"session-{f}",
+                "variables": {"user": {"name": "Ada", "plan": "pro"}},
+                "interactions": [make_interaction(f * 10 + i) for i in range(10)],
+            }
+        )
+    return {"agent_id": "agent", "frames": frames}
+
+
+def timed(name: str, case: Callable[[], Any]) -> Any:
+    """Run case once, printing the time it took; returns its result."""
+    start = time.perf_counter()
+    result = case()
+    print(f"{name:<24} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main() -> None:
+    """Run the benchmark and print the time of each dump and load."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=50)
+    args = parser.parse_args()
+
+    if not issubclass(LongStringDumper, yaml.CSafeDumper):
+        print("PyYAML is built without libyaml; both runs use the pure Python dumper.")
+
+    memory = make_memory_export(args.megabytes)
+    options: Dict[str, Any] = {
+        "allow_unicode": True,
+        "default_flow_style": False,
+        "sort_keys": False,
+    }
+
+    expected = timed(
+        "pure Python dump",
+        lambda: yaml.dump(memory, Dumper=PyLongStringDumper, **options),
+    )
+    output = timed("yaml_dumps", lambda: yaml_dumps(memory))
+    assert output == expected
+    print(f"{'output size':<24} {len(output) / 1024 / 1024:8.1f} MB")
+
+    loaded = timed("yaml.safe_load", lambda: yaml.safe_load(output))
+    assert timed("yaml_loads", lambda: yaml_loads(output)) == loaded
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@
 import logging
 import os
 import shutil
-from typing import Dict, List
+from dataclasses import MISSING, fields
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..text.formatting import normalize_text
 
@@ -43,8 +44,45 @@ def clean_action(namespace_package_name: str) -> bool:
         return False
 
 
+_archetype_contexts: Dict[type, Tuple[Dict[str, Any], Dict[str, str]]] = {}
+
+
+def get_archetype_context(cls: type) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Returns the default values of the fields of a dataclass archetype, and the
+    normalized forms of its string defaults, as used by clean_context.
+
+    Both are computed once per class, calling each default_factory once, and are
+    shared between callers, who must not modify them.
+
+    Args:
+        cls: Dataclass archetype, e.g. a node class
+
+    Returns:
+        Tuple of (archetype context, normalized string defaults)
+    """
+    if (context := _archetype_contexts.get(cls)) is None:
+        archetype_context: Dict[str, Any] = {}
+        for f in fields(cls):
+            if f.default is not MISSING:
+                archetype_context[f.name] = f.default
+            elif f.default_factory is not MISSING:
+                archetype_context[f.name] = f.default_factory()
+
+        normalized_context = {
+            key: normalize_text(value)
+            for key, value in archetype_context.items()
+            if isinstance(value, str)
+        }
+        context = _archetype_contexts[cls] = (archetype_context, normalized_context)
+    return context
+
+
 def clean_context(
-    node_context: Dict, archetype_context: Dict, ignore_keys: List[str]
+    node_context: Dict,
+    archetype_context: Dict,
+    ignore_keys: List[str],
+    normalized_context: Optional[Dict[str, str]] = None,
 ) -> Dict:
     """
     Cleans and sanitizes node_context by:
@@ -56,16 +94,27 @@ def clean_context(
         node_context: Existing snapshot of spawned node
         archetype_context: Original archetype context variables
         ignore_keys: List of keys to remove
+        normalized_context: Normalized string values of archetype_context, if already known
 
     Returns:
         Sanitized dictionary
     """
+    if normalized_context is None:
+        normalized_context = {}
+
     # Check for matching keys and remove them if they match
     for key in list(archetype_context.keys()):
         if key in node_context:
             if isinstance(node_context[key], str):
+                if node_context[key] == archetype_context[key]:
+                    # identical strings normalize alike
+                    del node_context[key]
+                    continue
+
                 str1 = normalize_text(node_context[key])
-                str2 = normalize_text(archetype_context[key])
+                str2 = normalized_context.get(key)
+                if str2 is None:
+                    str2 = normalize_text(archetype_context[key])
 
                 if str1 == str2:
                     del node_context[key]
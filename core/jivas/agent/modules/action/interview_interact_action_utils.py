@@ -1,13 +1,38 @@
 """Module for parsing and evaluating conditional expressions."""
 
-import contextlib
 import logging
 import re
-from typing import Any, Dict, List, Optional, Sequence, Union
+from functools import lru_cache
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 # logging.basicConfig(level=logging.DEBUG) # Uncomment for detailed parsing logs
 
+# condition patterns, tried in order, with the operator each one parses to
+_CONDITION_PATTERNS = [
+    (op_key, operator_symbol, re.compile(pattern))
+    for op_key, operator_symbol, pattern in (
+        ("range", "[..]", r"^([\w.-]+)\s*:\s*\[\s*([\d.-]+)\s*\.\.\s*([\d.-]+)\s*\]$"),
+        ("not_in_list", "![]", r"^([\w.-]+)\s*:\s*!\[\s*([^\]]*?)\s*\]$"),
+        ("in_list", "[]", r"^([\w.-]+)\s*:\s*\[\s*([^\]]*?)\s*\]$"),
+        ("exact_not_equal", "!=", r"^([\w.-]+)\s*!:=\s*(.+)$"),
+        ("not_equal", "!=", r"^([\w.-]+)\s*!=\s*(.+)$"),
+        ("exact_equal", ":=", r"^([\w.-]+)\s*:=\s*(.+)$"),
+        ("greater_equal", ">=", r"^([\w.-]+)\s*>=\s*([\d.-]+)$"),
+        ("less_equal", "<=", r"^([\w.-]+)\s*<=\s*([\d.-]+)$"),
+        ("greater_than", ">", r"^([\w.-]+)\s*>\s*([\d.-]+)$"),
+        ("less_than", "<", r"^([\w.-]+)\s*<\s*([\d.-]+)$"),
+        ("partial_equal", ":", r"^([\w.-]+)\s*:\s*(.+)$"),
+        ("simple_equal", "=", r"^([\w.-]+)\s*=\s*(.+)$"),
+    )
+]
+_NUMERIC_COMPARISONS = {">": gt, "<": lt, ">=": ge, "<=": le}
+# parentheses and logical operators in conditional expressions
+_EXPRESSION_TOKENS = re.compile(r"\(|\)|&&|\|\|")
+
+Condition = Callable[[Dict[str, Any]], bool]
+
 
 def parse_condition_string(
     condition_str: str,
@@ -23,43 +48,12 @@ def parse_condition_string(
     """
     condition_str = condition_str.strip()
 
-    patterns = {
-        "range": r"^([\w.-]+)\s*:\s*\[\s*([\d.-]+)\s*\.\.\s*([\d.-]+)\s*\]$",
-        "not_in_list": r"^([\w.-]+)\s*:\s*!\[\s*([^\]]*?)\s*\]$",
-        "in_list": r"^([\w.-]+)\s*:\s*\[\s*([^\]]*?)\s*\]$",
-        "exact_not_equal": r"^([\w.-]+)\s*!:=\s*(.+)$",
-        "not_equal": r"^([\w.-]+)\s*!=\s*(.+)$",
-        "exact_equal": r"^([\w.-]+)\s*:=\s*(.+)$",
-        "greater_equal": r"^([\w.-]+)\s*>=\s*([\d.-]+)$",
-        "less_equal": r"^([\w.-]+)\s*<=\s*([\d.-]+)$",
-        "greater_than": r"^([\w.-]+)\s*>\s*([\d.-]+)$",
-        "less_than": r"^([\w.-]+)\s*<\s*([\d.-]+)$",
-        "partial_equal": r"^([\w.-]+)\s*:\s*(.+)$",
-        "simple_equal": r"^([\w.-]+)\s*=\s*(.+)$",
-    }
-
-    op_mapping = {
-        "range": "[..]",
-        "not_in_list": "![]",
-        "in_list": "[]",
-        "exact_not_equal": "!=",
-        "not_equal": "!=",
-        "exact_equal": ":=",
-        "greater_equal": ">=",
-        "less_equal": "<=",
-        "greater_than": ">",
-        "less_than": "<",
-        "partial_equal": ":",
-        "simple_equal": "=",
-    }
-
-    for op_key, pattern in patterns.items():
-        match = re.fullmatch(pattern, condition_str)
+    for op_key, operator_symbol, pattern in _CONDITION_PATTERNS:
+        match = pattern.fullmatch(condition_str)
         if not match:
             continue
 
         field = match.group(1).strip()
-        operator_symbol = op_mapping[op_key]
 
         if op_key == "range":
             val1 = match.group(2).strip()
@@ -89,117 +83,305 @@ def parse_condition_string(
     return None
 
 
-def evaluate_single_condition(
-    parsed_condition: Sequence[Union[str, bool, List[str]]], responses: Dict[str, Any]
-) -> bool:
-    """Evaluate a single parsed condition against response data.
+def compile_condition(
+    parsed_condition: Sequence[Union[str, bool, List[str]]],
+) -> Condition:
+    """Compile a single parsed condition into a function evaluating it against response data.
+
+    Numeric and list values are converted once, here, rather than on every evaluation.
 
     Args:
         parsed_condition: The parsed condition as [field, operator, value] where value can be str, bool, or List[str].
-        responses: Dictionary of response data to evaluate against.
 
     Returns:
-        bool: The result of the evaluation.
+        A function taking the dictionary of response data and returning the result of the evaluation.
     """
     if not parsed_condition or len(parsed_condition) < 3:
         logger.warning(f"Invalid parsed condition structure: {parsed_condition}")
-        return False
+        return _constant(False)
 
     field_name = parsed_condition[0]
-    operator = parsed_condition[1]
+    operator: Any = parsed_condition[1]
     expected_value = parsed_condition[2]
 
     if not isinstance(field_name, str):
         logger.warning(f"Field name is not a string: {field_name}")
-        return False
+        return _constant(False)
+
+    compare: Optional[Callable[[str], bool]] = None
+
+    if operator in (">", "<", ">=", "<="):
+        if not isinstance(expected_value, str):
+            logger.warning(f"Expected value is not a string: {expected_value}")
+            return _field_condition(field_name, operator, expected_value, _never)
+        expected_num = _to_float(expected_value)
+        if expected_num is not None:
+            compare_numbers = _NUMERIC_COMPARISONS[operator]
+            compare = lambda actual: compare_numbers(  # noqa: E731
+                float(actual), expected_num
+            )
+
+    elif operator == "[..]":
+        if not isinstance(expected_value, list) or len(expected_value) != 2:
+            logger.warning(
+                f"Expected value for range is not a list of two: {expected_value}"
+            )
+            return _field_condition(field_name, operator, expected_value, _never)
+        min_val = _to_float(expected_value[0])
+        max_val = _to_float(expected_value[1])
+        if min_val is not None and max_val is not None:
+            compare = lambda actual: min_val <= float(actual) <= max_val  # noqa: E731
+
+    elif operator in ("=", ":=", "!="):
+        equal = _compile_equal(expected_value)
+        compare = equal if operator != "!=" else lambda actual: not equal(actual)
+
+    elif operator == ":":
+        expected_lower = str(expected_value).lower()
+        compare = lambda actual: expected_lower in actual.lower()  # noqa: E731
+
+    elif operator in ("[]", "![]"):
+        if not isinstance(expected_value, list):
+            return _field_condition(
+                field_name, operator, expected_value, lambda actual: operator == "![]"
+            )
+        values = frozenset(str(v) for v in expected_value)
+        if operator == "[]":
+            compare = values.__contains__
+        else:
+            compare = lambda actual: actual not in values  # noqa: E731
+
+    else:
+        return _field_condition(field_name, operator, expected_value, None)
+
+    if compare is None:
+        # the expected value is not a number; every comparison fails
+        compare = _raise_value_error
+    return _field_condition(field_name, operator, expected_value, compare)
+
+
+def _field_condition(
+    field_name: str,
+    operator: Any,
+    expected_value: Any,
+    compare: Optional[Callable[[str], bool]],
+) -> Condition:
+    """Wrap a comparison of the string value of a response field into a condition.
 
-    actual_value_from_responses = responses.get(field_name)
-    if actual_value_from_responses is None:
-        if operator == "!=":
-            return True
-        if operator == "![]":
-            return True
-        logger.warning(f"Field '{field_name}' not found in responses.")
-        return False
+    Missing fields satisfy only != and ![] conditions. A compare of None stands for an
+    unhandled operator or expected value; such conditions are never satisfied.
+    """
+    missing_result = operator in ("!=", "![]")
+
+    def condition(responses: Dict[str, Any]) -> bool:
+        actual_value_from_responses = responses.get(field_name)
+        if actual_value_from_responses is None:
+            if not missing_result:
+                logger.warning(f"Field '{field_name}' not found in responses.")
+            return missing_result
+
+        if compare is None:
+            logger.warning(f"Unhandled operator '{operator}' for field '{field_name}'")
+            return False
+
+        actual_value_str = str(actual_value_from_responses)
+        try:
+            return compare(actual_value_str)
+        except ValueError as e:
+            logger.warning(
+                f"Type error during evaluation: field='{field_name}', op='{operator}', "
+                f"actual='{actual_value_str}', expected='{expected_value}'. Error: {e}"
+            )
+            return False
+
+    return condition
 
-    actual_value_str = str(actual_value_from_responses)
 
+def _compile_equal(expected_value: Any) -> Callable[[str], bool]:
+    """Return a function testing whether a response value equals expected_value.
+
+    Booleans compare case-insensitively and numbers numerically, falling back to
+    comparing strings when the response value is not a number.
+    """
+    if isinstance(expected_value, bool):
+        expected_lower = str(expected_value).lower()
+        return lambda actual: actual.lower() == expected_lower
+
+    expected_str = str(expected_value)
+    expected_num = None
+    if (
+        isinstance(expected_value, str)
+        and expected_value.replace(".", "", 1).lstrip("-").isdigit()
+    ):
+        expected_num = _to_float(expected_value)
+    if expected_num is None:
+        return expected_str.__eq__
+
+    def equal(actual: str) -> bool:
+        try:
+            return float(actual) == expected_num
+        except ValueError:
+            return actual == expected_str
+
+    return equal
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Return value as a float, or None if it is not a number."""
     try:
-        if operator in (">", "<", ">=", "<="):
-            if not isinstance(expected_value, str):
-                logger.warning(f"Expected value is not a string: {expected_value}")
-                return False
-            actual_val_num = float(actual_value_str)
-            expected_val_num = float(expected_value)
-            if operator == ">":
-                return actual_val_num > expected_val_num
-            if operator == "<":
-                return actual_val_num < expected_val_num
-            if operator == ">=":
-                return actual_val_num >= expected_val_num
-            if operator == "<=":
-                return actual_val_num <= expected_val_num
-
-        if operator == "[..]":
-            if not isinstance(expected_value, list) or len(expected_value) != 2:
-                logger.warning(
-                    f"Expected value for range is not a list of two: {expected_value}"
-                )
-                return False
-            actual_val_num = float(actual_value_str)
-            min_val = float(expected_value[0])
-            max_val = float(expected_value[1])
-            return min_val <= actual_val_num <= max_val
-
-        if operator in ("=", ":="):
-            if isinstance(expected_value, bool):
-                return actual_value_str.lower() == str(expected_value).lower()
-            with contextlib.suppress(ValueError):
-                if (
-                    isinstance(expected_value, str)
-                    and expected_value.replace(".", "", 1).lstrip("-").isdigit()
-                ):
-                    return float(actual_value_str) == float(expected_value)
-            return actual_value_str == str(expected_value)
-
-        if operator == "!=":
-            if isinstance(expected_value, bool):
-                return actual_value_str.lower() != str(expected_value).lower()
-            with contextlib.suppress(ValueError):
-                if (
-                    isinstance(expected_value, str)
-                    and expected_value.replace(".", "", 1).lstrip("-").isdigit()
-                ):
-                    return float(actual_value_str) != float(expected_value)
-            return actual_value_str != str(expected_value)
-
-        if operator == ":":
-            return str(expected_value).lower() in actual_value_str.lower()
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
-        if operator == "[]":
-            if not isinstance(expected_value, list):
-                return False
-            return actual_value_str in [str(v) for v in expected_value]
-
-        if operator == "![]":
-            if not isinstance(expected_value, list):
-                return True
-            return actual_value_str not in [str(v) for v in expected_value]
-
-    except ValueError as e:
-        logger.warning(
-            f"Type error during evaluation: field='{field_name}', op='{operator}', "
-            f"actual='{actual_value_str}', expected='{expected_value}'. Error: {e}"
-        )
-        return False
-
-    logger.warning(f"Unhandled operator '{operator}' for field '{field_name}'")
+
+def _raise_value_error(actual: str) -> bool:
+    raise ValueError("expected value is not a number")
+
+
+def _never(actual: str) -> bool:
     return False
 
 
+def _constant(result: bool) -> Condition:
+    return lambda responses: result
+
+
+def evaluate_single_condition(
+    parsed_condition: Sequence[Union[str, bool, List[str]]], responses: Dict[str, Any]
+) -> bool:
+    """Evaluate a single parsed condition against response data.
+
+    Args:
+        parsed_condition: The parsed condition as [field, operator, value] where value can be str, bool, or List[str].
+        responses: Dictionary of response data to evaluate against.
+
+    Returns:
+        bool: The result of the evaluation.
+    """
+    return compile_condition(parsed_condition)(responses)
+
+
+@lru_cache(maxsize=1024)
+def compile_conditional_expression(expression: str) -> Condition:
+    """Compile a conditional expression with AND, OR, and parentheses into a function.
+
+    Expressions are compiled once and cached, so that evaluating them again only runs the
+    compiled conditions. A ')' with no '(' open is part of the condition it appears in.
+
+    Args:
+        expression: The conditional expression to compile.
+
+    Returns:
+        A function taking the dictionary of response data and returning the result of the
+        evaluation. Expressions with mismatched parentheses always evaluate to False.
+    """
+    # tokens are (kind, text) pairs; kind is the operator or parenthesis, or "condition"
+    tokens: List[Tuple[str, str]] = []
+    text = ""
+    depth = 0
+    position = 0
+    for match in _EXPRESSION_TOKENS.finditer(expression):
+        token = match.group()
+        text += expression[position : match.start()]
+        position = match.end()
+        if token == ")" and not depth:
+            text += token
+            continue
+        depth += {"(": 1, ")": -1}.get(token, 0)
+        if text.strip():
+            tokens.append(("condition", text.strip()))
+        text = ""
+        tokens.append((token, token))
+    text += expression[position:]
+    if text.strip():
+        tokens.append(("condition", text.strip()))
+
+    if depth:
+        logger.error(f"Mismatched parentheses in: {expression}")
+        return _constant(False)
+
+    return _parse_or(tokens, 0)[0]
+
+
+def _parse_or(tokens: List[Tuple[str, str]], index: int) -> Tuple[Condition, int]:
+    """Parse conditions joined by ||, from tokens[index]; returns the condition and end index."""
+    operands = []
+    while True:
+        operand, index = _parse_and(tokens, index)
+        operands.append(operand)
+        if index == len(tokens) or tokens[index][0] != "||":
+            break
+        index += 1
+
+    if len(operands) == 1:
+        return operands[0], index
+
+    def any_condition(responses: Dict[str, Any]) -> bool:
+        return any(operand(responses) for operand in operands)
+
+    return any_condition, index
+
+
+def _parse_and(tokens: List[Tuple[str, str]], index: int) -> Tuple[Condition, int]:
+    """Parse conditions joined by &&, from tokens[index]; returns the condition and end index."""
+    operands = []
+    while True:
+        operand, index = _parse_operand(tokens, index)
+        operands.append(operand)
+        if index == len(tokens) or tokens[index][0] != "&&":
+            break
+        index += 1
+
+    if len(operands) == 1:
+        return operands[0], index
+
+    def all_condition(responses: Dict[str, Any]) -> bool:
+        return all(operand(responses) for operand in operands)
+
+    return all_condition, index
+
+
+def _parse_operand(tokens: List[Tuple[str, str]], index: int) -> Tuple[Condition, int]:
+    """Parse a parenthesized expression or a single condition, from tokens[index].
+
+    Conditions run together with parenthesized expressions, as in "(a = 1) b", are invalid.
+    """
+    start = index
+    operands = []
+    while index < len(tokens) and tokens[index][0] in ("(", "condition"):
+        operand, index = _parse_primary(tokens, index)
+        operands.append(operand)
+
+    if not operands:
+        # empty conditions are satisfied
+        return _constant(True), index
+    if len(operands) > 1:
+        part = " ".join(text for _, text in tokens[start:index])
+        logger.warning(f"Could not parse condition part: '{part}'")
+        return _constant(False), index
+    return operands[0], index
+
+
+def _parse_primary(tokens: List[Tuple[str, str]], index: int) -> Tuple[Condition, int]:
+    """Parse a parenthesized expression or a condition string at tokens[index]."""
+    kind, condition_str = tokens[index]
+    if kind == "(":
+        condition, index = _parse_or(tokens, index + 1)
+        # parentheses are balanced, so the expression ends at a ')'
+        return condition, index + 1
+
+    if condition_str in ("true", "false"):
+        return _constant(condition_str == "true"), index + 1
+    if (parsed := parse_condition_string(condition_str)) is None:
+        return _constant(False), index + 1
+    return compile_condition(parsed), index + 1
+
+
 def evaluate_conditional_expression(expression: str, responses: Dict[str, Any]) -> bool:
     """Evaluate a conditional expression with AND, OR, and parentheses.
 
+    The expression is compiled by compile_conditional_expression on first use.
+
     Args:
         expression: The conditional expression to evaluate.
         responses: Dictionary of response data to evaluate against.
@@ -207,65 +389,4 @@ def evaluate_conditional_expression(expression: str, responses: Dict[str, Any])
     Returns:
         bool: The result of the evaluation.
     """
-    expression = expression.strip()
-    if not expression:
-        return True
-
-    # Check if this is just a boolean literal (from parentheses processing)
-    if expression == "true":
-        return True
-    if expression == "false":
-        return False
-
-    # Check if this is a simple condition (no operators)
-    if "&&" not in expression and "||" not in expression and "(" not in expression:
-        # Simple condition - parse and evaluate directly
-        parsed = parse_condition_string(expression)
-        if parsed is None:
-            return False
-        return evaluate_single_condition(parsed, responses)
-
-    # Handle parentheses first
-    while "(" in expression:
-        # Find the innermost parentheses
-        start = -1
-        for i, char in enumerate(expression):
-            if char == "(":
-                start = i
-            elif char == ")" and start != -1:
-                # Found a matching closing paren
-                inner_expr = expression[start + 1 : i]
-                inner_result = evaluate_conditional_expression(inner_expr, responses)
-                # Replace the parenthesized expression with its result
-                expression = (
-                    expression[:start] + str(inner_result).lower() + expression[i + 1 :]
-                )
-                break
-        else:
-            # No matching closing paren found
-            logger.error(f"Mismatched parentheses in: {expression}")
-            return False
-
-    # Now handle OR operations (lower precedence)
-    if "||" in expression:
-        or_parts = expression.split("||")
-        return any(
-            evaluate_conditional_expression(part.strip(), responses)
-            for part in or_parts
-        )
-
-    # Handle AND operations (higher precedence)
-    if "&&" in expression:
-        and_parts = expression.split("&&")
-        for part in and_parts:
-            part = part.strip()
-            # It's a condition that needs to be evaluated (boolean literals handled at top)
-            if not evaluate_conditional_expression(part, responses):
-                return False
-        return True
-
-    # If we get here, it should be a simple condition
-    parsed = parse_condition_string(expression)
-    if parsed is None:
-        return False
-    return evaluate_single_condition(parsed, responses)
+    return compile_conditional_expression(expression)(responses)
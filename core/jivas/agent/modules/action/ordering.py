@@ -1,11 +1,17 @@
 """Ordering utils package"""
 
+import heapq
 import logging
-from collections import defaultdict, deque
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# virtual nodes standing for "before: all" and "after: all" constraints in the dependency graph
+_BEFORE_ALL = "<before: all>"
+_AFTER_ALL = "<after: all>"
+_VIRTUAL_NODES = (_BEFORE_ALL, _AFTER_ALL)
+
 
 def order_interact_actions(
     actions_data: List[Dict[str, Any]],
@@ -73,29 +79,24 @@ def order_interact_actions(
                 graph[action_name].append(normalized_before)
                 in_degree[normalized_before] += 1
 
-    # Handle global constraints
-    # Process before:all
-    before_all = [
-        name
-        for name, a in action_lookup.items()
-        if a["context"]["_package"]["config"].get("order", {}).get("before") == "all"
-    ]
-    for name in before_all:
-        for other in action_lookup:
-            if other != name and other not in before_all:
-                graph[name].append(other)
-                in_degree[other] += 1
-
-    # Process after:all
-    after_all = [
-        name
-        for name, a in action_lookup.items()
-        if a["context"]["_package"]["config"].get("order", {}).get("after") == "all"
-    ]
-    for name in after_all:
-        for other in action_lookup:
-            if other != name and other not in after_all:
-                graph[other].append(name)
+    # Handle global constraints through virtual nodes, rather than an edge between every pair:
+    # every before:all action precedes BEFORE_ALL, which precedes every other action,
+    # and every other action precedes AFTER_ALL, which precedes every after:all action
+    for virtual_node, constraint in ((_BEFORE_ALL, "before"), (_AFTER_ALL, "after")):
+        constrained = {
+            name
+            for name, a in action_lookup.items()
+            if a["context"]["_package"]["config"].get("order", {}).get(constraint)
+            == "all"
+        }
+        if not constrained:
+            continue
+        for name in action_lookup:
+            if (name in constrained) == (constraint == "before"):
+                graph[name].append(virtual_node)
+                in_degree[virtual_node] += 1
+            else:
+                graph[virtual_node].append(name)
                 in_degree[name] += 1
 
     # Add ordering constraints for fixed-weight actions
@@ -118,39 +119,37 @@ def order_interact_actions(
         graph[a1_name].append(a2_name)
         in_degree[a2_name] += 1
 
-    # Kahn's algorithm with adjusted sorting key
-    queue = deque(
-        sorted(
-            [n for n in action_lookup if in_degree[n] == 0],
-            key=lambda x: (
-                action_weights[x] if has_constraint[x] else float("inf"),
-                original_order[x],
-            ),
+    # Kahn's algorithm; ready actions are taken by weight (when constrained) and original
+    # order, while virtual nodes are passed through as soon as they are ready
+    def priority(name: str) -> Tuple[float, int, str]:
+        if name in _VIRTUAL_NODES:
+            return (float("-inf"), -1, name)
+        return (
+            action_weights[name] if has_constraint[name] else float("inf"),
+            original_order[name],
+            name,
         )
-    )
+
+    nodes = [*action_lookup, *_VIRTUAL_NODES]
+    ready = [priority(n) for n in nodes if in_degree[n] == 0]
+    heapq.heapify(ready)
 
     sorted_names = []
-    while queue:
-        current = queue.popleft()
-        sorted_names.append(current)
+    while ready:
+        current = heapq.heappop(ready)[2]
+        if current not in _VIRTUAL_NODES:
+            sorted_names.append(current)
         for neighbor in graph[current]:
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
-                queue.append(neighbor)
-        # Re-sort remaining nodes considering updated dependencies and constraints
-        queue = deque(
-            sorted(
-                queue,
-                key=lambda x: (
-                    action_weights[x] if has_constraint[x] else float("inf"),
-                    original_order[x],
-                ),
-            )
-        )
+                heapq.heappush(ready, priority(neighbor))
 
     # Validate dependencies
     if len(sorted_names) != len(interact_actions):
-        raise ValueError("Circular dependency detected in interact actions")
+        cycle = _find_cycle(graph, [n for n in nodes if in_degree[n] > 0])
+        raise ValueError(
+            f"Circular dependency detected in interact actions: {' -> '.join(cycle)}"
+        )
 
     # Rebuild final ordered list
     ordered = [action_lookup[n] for n in sorted_names] + other_actions
@@ -163,3 +162,31 @@ def order_interact_actions(
                 action["context"]["weight"] = idx
 
     return ordered
+
+
+def _find_cycle(graph: Dict[str, List[str]], unsorted: List[str]) -> List[str]:
+    """Return the actions on a dependency cycle among the unsorted nodes, first one repeated.
+
+    The unsorted nodes are given in their original order. Each has an unsorted predecessor,
+    so walking back through predecessors from any of them must return to a node visited.
+    """
+    predecessors: Dict[str, str] = {}
+    for name in unsorted:
+        for neighbor in graph[name]:
+            predecessors.setdefault(neighbor, name)
+
+    path: List[str] = []
+    visited: Dict[str, int] = {}
+    current = unsorted[0]
+    while current not in visited:
+        visited[current] = len(path)
+        path.append(current)
+        current = predecessors[current]
+
+    cycle = [
+        name for name in path[visited[current] :][::-1] if name not in _VIRTUAL_NODES
+    ]
+    # start from the action which comes first in the original order
+    start = min(range(len(cycle)), key=lambda i: unsorted.index(cycle[i]))
+    cycle = cycle[start:] + cycle[:start]
+    return [*cycle, cycle[0]]
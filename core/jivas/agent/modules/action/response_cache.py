@@ -0,0 +1,211 @@
+"""Semantic response cache utils package"""
+
+import threading
+import time
+from typing import Any, Iterable, List, Optional
+from uuid import uuid4
+
+import numpy as np
+
+"""
+# answer near-duplicate utterances of a session from the cache
+cache = get_response_cache()
+if (entry := cache.lookup(agent_id, scope, vector, threshold=0.95, ttl=86400)) is None:
+    response = generate(utterance)
+    cache.store(agent_id, scope, vector, utterance, response, sources=source_ids)
+
+# drop responses grounded on an updated document, in every process
+cache.invalidate(agent_id, [document_id])
+"""
+
+
+class ResponseCache:
+    """Caches responses by the embedding of the query which produced them.
+
+    Entries are kept in a collection shared across processes, so stores and
+    invalidations made by one worker are seen by all of them. Each entry holds the agent
+    id and scope (e.g. a session) it was cached for, the query text and its embedding, the
+    response, the ids of the documents the response was grounded on and the tokens spent
+    producing it. A lookup is a hit when the nearest query cached in the same scope is at
+    least threshold similar (cosine) to the new one and has not expired. Entries are
+    invalidated when any of their source documents changes.
+    """
+
+    def __init__(self, collection: Any) -> None:
+        """Initialize the cache over a pymongo-compatible collection."""
+        self.collection = collection
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Zero the hit, miss, store, invalidation and saved token counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.saved_tokens = 0
+            self.stores = 0
+            self.invalidations = 0
+
+    def lookup(
+        self,
+        agent_id: str,
+        scope: str,
+        vector: List[float],
+        threshold: float = 0.95,
+        ttl: int = 0,
+    ) -> Optional[dict]:
+        """Return the entry cached for the query nearest to vector, or None on a miss.
+
+        Args:
+            agent_id: Id of the agent the response belongs to.
+            scope: Scope the response was cached in; only entries of this scope match.
+            vector: Embedding of the query.
+            threshold: Minimum cosine similarity between the queries.
+            ttl: Maximum age of the entry in seconds; 0 never expires entries.
+        """
+        query: dict = {"agent_id": agent_id, "scope": scope}
+        if ttl:
+            query["created"] = {"$gte": time.time() - ttl}
+
+        entry = None
+        candidates = list(self.collection.find(query, projection={"vec": True}))
+        if candidates:
+            matrix = np.stack(
+                [np.frombuffer(doc["vec"], dtype=np.float32) for doc in candidates]
+            )
+            query_vector = np.asarray(vector, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_vector)
+            similarities = matrix @ query_vector / np.where(norms == 0, 1.0, norms)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= threshold and (
+                doc := self.collection.find_one(
+                    {"_id": candidates[best]["_id"]}, projection={"vec": False}
+                )
+            ):
+                entry = {
+                    "id": doc["_id"],
+                    "query": doc["query"],
+                    "similarity": float(similarities[best]),
+                    "response": doc["response"],
+                    "sources": doc.get("sources", []),
+                    "tokens": doc.get("tokens", 0),
+                    "created": doc.get("created", 0),
+                }
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.saved_tokens += int(entry.get("tokens", 0))
+        return entry
+
+    def store(
+        self,
+        agent_id: str,
+        scope: str,
+        vector: List[float],
+        query: str,
+        response: Any,
+        sources: Iterable[str] = (),
+        tokens: int = 0,
+        max_entries: int = 0,
+        ttl: int = 0,
+    ) -> str:
+        """Cache a response for a query in scope; returns the id of the entry.
+
+        Expired entries of the scope, and its oldest entries beyond max_entries, are
+        removed. A max_entries or ttl of 0 disables that limit.
+        """
+        entry_id = uuid4().hex
+        now = time.time()
+        self.collection.insert_one(
+            {
+                "_id": entry_id,
+                "agent_id": agent_id,
+                "scope": scope,
+                "vec": np.asarray(vector, dtype=np.float32).tobytes(),
+                "query": query,
+                "response": response,
+                "sources": sorted({str(source) for source in sources}),
+                "tokens": tokens,
+                "created": now,
+            }
+        )
+        with self._lock:
+            self.stores += 1
+
+        if ttl:
+            self.collection.delete_many(
+                {"agent_id": agent_id, "scope": scope, "created": {"$lt": now - ttl}}
+            )
+        if max_entries:
+            self.evict(agent_id, scope, max_entries)
+        return entry_id
+
+    def evict(self, agent_id: str, scope: str, max_entries: int) -> int:
+        """Remove the oldest entries of scope beyond max_entries; returns the number removed."""
+        entries = list(
+            self.collection.find(
+                {"agent_id": agent_id, "scope": scope}, projection={"created": True}
+            )
+        )
+        if len(entries) <= max_entries:
+            return 0
+        entries.sort(key=lambda doc: doc.get("created", 0), reverse=True)
+        stale = [doc["_id"] for doc in entries[max_entries:]]
+        self.collection.delete_many({"_id": {"$in": stale}})
+        return len(stale)
+
+    def invalidate(
+        self, agent_id: str, source_ids: Optional[Iterable[str]] = None
+    ) -> int:
+        """Remove the agent's entries grounded on any of source_ids, or all if None.
+
+        Returns the number of entries removed.
+        """
+        query: dict = {"agent_id": agent_id}
+        if source_ids is not None:
+            if not (changed := sorted({str(source_id) for source_id in source_ids})):
+                return 0
+            query["sources"] = {"$in": changed}
+
+        removed = self.collection.delete_many(query).deleted_count
+        with self._lock:
+            self.invalidations += removed
+        return removed
+
+    def stats(self, agent_id: str) -> dict:
+        """Return the agent's cache size with this process's counters and hit ratio."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            counters = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "saved_tokens": self.saved_tokens,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+            }
+        return {
+            "entries": self.collection.count_documents({"agent_id": agent_id}),
+            **counters,
+        }
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, stored in the response_cache collection."""
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            from jac_cloud.core.archetype import NodeAnchor
+
+            _default_cache = ResponseCache(
+                NodeAnchor.Collection.get_collection("response_cache")
+            )
+        return _default_cache
@@ -0,0 +1,53 @@
+"""Retrieval utils package"""
+
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+
+def document_key(doc: Document) -> Any:
+    """Return the key identifying a document across result sets: its id, or its content."""
+    return doc.id or doc.metadata.get("id") or doc.page_content
+
+
+def merge_scored_documents(
+    results: List[Optional[List[Tuple[Document, float]]]],
+    score_threshold: Optional[float] = None,
+    limit: int = 0,
+) -> List[Tuple[Document, float]]:
+    """Merge scored results of several queries into one ranked list.
+
+    Documents returned for more than one query are kept once with their best (lowest)
+    score, documents scoring above score_threshold are dropped and the remainder is
+    ordered by score, keeping at most limit documents (0 keeps all).
+    """
+    best: Dict[Any, Tuple[Document, float]] = {}
+    for result in results:
+        for doc, score in result or []:
+            if score_threshold is not None and score > score_threshold:
+                continue
+            key = document_key(doc)
+            if key not in best or score < best[key][1]:
+                best[key] = (doc, score)
+
+    merged = sorted(best.values(), key=lambda item: item[1])
+    return merged[:limit] if limit else merged
+
+
+def merge_documents(
+    results: List[Optional[List[Document]]], limit: int = 0
+) -> List[Document]:
+    """Merge ranked results of several queries by interleaving them, dropping duplicates.
+
+    Interleaving keeps the top documents of every query ahead of lower ranked ones,
+    preserving the diversity of per-query MMR results. At most limit documents are kept (0 keeps all).
+    """
+    merged: Dict[Any, Document] = {}
+    for rank in zip_longest(*[result or [] for result in results]):
+        for doc in rank:
+            if doc is not None:
+                merged.setdefault(document_key(doc), doc)
+
+    documents = list(merged.values())
+    return documents[:limit] if limit else documents
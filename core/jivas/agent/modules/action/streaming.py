@@ -0,0 +1,176 @@
+"""Token streaming utils package"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, List, Optional
+
+"""
+# a model action streaming its reply sets the token iterator as the message content
+interaction_node.set_text_message(message=model_action_result.get_result())
+
+# interact hands it to the caller as a TokenStream; text pieces arrive as the model produces them
+async for text in TokenStream(chunks):
+    send(text)
+
+# or reads the whole reply for callers which are not streamed to
+text = run_coroutine(TokenStream(chunks).read())
+
+# the model result travels with its chunks and is recorded once the text is known
+stream = TokenStream(keep_result(chunks, model_action_result))
+stream.model_result  # model_action_result
+"""
+
+_DONE = object()
+
+
+def is_token_stream(value: Any) -> bool:
+    """Return True if value is an iterator or async iterator of chunks rather than content."""
+    if isinstance(value, (str, bytes, dict, list, tuple)):
+        return False
+    return hasattr(value, "__anext__") or hasattr(value, "__next__")
+
+
+def chunk_text(chunk: Any) -> str:
+    """Return the text of a streamed chunk: a string, a message chunk or a dict with content."""
+    if isinstance(chunk, str):
+        return chunk
+    if isinstance(chunk, dict):
+        content = chunk.get("content", "")
+    else:
+        content = getattr(chunk, "content", "")
+    if isinstance(content, list):
+        # content blocks, as streamed by some providers
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return content if isinstance(content, str) else str(content or "")
+
+
+def chunk_tokens(chunk: Any) -> int:
+    """Return the tokens reported with a streamed chunk, or 0 if it reports none."""
+    usage = (
+        chunk.get("usage_metadata")
+        if isinstance(chunk, dict)
+        else getattr(chunk, "usage_metadata", None)
+    )
+    if not usage:
+        return 0
+    return int(usage.get("total_tokens") or usage.get("output_tokens") or 0)
+
+
+class ResultStream:
+    """Iterator over the chunks of a streamed reply, keeping the result it belongs to."""
+
+    def __init__(self, source: Any, model_result: Any) -> None:
+        """Initialize over source; model_result is e.g. the ModelActionResult streamed."""
+        self.source = source
+        self.model_result = model_result
+
+    def __iter__(self) -> "ResultStream":
+        """Return the stream itself."""
+        return self
+
+    def __next__(self) -> Any:
+        """Return the next chunk of the source."""
+        return next(self.source)
+
+
+class AsyncResultStream:
+    """Async iterator over the chunks of a streamed reply, keeping the result it belongs to."""
+
+    def __init__(self, source: Any, model_result: Any) -> None:
+        """Initialize over source; model_result is e.g. the ModelActionResult streamed."""
+        self.source = source
+        self.model_result = model_result
+
+    def __aiter__(self) -> "AsyncResultStream":
+        """Return the stream itself."""
+        return self
+
+    async def __anext__(self) -> Any:
+        """Return the next chunk of the source."""
+        return await self.source.__anext__()
+
+
+def keep_result(source: Any, model_result: Any) -> Any:
+    """Return an iterator over the chunks of source which keeps model_result with them.
+
+    The result of a streamed reply can only be recorded once its text has been read;
+    TokenStreams over the returned iterator expose it as model_result for their reader.
+    """
+    if hasattr(source, "__anext__"):
+        return AsyncResultStream(source, model_result)
+    return ResultStream(source, model_result)
+
+
+class TokenStream:
+    """Async iterator over the text of a model's streamed reply.
+
+    Wraps an iterator or async iterator of chunks. Blocking iterators are advanced on a
+    worker thread, so the event loop keeps serving while the model produces tokens.
+    The full text, the tokens reported and the time to the first token are recorded
+    as the stream is consumed. The result kept with the chunks by keep_result, if any,
+    is available as model_result.
+    """
+
+    def __init__(self, source: Any, started: Optional[float] = None) -> None:
+        """Initialize over source; started is the perf_counter time latencies count from."""
+        self.source = source
+        self.model_result = getattr(source, "model_result", None)
+        self.started = time.perf_counter() if started is None else started
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.tokens = 0
+        self.chunks = 0
+        self._parts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        """Return the text streamed so far."""
+        return "".join(self._parts)
+
+    async def _chunks(self) -> AsyncIterator[Any]:
+        """Yield the chunks of the source."""
+        if hasattr(self.source, "__anext__"):
+            async for chunk in self.source:
+                yield chunk
+            return
+        while (chunk := await asyncio.to_thread(next, self.source, _DONE)) is not _DONE:
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        """Yield the text of each chunk which has any."""
+        async for chunk in self._chunks():
+            self.chunks += 1
+            self.tokens += chunk_tokens(chunk)
+            if not (text := chunk_text(chunk)):
+                continue
+            if self.first_token_at is None:
+                self.first_token_at = time.perf_counter()
+            self._parts.append(text)
+            yield text
+        self.finished_at = time.perf_counter()
+
+    async def read(self) -> str:
+        """Consume the rest of the stream and return its full text."""
+        async for _ in self:
+            pass
+        return self.text
+
+    def metrics(self) -> dict:
+        """Return the seconds to the first token and to the end, the chunks and tokens streamed."""
+        return {
+            "time_to_first_token": (
+                self.first_token_at - self.started
+                if self.first_token_at is not None
+                else None
+            ),
+            "total_time": (
+                self.finished_at - self.started
+                if self.finished_at is not None
+                else None
+            ),
+            "chunks": self.chunks,
+            "tokens": self.tokens,
+        }
@@ -0,0 +1,218 @@
+"""Text-to-speech audio cache utils package"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+"""
+# reuse the audio file synthesized for identical text and settings
+key = tts_cache_key("Hello, how can I help?", {"model": "eleven_multilingual_v2", "voice": "Rachel"})
+if (path := cache.lookup(agent_id, key)) is None:
+    path = f"tts/{key}.mp3"
+    save_file(path, synthesize(text))
+    cache.store(agent_id, key, path)
+
+# synthesize in the background, once per key however many requests ask for it
+cache.submit(agent_id, key, lambda: synthesize_and_store(text))
+cache.is_pending(agent_id, key)  # True in any process until the synthesis finishes
+"""
+
+
+def tts_cache_key(text: str, settings: Dict[str, Any]) -> str:
+    """Return the cache key for text spoken with the given synthesis settings."""
+    payload = json.dumps([text, settings], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """Index of synthesized audio files by content, kept in a collection shared across processes.
+
+    Each entry maps an agent id and cache key to the path of the stored audio file, with
+    the time it was created and last used. Pruning removes expired entries and the least
+    recently used ones beyond a maximum, deleting their files. Background syntheses are
+    run on a small thread pool, with one synthesis in flight per key in a process, and are
+    marked pending in the collection so that every process can tell they are under way.
+    """
+
+    def __init__(self, collection: Any, max_workers: int = 4) -> None:
+        """Initialize the cache over a pymongo-compatible collection."""
+        self.collection = collection
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tts"
+        )
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Zero the hit, miss, store and prune counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.stores = 0
+            self.pruned = 0
+
+    def lookup(self, agent_id: str, key: str, ttl: int = 0) -> Optional[str]:
+        """Return the path of the audio cached for key, or None on a miss.
+
+        Args:
+            agent_id: Id of the agent the audio belongs to.
+            key: Cache key from tts_cache_key.
+            ttl: Maximum age of the entry in seconds; 0 never expires entries.
+        """
+        now = time.time()
+        entry = self.collection.find_one_and_update(
+            {"_id": f"{agent_id}:{key}"},
+            {"$set": {"last_used": now}},
+            projection={"path": True, "created": True},
+        )
+        if entry and ttl and now - entry.get("created", 0) > ttl:
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry["path"] if entry else None
+
+    def store(self, agent_id: str, key: str, path: str) -> None:
+        """Record that the audio for key is stored at path."""
+        now = time.time()
+        self.collection.update_one(
+            {"_id": f"{agent_id}:{key}"},
+            {
+                "$set": {
+                    "agent_id": agent_id,
+                    "path": path,
+                    "created": now,
+                    "last_used": now,
+                }
+            },
+            upsert=True,
+        )
+        with self._lock:
+            self.stores += 1
+
+    def prune(
+        self,
+        agent_id: str,
+        delete_file: Callable[[str], Any],
+        max_entries: int = 0,
+        ttl: int = 0,
+    ) -> int:
+        """Remove the agent's expired entries and those beyond max_entries, with their files.
+
+        The least recently used entries are removed first. A max_entries or ttl of 0
+        disables that limit. Returns the number of entries removed.
+        """
+        entries = list(
+            self.collection.find(
+                {"agent_id": agent_id},
+                projection={"path": True, "created": True, "last_used": True},
+            )
+        )
+        now = time.time()
+        expired, live = [], []
+        for entry in entries:
+            if ttl and now - entry.get("created", 0) > ttl:
+                expired.append(entry)
+            else:
+                live.append(entry)
+        if max_entries and len(live) > max_entries:
+            live.sort(key=lambda entry: entry.get("last_used", 0), reverse=True)
+            expired += live[max_entries:]
+        if not expired:
+            return 0
+
+        for entry in expired:
+            try:
+                delete_file(entry["path"])
+            except Exception as e:
+                logger.warning(f"Unable to delete cached audio {entry['path']}: {e}")
+        self.collection.delete_many(
+            {"_id": {"$in": [entry["_id"] for entry in expired]}}
+        )
+
+        with self._lock:
+            self.pruned += len(expired)
+        return len(expired)
+
+    def submit(self, agent_id: str, key: str, synthesize: Callable[[], Any]) -> Future:
+        """Run synthesize in the background, unless a synthesis for key is already in flight.
+
+        A pending marker is written to the collection until the synthesis finishes. The
+        caller's context is copied into the worker, so context-bound state (e.g. the Jac
+        execution context) remains available. Returns the future of the synthesis.
+        """
+        marker_id = f"pending:{agent_id}:{key}"
+        with self._lock:
+            if (future := self._pending.get(marker_id)) is not None:
+                return future
+            self.collection.update_one(
+                {"_id": marker_id}, {"$set": {"started": time.time()}}, upsert=True
+            )
+            future = self._pending[marker_id] = self._executor.submit(
+                copy_context().run, synthesize
+            )
+        future.add_done_callback(lambda done: self._finish(marker_id, done))
+        return future
+
+    def _finish(self, marker_id: str, future: Future) -> None:
+        """Forget a finished synthesis and clear its marker, logging its failure."""
+        with self._lock:
+            if self._pending.get(marker_id) is future:
+                del self._pending[marker_id]
+        try:
+            self.collection.delete_one({"_id": marker_id})
+        except Exception as e:
+            logger.warning(f"Unable to clear pending marker {marker_id}: {e}")
+        if (error := future.exception()) is not None:
+            logger.error(f"Background synthesis failed for {marker_id}: {error}")
+
+    def is_pending(self, agent_id: str, key: str, timeout: int = 300) -> bool:
+        """Return True while a background synthesis for key is in flight in any process.
+
+        Markers older than timeout seconds are ignored, so that a synthesis lost with its
+        process is not reported as pending forever.
+        """
+        marker = self.collection.find_one(
+            {"_id": f"pending:{agent_id}:{key}"}, projection={"started": True}
+        )
+        return bool(marker) and time.time() - marker.get("started", 0) <= timeout
+
+    def stats(self) -> dict:
+        """Return the cache counters, its hit ratio and the syntheses in flight."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "pruned": self.pruned,
+                "pending": len(self._pending),
+            }
+
+
+_default_cache: Optional[TTSCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSCache:
+    """Return the process-wide TTS cache, indexed in the tts_cache collection."""
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            from jac_cloud.core.archetype import NodeAnchor
+
+            _default_cache = TTSCache(NodeAnchor.Collection.get_collection("tts_cache"))
+        return _default_cache
@@ -1,13 +1,50 @@
 """Commit utilities for Jac memory."""
 
+import logging
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any
+
 from jac_cloud.core.archetype import BaseAnchor, BulkWrite
 from jac_cloud.jaseci.datasources import Collection
 from jac_cloud.plugin.jaseci import JacPlugin as Jac
 from jaclang.runtimelib.constructs import Archetype
 
+logger = logging.getLogger(__name__)
+
+"""
+# coalesce all commits issued within a block into batched transactions
+with CommitBuffer(max_ops=1000, max_interval=2.0) as buffer:
+    for item in items:
+        collection ++> Item(**item)
+        commit(collection)
+
+buffer.stats.to_dict()
+
+# or wrap a function so that every call runs inside its own buffer
+@CommitBuffer(max_ops=250)
+def import_items(items: list) -> None:
+    ...
+"""
+
+_active_buffer: ContextVar["CommitBuffer | None"] = ContextVar(
+    "jivas_commit_buffer", default=None
+)
+
 
 def commit(anchor: BaseAnchor | None = None) -> None:
-    """Commit all data from memory to datasource."""
+    """Commit all data from memory to datasource.
+
+    When called with an anchor inside an active CommitBuffer, the write is
+    deferred to the buffer and coalesced with other pending writes.
+    """
+    if anchor and (buffer := _active_buffer.get()) is not None:
+        buffer.add(anchor)
+        return
+
     if anchor:
         if isinstance(anchor, Archetype):
             anchor = anchor.__jac__
@@ -15,9 +52,176 @@ def commit(anchor: BaseAnchor | None = None) -> None:
     else:
         bulk_write = Jac.get_context().mem.get_bulk_write()
 
+    execute_bulk_write(bulk_write)
+
+
+def execute_bulk_write(bulk_write: BulkWrite) -> None:
+    """Execute a prepared BulkWrite within the active session or a new transaction."""
     if bulk_write.has_operations:
         if session := Jac.get_context().mem.__session__:
             bulk_write.execute(session)
         else:
             with Collection.get_session() as session, session.start_transaction():
                 bulk_write.execute(session)
+
+
+@dataclass
+class CommitStats:
+    """Counters collected across the flushes of a CommitBuffer."""
+
+    flushes: int = 0
+    operations: int = 0
+    discarded: int = 0
+    failures: int = 0
+    last_flush_ops: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
+
+    @property
+    def ops_per_flush(self) -> float:
+        """Return the average number of anchors written per flush."""
+        return self.operations / self.flushes if self.flushes else 0.0
+
+    @property
+    def avg_flush_latency(self) -> float:
+        """Return the average flush latency in seconds."""
+        return self.total_flush_latency / self.flushes if self.flushes else 0.0
+
+    def to_dict(self) -> dict:
+        """Return a dictionary representation of the counters."""
+        return {
+            "flushes": self.flushes,
+            "operations": self.operations,
+            "discarded": self.discarded,
+            "failures": self.failures,
+            "ops_per_flush": self.ops_per_flush,
+            "last_flush_ops": self.last_flush_ops,
+            "last_flush_latency": self.last_flush_latency,
+            "avg_flush_latency": self.avg_flush_latency,
+            "max_flush_latency": self.max_flush_latency,
+        }
+
+
+class CommitBuffer(ContextDecorator):
+    """A write-behind unit of work which coalesces anchor commits into batched transactions.
+
+    Anchors passed to commit() while the buffer is active are queued (deduplicated
+    by anchor id) and written together once max_ops anchors are pending, once
+    max_interval seconds have passed since the last flush, or when the buffer exits.
+    Time-based flushes are evaluated as anchors are added, on the calling thread.
+    A max_ops or max_interval of 0 disables that trigger, leaving flushes to the caller.
+
+    If the block raises, pending anchors are discarded rather than flushed, so that
+    the original exception propagates untouched. Transient transaction errors are
+    retried by BulkWrite itself (SESSION_MAX_TRANSACTION_RETRY and
+    SESSION_MAX_COMMIT_RETRY), so flushes are not retried again here.
+    """
+
+    def __init__(
+        self,
+        max_ops: int = 500,
+        max_interval: float = 5.0,
+        stats: CommitStats | None = None,
+    ) -> None:
+        """Initialize the CommitBuffer with its flush policy."""
+        self.max_ops = max_ops
+        self.max_interval = max_interval
+        self.stats = stats if stats is not None else CommitStats()
+        self._pending: dict[Any, BaseAnchor] = {}
+        self._last_flush = time.monotonic()
+        self._lock = RLock()
+        self._token: Token | None = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of anchors awaiting a flush."""
+        return len(self._pending)
+
+    def add(self, anchor: BaseAnchor | Archetype) -> None:
+        """Queue an anchor for writing, flushing if the policy thresholds are met."""
+        if isinstance(anchor, Archetype):
+            anchor = anchor.__jac__
+
+        with self._lock:
+            self._pending[anchor.id] = anchor
+            if (self.max_ops and len(self._pending) >= self.max_ops) or (
+                self.max_interval
+                and time.monotonic() - self._last_flush >= self.max_interval
+            ):
+                self.flush()
+
+    def flush(self) -> int:
+        """Write all pending anchors in a single transaction; returns the number of anchors written."""
+        with self._lock:
+            anchors = list(self._pending.values())
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+
+            if not anchors:
+                return 0
+
+            bulk_write = BulkWrite()
+            for anchor in anchors:
+                anchor.build_query(bulk_write)
+
+            started = time.perf_counter()
+            try:
+                execute_bulk_write(bulk_write)
+            except Exception:
+                self.stats.failures += 1
+                raise
+
+            latency = time.perf_counter() - started
+            self.stats.flushes += 1
+            self.stats.operations += len(anchors)
+            self.stats.last_flush_ops = len(anchors)
+            self.stats.last_flush_latency = latency
+            self.stats.total_flush_latency += latency
+            self.stats.max_flush_latency = max(self.stats.max_flush_latency, latency)
+
+            logger.debug(
+                f"commit buffer flushed {len(anchors)} anchors in {latency * 1000:.1f}ms"
+            )
+            return len(anchors)
+
+    def __enter__(self) -> "CommitBuffer":
+        """Activate the buffer so that commit() calls are deferred to it."""
+        self._token = _active_buffer.set(self)
+        self._last_flush = time.monotonic()
+        return self
+
+    def discard(self) -> int:
+        """Drop all pending anchors without writing them; returns the number dropped."""
+        with self._lock:
+            dropped = len(self._pending)
+            self._pending.clear()
+            self.stats.discarded += dropped
+            return dropped
+
+    def __exit__(self, *exc: object) -> None:
+        """Flush any pending anchors, or discard them if the block raised, and deactivate the buffer."""
+        try:
+            if exc[0] is None:
+                self.flush()
+            elif dropped := self.discard():
+                logger.warning(
+                    f"commit buffer discarded {dropped} pending anchors after {exc[0]}"
+                )
+        finally:
+            if self._token is not None:
+                _active_buffer.reset(self._token)
+                self._token = None
+
+    def _recreate_cm(self) -> "CommitBuffer":
+        """Return a fresh buffer per decorated call, sharing this buffer's policy and counters."""
+        return CommitBuffer(
+            max_ops=self.max_ops,
+            max_interval=self.max_interval,
+            stats=self.stats,
+        )
+
+
+def get_commit_buffer() -> CommitBuffer | None:
+    """Return the CommitBuffer active in the current context, if any."""
+    return _active_buffer.get()
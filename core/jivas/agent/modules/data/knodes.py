@@ -0,0 +1,182 @@
+"""Knode (knowledge node) serialization utils"""
+
+import base64
+import json
+import shutil
+import tempfile
+from contextlib import suppress
+from typing import IO, Any, Iterable, List, Optional
+
+import numpy as np
+import yaml
+
+from jivas.agent.modules.data.serialization import yaml_dumps, yaml_loads
+
+KNODE_FORMATS = ("yaml", "jsonl")
+
+
+def pack_vector(vector: Iterable[float]) -> str:
+    """Pack a vector as base64 encoded little-endian float32 bytes."""
+    return base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode("ascii")
+
+
+def unpack_vector(vector: Any) -> List[float]:
+    """Return a vector packed by pack_vector, or given as a list of floats, as a list."""
+    if isinstance(vector, (str, bytes)):
+        return np.frombuffer(base64.b64decode(vector), dtype="<f4").tolist()
+    if isinstance(vector, np.ndarray):
+        return vector.tolist()
+    return list(vector)
+
+
+def to_knode(
+    doc: dict,
+    with_embeddings: bool = False,
+    with_ids: bool = False,
+    pack_vectors: bool = False,
+) -> dict:
+    """Convert a document with 'text', 'metadata' and optional 'id' and 'vec' to a knode."""
+    knode = {"text": doc.get("text", ""), "metadata": doc.get("metadata", {})}
+    if with_ids and "id" in doc:
+        knode["id"] = doc["id"]
+    if with_embeddings and doc.get("vec") is not None:
+        knode["vec"] = pack_vector(doc["vec"]) if pack_vectors else doc["vec"]
+    return knode
+
+
+def write_knodes(knodes: Iterable[dict], sink: IO[bytes], format: str = "yaml") -> int:
+    """Write knodes one at a time to a binary file-like sink; returns the number written.
+
+    "jsonl" writes one JSON document per line. "yaml" writes each knode as an item of a
+    single YAML sequence, so the output loads like a dumped list of knodes.
+    """
+    if format not in KNODE_FORMATS:
+        raise ValueError(
+            f"Unsupported knode format {format!r}, expected one of {KNODE_FORMATS}"
+        )
+
+    written = 0
+    for written, knode in enumerate(knodes, start=1):
+        chunk: Optional[str]
+        if format == "jsonl":
+            chunk = json.dumps(knode, default=str) + "\n"
+        elif (chunk := yaml_dumps([knode])) is None:  # type: ignore[arg-type]
+            raise ValueError(f"Unable to serialize knode {written - 1} as YAML")
+        sink.write(chunk.encode("utf-8"))
+    return written
+
+
+def parse_knodes(data: str) -> List[dict]:
+    """Parse knodes serialized as a JSON list, JSON lines (NDJSON) or YAML.
+
+    Raises:
+        ValueError: If data is in none of these formats.
+    """
+    with suppress(json.JSONDecodeError):
+        return json.loads(data)
+
+    with suppress(json.JSONDecodeError):
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+    try:
+        return yaml_loads(data)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Unable to parse knodes: {e}") from e
+
+
+class VectorRowWriter:
+    """Collects float32 vectors row by row and writes them out as a single .npy array.
+
+    Rows are spooled to a temporary file, so that vectors need not be held in memory and the
+    array header, which records the number of rows, can be written once they are all known.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the writer with an empty spool file."""
+        self._spool = tempfile.TemporaryFile()
+        self.rows = 0
+        self.dimension = 0
+
+    def __enter__(self) -> "VectorRowWriter":
+        """Return the writer."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Remove the spool file."""
+        self.close()
+
+    def append(self, vector: Any) -> int:
+        """Append a vector; returns its row."""
+        row = np.asarray(vector, dtype="<f4")
+        if row.ndim != 1 or (self.rows and len(row) != self.dimension):
+            raise ValueError(
+                f"Expected a vector of dimension {self.dimension or 'n'}, received shape {row.shape}"
+            )
+        self.dimension = len(row)
+        self._spool.write(row.tobytes())
+        self.rows += 1
+        return self.rows - 1
+
+    def write_to(self, sink: IO[bytes]) -> None:
+        """Write the collected rows to a binary sink in .npy format."""
+        np.lib.format.write_array_header_1_0(
+            sink,
+            {
+                "descr": "<f4",
+                "fortran_order": False,
+                "shape": (self.rows, self.dimension),
+            },
+        )
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, sink)  # type: ignore[misc]
+        self._spool.seek(0, 2)
+
+    def close(self) -> None:
+        """Remove the spool file."""
+        self._spool.close()
+
+
+def write_knodes_with_vectors(
+    knodes: Iterable[dict], sink: IO[bytes], vectors: VectorRowWriter
+) -> int:
+    """Write knodes to sink as JSON lines, moving their 'vec' into vectors.
+
+    Each knode with a vector records its row in the vectors array as 'vec_row'.
+    Returns the number of knodes written.
+    """
+
+    def spool_vector(knode: dict) -> dict:
+        if (vector := knode.get("vec")) is None:
+            return knode
+        knode = {key: value for key, value in knode.items() if key != "vec"}
+        if isinstance(vector, (str, bytes)):
+            vector = unpack_vector(vector)
+        knode["vec_row"] = vectors.append(vector)
+        return knode
+
+    return write_knodes(map(spool_vector, knodes), sink, format="jsonl")
+
+
+def read_knodes_with_vectors(knowledge_path: str, vectors_path: str) -> List[dict]:
+    """Read knodes written by write_knodes_with_vectors, restoring their 'vec'.
+
+    The vectors are memory-mapped; each knode's 'vec' is a float32 row of the mapped array.
+
+    Raises:
+        ValueError: If a knode refers to a row outside the vectors array.
+    """
+    vectors = np.load(vectors_path, mmap_mode="r")
+    knodes: List[dict] = []
+    with open(knowledge_path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            knode = json.loads(line)
+            if (row := knode.pop("vec_row", None)) is not None:
+                if not 0 <= row < len(vectors):
+                    raise ValueError(
+                        f"Knode {len(knodes)} refers to vector row {row} of {len(vectors)}"
+                    )
+                knode["vec"] = vectors[row]
+            knodes.append(knode)
+    return knodes
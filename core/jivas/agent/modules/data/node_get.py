@@ -1,23 +1,98 @@
 """node_get paginating node collections in Jivas."""
 
+from typing import Any, Generator
+
 from jac_cloud.core.archetype import BaseCollection, NodeAnchor
 from jac_cloud.plugin.jaseci import JacPlugin as Jac
 
+"""
+# newest ten frames of an agent, materialized as archetypes
+frames = node_get(
+    {"name": "Frame", "archetype.agent_id": agent_id},
+    sort=[("archetype.created_on", -1)],
+    limit=10,
+)
+
+# read-only lookup of raw documents; nothing is hydrated or cached
+ids = node_get({"name": "Frame"}, projection={"_id": 1})
+
+# stream a large result set without holding it all in memory
+for frame in iter_nodes({"name": "Frame"}, batch_size=500, cache=False):
+    ...
+"""
 
-def node_get(query_filter: dict | None = None) -> list:
-    """Retrieve a list of nodes from the 'node' collection based on the query filter."""
+
+def node_get(
+    query_filter: dict | None = None,
+    projection: dict | None = None,
+    sort: list[tuple[str, int]] | None = None,
+    limit: int = 0,
+    skip: int = 0,
+) -> list:
+    """Retrieve a list of nodes from the 'node' collection based on the query filter.
+
+    Nodes are hydrated directly from the documents returned by a single query. When
+    a projection is supplied, the raw projected documents are returned instead.
+    """
 
     if query_filter is None:
         return []
 
-    # Execute the query
-    node_refs = [
-        NodeAnchor.ref(f"n::{str(nd.get("_id"))}")
-        for nd in BaseCollection.get_collection("node").find(query_filter)
-    ]
+    return list(
+        iter_nodes(
+            query_filter,
+            projection=projection,
+            sort=sort,
+            limit=limit,
+            skip=skip,
+        )
+    )
+
+
+def iter_nodes(
+    query_filter: dict | None = None,
+    projection: dict | None = None,
+    sort: list[tuple[str, int]] | None = None,
+    limit: int = 0,
+    skip: int = 0,
+    batch_size: int = 100,
+    cache: bool = True,
+) -> Generator[Any, None, None]:
+    """Yield nodes from the 'node' collection, fetching documents in cursor batches of batch_size.
+
+    Each document is hydrated into its anchor once and registered in the Jac memory
+    cache, so later traversals or lookups of the same node do not query it again.
+    Nodes already present in the cache are yielded from there to preserve unsaved state,
+    and nodes destroyed in the current context are skipped. Set cache to False for
+    read-only scans over many nodes, e.g. exports.
+    """
+
+    if query_filter is None:
+        return
+
+    cursor = BaseCollection.get_collection("node").find(
+        query_filter,
+        projection,
+        sort=sort,
+        skip=skip,
+        limit=limit,
+        batch_size=batch_size,
+    )
+
+    if projection:
+        # partial documents cannot be materialized as anchors
+        yield from cursor
+        return
 
-    if node_refs:
-        nodes = [n.archetype for n in Jac.get_context().mem.find(node_refs)]
-        return nodes
+    mem = Jac.get_context().mem
 
-    return []
+    for doc in cursor:
+        if (anchor := mem.__mem__.get(doc["_id"])) is None:
+            anchor = NodeAnchor.Collection.__document__(doc)
+            if anchor in mem.__gc__:
+                continue
+            if cache:
+                mem.set(anchor.id, anchor)
+        elif anchor in mem.__gc__:
+            continue
+        yield anchor.archetype
@@ -0,0 +1,274 @@
+"""node_purge bulk removal of node subgraphs in Jivas."""
+
+import logging
+from typing import Any, Callable, Iterable
+
+from bson import ObjectId
+from jac_cloud.core.archetype import AccessLevel, BulkWrite, NodeAnchor, Permission
+from jac_cloud.plugin.jaseci import JacPlugin as Jac
+from jaclang.runtimelib.constructs import Archetype
+from pymongo import UpdateMany
+
+from jivas.agent.modules.data.commit import execute_bulk_write
+
+logger = logging.getLogger(__name__)
+
+"""
+# remove an agent and everything beneath it
+node_purge(agent_node)
+
+# remove only the children of a node, reporting progress along the way
+node_purge(
+    actions_node,
+    include_root=False,
+    on_progress=lambda stage, count: print(stage, count),
+)
+"""
+
+
+def to_object_id(ref: Any) -> ObjectId:
+    """Resolve an archetype, anchor, jid string or ObjectId to its document ObjectId."""
+    if isinstance(ref, ObjectId):
+        return ref
+    if isinstance(ref, Archetype):
+        ref = ref.__jac__
+    if isinstance(ref, NodeAnchor) or hasattr(ref, "id"):
+        return ObjectId(str(ref.id))
+    # jid strings are of the form "n:Name:<hex>"; bare hex ids are accepted as well
+    return ObjectId(str(ref).split(":")[-1])
+
+
+def node_purge(
+    roots: Any,
+    include_root: bool = True,
+    batch_size: int = 1000,
+    on_progress: Callable[[str, int], None] | None = None,
+) -> list[str]:
+    """Remove one or more nodes and every node reachable from them via outgoing edges.
+
+    Descendants are collected with a batched breadth-first traversal over the raw
+    node and edge collections, then all nodes and edges are removed with
+    delete_many operations committed in a single transaction.
+
+    As with Jac.destroy, roots the current root has no write access to are skipped;
+    access is checked from the roots' owner and access fields, without loading them.
+    Unless running as the system root, the traversal only descends into nodes owned
+    by the current root or by the owner of a writable root; nodes of other owners are
+    kept, with the edges leading into them pulled.
+
+    Args:
+        roots: A node (archetype, anchor, jid or ObjectId) or an iterable of them.
+        include_root: Whether the root node(s) are removed along with their descendants.
+        batch_size: Number of node ids resolved per traversal query.
+        on_progress: Optional callback receiving (stage, count) as the purge advances.
+
+    Returns:
+        A list of jid strings of the removed nodes.
+    """
+    if roots is None:
+        return []
+
+    if isinstance(roots, (str, ObjectId, Archetype, NodeAnchor)) or not isinstance(
+        roots, Iterable
+    ):
+        roots = [roots]
+
+    root_ids, owners = _writable_roots(
+        dict.fromkeys(to_object_id(root) for root in roots)
+    )
+    if not root_ids:
+        return []
+
+    def report(stage: str, count: int) -> None:
+        logger.info(f"node_purge {stage}: {count}")
+        if on_progress:
+            on_progress(stage, count)
+
+    node_collection = NodeAnchor.Collection.get_collection("node")
+    edge_collection = NodeAnchor.Collection.get_collection("edge")
+
+    # node ObjectId -> node name, for every node slated for removal
+    doomed: dict[ObjectId, str] = {}
+    # edge ObjectId -> the edge reference exactly as stored on node documents
+    edge_refs: dict[ObjectId, Any] = {}
+    # nodes outside the subgraph which hold edges into it
+    edge_sources: set[ObjectId] = set()
+    # edges leading into the roots from outside the subgraph
+    root_incoming: set[ObjectId] = set()
+    root_set = set(root_ids)
+
+    frontier = list(root_ids)
+    seen = set(root_ids)
+
+    while frontier:
+        batch, frontier = frontier[:batch_size], frontier[batch_size:]
+        batch_ids = set(batch)
+        new_edges: dict[ObjectId, Any] = {}
+
+        for doc in node_collection.find(
+            {"_id": {"$in": batch}}, {"name": 1, "edges": 1, "root": 1}
+        ):
+            if (
+                owners is not None
+                and doc["_id"] not in root_set
+                and doc.get("root") not in owners
+            ):
+                # not ours to remove; it keeps a reference to the edge into it
+                edge_sources.add(doc["_id"])
+                batch_ids.discard(doc["_id"])
+                continue
+            doomed[doc["_id"]] = doc.get("name", "")
+            for ref in doc.get("edges") or []:
+                edge_id = to_object_id(ref)
+                if edge_id not in edge_refs:
+                    new_edges[edge_id] = ref
+
+        edge_refs.update(new_edges)
+
+        for edge_doc in edge_collection.find(
+            {"_id": {"$in": list(new_edges)}}, {"source": 1, "target": 1}
+        ):
+            source_id = to_object_id(edge_doc["source"])
+            target_id = to_object_id(edge_doc["target"])
+
+            if source_id in batch_ids:
+                # outgoing edge; its target belongs to the subgraph
+                if target_id not in seen:
+                    seen.add(target_id)
+                    frontier.append(target_id)
+            else:
+                # incoming edge; its source keeps a reference which must be pulled
+                edge_sources.add(source_id)
+                if target_id in root_set:
+                    root_incoming.add(edge_doc["_id"])
+
+        report("collected", len(doomed))
+
+    if not include_root:
+        for root_id in root_ids:
+            doomed.pop(root_id, None)
+        # edges hanging off surviving roots must be pulled from them as well
+        edge_sources.update(root_ids)
+
+    removed_edges = {
+        edge_id: ref
+        for edge_id, ref in edge_refs.items()
+        if include_root or edge_id not in root_incoming
+    }
+
+    bulk_write = BulkWrite()
+    for node_id in doomed:
+        bulk_write.del_node(node_id)
+    for edge_id in removed_edges:
+        bulk_write.del_edge(edge_id)
+
+    survivors = [node_id for node_id in edge_sources if node_id not in doomed]
+    if survivors and removed_edges:
+        bulk_write.operations[NodeAnchor].append(
+            UpdateMany(
+                {"_id": {"$in": survivors}},
+                {"$pull": {"edges": {"$in": list(removed_edges.values())}}},
+            )
+        )
+
+    execute_bulk_write(bulk_write)
+    report("deleted", len(doomed))
+
+    _evict(doomed.keys(), removed_edges.keys())
+
+    return [f"n:{name}:{node_id}" for node_id, name in doomed.items()]
+
+
+def _writable_roots(
+    root_ids: Iterable[ObjectId],
+) -> tuple[list[ObjectId], set[Any] | None]:
+    """Return the roots the current root may write to, and the owners whose nodes may go.
+
+    Access is checked as Jac.check_write_access does, from the owner and access fields
+    of the root documents alone, so that the roots (e.g. frames holding every interaction)
+    are never loaded whole. The owners are None when running as the system root, which
+    may remove any node.
+    """
+    ctx = Jac.get_context()
+    root_ids = list(root_ids)
+    node_collection = NodeAnchor.Collection.get_collection("node")
+    docs = list(
+        node_collection.find(
+            {"_id": {"$in": root_ids}}, {"_id": 1, "root": 1, "access": 1}
+        )
+    )
+
+    if ctx.root_state == ctx.system_root:
+        writable = docs
+    else:
+        owner_ids = list({doc["root"] for doc in docs if doc.get("root")})
+        owner_access = {
+            doc["_id"]: _permission(doc)
+            for doc in node_collection.find(
+                {"_id": {"$in": owner_ids}}, {"_id": 1, "access": 1}
+            )
+        }
+        writable = [
+            doc
+            for doc in docs
+            if _access_level(doc, ctx.root_state.id, owner_access) > AccessLevel.READ
+        ]
+
+    denied = len(root_ids) - len(writable)
+    if denied:
+        logger.warning(f"node_purge skipped {denied} root(s) without write access")
+
+    if ctx.root_state == ctx.system_root:
+        return [doc["_id"] for doc in writable], None
+
+    owners = {ctx.root_state.id} | {doc.get("root") for doc in writable}
+    return [doc["_id"] for doc in writable], owners
+
+
+def _permission(doc: dict) -> Permission:
+    """Return the permission stored in a node document's access field."""
+    access = doc.get("access") or {}
+    return Permission.deserialize(
+        {
+            "all": access.get("all", AccessLevel.NO_ACCESS.name),
+            "roots": {"anchors": (access.get("roots") or {}).get("anchors") or {}},
+        }
+    )
+
+
+def _access_level(
+    doc: dict, root_id: ObjectId, owner_access: dict[ObjectId, Permission]
+) -> AccessLevel:
+    """Return the access root_id has to a node document, as Jac.check_access_level does.
+
+    The current root has write access to the nodes it owns and to itself; otherwise the
+    level is the highest granted to all by the node or its owner, overridden by the level
+    granted to the current root by the owner and then by the node.
+    """
+    if doc.get("root") == root_id or doc["_id"] == root_id:
+        return AccessLevel.WRITE
+
+    access = _permission(doc)
+    level = access.all
+    if (owner := owner_access.get(doc.get("root"))) is not None:
+        level = max(level, owner.all)
+        if (granted := owner.roots.check(str(root_id))) is not None:
+            level = granted
+    if (granted := access.roots.check(str(root_id))) is not None:
+        level = granted
+    return level
+
+
+def _evict(node_ids: Iterable[ObjectId], edge_ids: Iterable[ObjectId]) -> None:
+    """Drop purged anchors from the Jac memory cache so they are not synced back."""
+    mem = Jac.get_context().mem
+    removed_edges = set(edge_ids)
+
+    for anchor_id in [*node_ids, *removed_edges]:
+        mem.__mem__.pop(anchor_id, None)
+
+    for anchor in mem.__mem__.values():
+        if isinstance(anchor, NodeAnchor) and anchor.edges:
+            anchor.edges[:] = [
+                edge for edge in anchor.edges if edge.id not in removed_edges
+            ]
@@ -1,18 +1,32 @@
 """Serialization utility operations"""
 
 import ast
+import datetime
 import json
 import logging
 from enum import Enum
-from typing import Any, List, Optional, Set
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Union
 
 import yaml
 
+try:
+    # libyaml bindings, emitting and parsing in C
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
-class LongStringDumper(yaml.SafeDumper):
-    """Custom YAML dumper to handle long strings."""
+class LongStringRepresenter:
+    """Representer methods of LongStringDumper, to be mixed into a PyYAML dumper."""
 
     def represent_scalar(
         self,
@@ -22,17 +36,44 @@ class LongStringDumper(yaml.SafeDumper):
     ) -> yaml.nodes.ScalarNode:
         """Represent scalar values in YAML."""
         # Replace any escape sequences to format the output as desired
-        if (
-            len(value) > 150 or "\n" in value
-        ):  # Adjust the threshold for long strings as needed
+        if "\n" in value:
             style = "|"
             # converts all newline escapes to actual representations
             value = "\n".join([line.rstrip() for line in value.split("\n")])
         else:
-            # converts all newline escapes to actual representations
-            value = "\n".join([line.rstrip() for line in value.split("\n")]).rstrip()
+            if len(value) > 150:  # Adjust the threshold for long strings as needed
+                style = "|"
+            value = value.rstrip()
+
+        return super().represent_scalar(tag, value, style)  # type: ignore[misc]
+
+    def ignore_aliases(self, data: Any) -> bool:
+        """Write repeated objects out in full rather than as anchors and aliases."""
+        return True
+
+    def represent_as_string(self, data: Any) -> yaml.nodes.ScalarNode:
+        """Represent a value which has no plain YAML form by its string representation."""
+        return self.represent_str(str(data))  # type: ignore[attr-defined]
+
+    def represent_str_subclass(self, data: str) -> yaml.nodes.ScalarNode:
+        """Represent a str subclass, e.g. a str enum, as a plain string."""
+        return self.represent_str(str.__str__(data))  # type: ignore[attr-defined]
+
+
+class LongStringDumper(LongStringRepresenter, _SafeDumper):
+    """Custom YAML dumper to handle long strings.
+
+    Builds on the libyaml CSafeDumper when PyYAML has it, otherwise on SafeDumper.
+    """
+
 
-        return super().represent_scalar(tag, value, style)
+# values are represented as make_serializable would convert them, without copying the data
+LongStringDumper.add_multi_representer(dict, LongStringDumper.represent_dict)
+LongStringDumper.add_multi_representer(list, LongStringDumper.represent_list)
+LongStringDumper.add_multi_representer(str, LongStringDumper.represent_str_subclass)
+LongStringDumper.add_multi_representer(object, LongStringDumper.represent_as_string)
+for _type in (bytes, tuple, set, datetime.date, datetime.datetime):
+    LongStringDumper.add_representer(_type, LongStringDumper.represent_as_string)
 
 
 def make_serializable(obj: Any) -> Any:
@@ -51,12 +92,38 @@ def make_serializable(obj: Any) -> Any:
         return str(obj)
 
 
+# kinds of values, resolved once per type by _classify
+_SCALAR, _ENUM, _NAMEDTUPLE, _DICT, _SEQUENCE, _OBJECT = range(1, 7)
+_kinds: Dict[type, int] = {}
+# marks a container whose export is in progress
+_OPEN = object()
+
+
+def _classify(cls: type) -> int:
+    """Return the kind of values of type cls, in the order export_to_dict checks them."""
+    if cls is type(None) or issubclass(cls, (bool, int, float, str)):
+        return _SCALAR
+    if issubclass(cls, Enum):
+        return _ENUM
+    if callable(getattr(cls, "_asdict", None)):
+        return _NAMEDTUPLE
+    if issubclass(cls, dict):
+        return _DICT
+    if issubclass(cls, (list, tuple, set, frozenset)):
+        return _SEQUENCE
+    return _OBJECT
+
+
 def export_to_dict(
     data: object | dict,
     ignore_keys: Optional[List[str]] = None,
 ) -> dict:
     """Export an object to a dictionary, ignoring specified keys and handling cycles.
 
+    Enums are exported by value, namedtuples and objects as dicts of their fields, sets and
+    tuples as lists and anything else by its string representation. A reference back to
+    an object which is being exported is replaced with "<cycle detected>".
+
     Args:
         data: The object or dictionary to serialize.
         ignore_keys: Keys to exclude from serialization (default: ["__jac__"])
@@ -64,90 +131,197 @@ def export_to_dict(
     Returns:
         A dictionary representation of the input.
     """
-    if ignore_keys is None:
-        ignore_keys = ["__jac__"]
+    ignore = frozenset(["__jac__"] if ignore_keys is None else ignore_keys)
+    result = _export(data, ignore)
+    # Ensure top-level output is a dictionary
+    return result if isinstance(result, dict) else {"value": result}
 
-    memo: Set[int] = set()  # Track object IDs for cycle detection
 
-    def _convert(obj: object) -> object:
-        # Handle cycles
-        obj_id = id(obj)
-        if obj_id in memo:
-            return "<cycle detected>"
-        memo.add(obj_id)
-        try:
-            # 1. Basic immutable types
-            if obj is None or isinstance(obj, (bool, int, float, str)):
-                return obj
+def _export(data: object, ignore: frozenset) -> Any:
+    """Export data without recursion, keeping a stack of the containers being exported.
+
+    Each stack frame holds [output, items iterator, is dict, ids of the objects the
+    container was unwrapped from, pending key]; the ids of all frames on the stack are the
+    ones checked for cycles. Scalar items are copied as they are iterated.
+    """
+    kinds = _kinds
+    active: Set[int] = set()
+    stack: List[list] = []
+    value: Any = data
+
+    while True:
+        # unwrap value until it is exported or a frame is opened for its container
+        ids: List[int] = []
+        while True:
+            if not (kind := kinds.get(type(value), 0)):
+                kind = kinds[type(value)] = _classify(type(value))
+            if kind == _SCALAR:
+                result = value
+                break
+            if (value_id := id(value)) in active:
+                result = "<cycle detected>"
+                break
+            if kind in (_DICT, _SEQUENCE):
+                active.add(value_id)
+                ids.append(value_id)
+                if kind == _DICT:
+                    stack.append([{}, iter(value.items()), True, ids, None])
+                else:
+                    stack.append([[], iter(value), False, ids, None])
+                result = _OPEN
+                break
+            if kind == _ENUM:
+                unwrapped = value.value
+            elif kind == _NAMEDTUPLE:
+                unwrapped = value._asdict()
+            elif (unwrapped := getattr(value, "__dict__", None)) is None:
+                result = str(value)
+                break
+            active.add(value_id)
+            ids.append(value_id)
+            value = unwrapped
+
+        if result is not _OPEN:
+            active.difference_update(ids)
+
+        # hand results to their containers until one has another item to export
+        while True:
+            if result is not _OPEN:
+                if not stack:
+                    return result
+                frame = stack[-1]
+                if frame[2]:
+                    frame[0][frame[4]] = result
+                else:
+                    frame[0].append(result)
+
+            frame = stack[-1]
+            output, items = frame[0], frame[1]
+            value = _OPEN
+            if frame[2]:
+                for key, item in items:
+                    if key in ignore:
+                        continue
+                    if kinds.get(type(item)) == _SCALAR:
+                        output[key] = item
+                        continue
+                    frame[4] = key
+                    value = item
+                    break
+            else:
+                for item in items:
+                    if kinds.get(type(item)) == _SCALAR:
+                        output.append(item)
+                        continue
+                    value = item
+                    break
 
-            # 2. Handle enums by their value
-            if Enum is not None and isinstance(obj, Enum):
-                return _convert(obj.value)  # Serialize enum value
+            if value is not _OPEN:
+                break
 
-            # 3. Handle namedtuples
-            if hasattr(obj, "_asdict") and callable(obj._asdict):
-                return _convert(obj._asdict())
+            # the container is done
+            stack.pop()
+            active.difference_update(frame[3])
+            result = output
 
-            # 4. Dictionaries: apply ignore_keys and recurse
-            if isinstance(obj, dict):
-                return {k: _convert(v) for k, v in obj.items() if k not in ignore_keys}
 
-            # 5. Lists, tuples, sets: convert to list and recurse
-            if isinstance(obj, (list, tuple, set, frozenset)):
-                return [_convert(item) for item in obj]
+def json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data)
 
-            # 6. Generic objects with __dict__
-            if hasattr(obj, "__dict__"):
-                return _convert(obj.__dict__)
 
-            # 7. Fallback: string representation
-            return str(obj)
+def json_loads(text: str | bytes) -> Any:
+    """Parse a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
-        finally:
-            memo.discard(obj_id)  # Clean up after processing
 
-    result = _convert(data)
-    # Ensure top-level output is a dictionary
-    return result if isinstance(result, dict) else {"value": result}
+class ContentWrappingEncoder(json.JSONEncoder):
+    """JSON encoder which wraps scalar values of dicts as {"content": value} while encoding.
 
+    Values of dicts which are strings or numbers are wrapped; dicts, also within lists,
+    are processed recursively and everything else is encoded as is. The input is not
+    copied or modified.
+    """
 
-def safe_json_dump(data: dict) -> Optional[str]:
-    """Safely convert a dictionary with mixed types to a JSON string for logs."""
-    if not isinstance(data, dict):
-        logger.error("Input to safe_json_dump must be a dictionary.")
-        return None
+    def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
+        """Encode o, yielding its JSON representation in chunks."""
+        if not isinstance(o, dict):
+            return super().iterencode(o, _one_shot)
+        return self._iterencode_dict(o, set())
+
+    def _iterencode_dict(self, data: dict, markers: Set[int]) -> Iterator[str]:
+        if id(data) in markers:
+            raise ValueError("Circular reference detected")
+        markers.add(id(data))
+
+        yield "{"
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                yield self.item_separator
+            yield self._encode_key(key)
+            yield self.key_separator
+            if isinstance(value, dict):
+                yield from self._iterencode_dict(value, markers)
+            elif isinstance(value, list):
+                yield from self._iterencode_list(value, markers)
+            elif isinstance(value, (str, int, float)):
+                yield "{"
+                yield '"content"'
+                yield self.key_separator
+                yield from super().iterencode(value)
+                yield "}"
+            else:
+                yield from super().iterencode(value)
+        yield "}"
+
+        markers.discard(id(data))
+
+    def _iterencode_list(self, data: list, markers: Set[int]) -> Iterator[str]:
+        if id(data) in markers:
+            raise ValueError("Circular reference detected")
+        markers.add(id(data))
+
+        yield "["
+        for index, item in enumerate(data):
+            if index:
+                yield self.item_separator
+            if isinstance(item, dict):
+                yield from self._iterencode_dict(item, markers)
+            else:
+                yield from super().iterencode(item)
+        yield "]"
 
-    def serialize(obj: dict) -> dict:
-        """Recursively convert strings within complex objects."""
-
-        def wrap_content(value: object) -> object:
-            # Return value wrapped in a dictionary with key 'content' if it's a str, int or float
-            return {"content": value} if isinstance(value, (str, int, float)) else value
-
-        def process_dict(d: dict) -> dict:
-            for key, value in d.items():
-                if isinstance(value, dict):
-                    d[key] = process_dict(value)
-                elif isinstance(value, list):
-                    # If the list contains dictionaries, recursively process each
-                    d[key] = [
-                        process_dict(item) if isinstance(item, dict) else item
-                        for item in value
-                    ]
-                else:
-                    d[key] = wrap_content(value)
-            return d
+        markers.discard(id(data))
 
-        # Create a deep copy of the original dict to avoid mutation
-        import copy
+    def _encode_key(self, key: Any) -> str:
+        # keys are converted to strings as the standard encoder does
+        if not isinstance(key, str):
+            if key is None or isinstance(key, (bool, int, float)):
+                key = "".join(super().iterencode(key)).strip('"')
+            else:
+                raise TypeError(
+                    f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+                )
+        return "".join(super().iterencode(key))
 
-        result = copy.deepcopy(obj)
 
-        return process_dict(result)
+def safe_json_dump(data: dict) -> Optional[str]:
+    """Safely convert a dictionary with mixed types to a JSON string for logs.
+
+    String and number values of dicts are wrapped as {"content": value}; see
+    ContentWrappingEncoder.
+    """
+    if not isinstance(data, dict):
+        logger.error("Input to safe_json_dump must be a dictionary.")
+        return None
 
     try:
         # Attempt to serialize the dictionary
-        return json.dumps(serialize(data))
+        return json.dumps(data, cls=ContentWrappingEncoder)
     except (TypeError, ValueError) as e:
         # Handle serialization errors
         logger.error(f"Serialization error: {str(e)}")
@@ -182,9 +356,8 @@ def yaml_dumps(data: Optional[dict]) -> Optional[str]:
         return None
 
     try:
-        safe_data = make_serializable(data)
         yaml_output = yaml.dump(
-            safe_data,
+            data,
             Dumper=LongStringDumper,
             allow_unicode=True,
             default_flow_style=False,
@@ -197,3 +370,12 @@ def yaml_dumps(data: Optional[dict]) -> Optional[str]:
     except Exception as e:
         logger.error(f"Error dumping YAML: {e}")
         return None
+
+
+def yaml_loads(data: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document like yaml.safe_load, with the libyaml parser when available.
+
+    Raises:
+        yaml.YAMLError: If data is not valid YAML.
+    """
+    return yaml.load(data, Loader=SafeLoader)
@@ -0,0 +1,69 @@
+"""Streaming reads of uploaded files"""
+
+import time
+from typing import Any, AsyncIterator, Optional
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the maximum size while it is being read."""
+
+
+class UploadStream:
+    """Async iterator over the bytes of an upload, read in chunks.
+
+    Wraps anything with an async read(size) method, such as a FastAPI UploadFile. The
+    size limit is enforced as chunks arrive, so an oversized upload is rejected without
+    being read into memory in full. Bytes read and read timings are kept for metrics.
+    """
+
+    def __init__(self, file: Any, max_size: int = 0, chunk_size: int = 65536) -> None:
+        """Initialize the stream over file; a max_size of 0 reads uploads of any size."""
+        self.file = file
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self.started: Optional[float] = None
+        self.first_chunk_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        """Return the stream itself."""
+        return self
+
+    async def __anext__(self) -> bytes:
+        """Return the next chunk of the upload."""
+        if self.started is None:
+            self.started = time.perf_counter()
+        chunk = await self.file.read(self.chunk_size)
+        if not chunk:
+            self.finished_at = time.perf_counter()
+            raise StopAsyncIteration
+        if self.first_chunk_at is None:
+            self.first_chunk_at = time.perf_counter()
+        self.bytes_read += len(chunk)
+        if self.max_size and self.bytes_read > self.max_size:
+            raise UploadTooLargeError(
+                f"upload exceeds the maximum size of {self.max_size} bytes"
+            )
+        return chunk
+
+    def metrics(self) -> dict:
+        """Return the bytes read and the seconds taken to the first chunk and to the end."""
+        return {
+            "bytes": self.bytes_read,
+            "first_chunk_latency": (
+                self.first_chunk_at - self.started
+                if self.started is not None and self.first_chunk_at is not None
+                else None
+            ),
+            "read_latency": (
+                self.finished_at - self.started
+                if self.started is not None and self.finished_at is not None
+                else None
+            ),
+        }
+
+
+async def read_stream(stream: AsyncIterator[bytes]) -> bytes:
+    """Read an async byte stream to the end and return its contents."""
+    return b"".join([chunk async for chunk in stream])
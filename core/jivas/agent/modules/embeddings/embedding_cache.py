@@ -0,0 +1,353 @@
+"""Content-addressed caching of embeddings."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+"""
+# wrap any langchain embeddings model; identical texts are only embedded once
+# the model name identifies the model and where it is served, e.g. provider:endpoint:model
+embeddings = CachedEmbeddings(OpenAIEmbeddings(), model_name="openai::text-embedding-3-small")
+embeddings.embed_documents(["hello", "hello", "world"])  # one request for two texts
+embeddings.cache.stats()
+
+# processes share a second tier via sqlite on disk or redis
+cache = EmbeddingCache(max_entries=50000, store=SQLiteEmbeddingStore(".jvdata/embeddings.db"))
+"""
+
+
+def embedding_cache_key(model_name: str, text: str, role: str = "document") -> str:
+    """Return the cache key for a text embedded by the named model as a document or query.
+
+    Some models embed queries and documents differently (e.g. with instruction
+    prefixes), so the role is part of the key.
+    """
+    return f"{model_name}:{role}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Pack a vector into float32 bytes for the persistent tiers."""
+    return array("f", vector).tobytes()
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    """Unpack float32 bytes into a vector."""
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class SQLiteEmbeddingStore:
+    """Persistent embedding store backed by a local SQLite database."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the store, creating the database file and table if needed."""
+        if directory := os.path.dirname(path):
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the stored vectors for the keys found."""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            # stay well under sqlite's bound parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update({key: unpack_vector(vec) for key, vec in rows})
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Store vectors by key."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                [(key, pack_vector(vec)) for key, vec in items.items()],
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all stored vectors."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+
+
+class RedisEmbeddingStore:
+    """Shared embedding store backed by Redis, with an optional expiry."""
+
+    def __init__(
+        self, client: Any = None, ttl: int = 0, prefix: str = "jivas:embedding:"
+    ) -> None:
+        """Initialize the store with a redis client, defaulting to the jac-cloud connection."""
+        if client is None:
+            from jac_cloud.jaseci.datasources.redis import Redis
+
+            client = Redis().get_rd()
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the stored vectors for the keys found."""
+        if not keys:
+            return {}
+        values = self.client.mget([self.prefix + key for key in keys])
+        return {key: unpack_vector(value) for key, value in zip(keys, values) if value}
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Store vectors by key."""
+        pipeline = self.client.pipeline()
+        for key, vec in items.items():
+            pipeline.set(self.prefix + key, pack_vector(vec), ex=self.ttl or None)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        """Remove all stored vectors."""
+        for key in self.client.scan_iter(f"{self.prefix}*"):
+            self.client.delete(key)
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: an in-process LRU in front of an optional persistent store."""
+
+    def __init__(self, max_entries: int = 10000, store: Any = None) -> None:
+        """Initialize the cache with the LRU capacity and optional second-tier store."""
+        self.max_entries = max_entries
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self._entries: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for the keys found, consulting the store for LRU misses."""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                if (vector := self._entries.get(key)) is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+
+        if self.store is not None and (
+            remaining := [key for key in keys if key not in found]
+        ):
+            try:
+                stored = self.store.get_many(list(dict.fromkeys(remaining)))
+            except Exception as e:
+                logger.warning(f"Embedding cache store lookup failed: {e}")
+                stored = {}
+            if stored:
+                self._remember(stored)
+                found.update(stored)
+                self.store_hits += sum(1 for key in remaining if key in stored)
+
+        hits = sum(1 for key in keys if key in found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Cache vectors by key in the LRU and the store."""
+        if not items:
+            return
+        self._remember(items)
+        if self.store is not None:
+            try:
+                self.store.set_many(items)
+            except Exception as e:
+                logger.warning(f"Embedding cache store write failed: {e}")
+
+    def _remember(self, items: Dict[str, List[float]]) -> None:
+        """Add vectors to the LRU, evicting the least recently used beyond capacity."""
+        with self._lock:
+            for key, vector in items.items():
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached vectors and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+        self.hits = self.misses = self.store_hits = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "store_hits": self.store_hits,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache, configured from the environment.
+
+    JIVAS_EMBEDDING_CACHE_SIZE sets the LRU capacity (default 10000) and
+    JIVAS_EMBEDDING_CACHE_STORE selects an optional second tier: "disk" (SQLite
+    at JIVAS_EMBEDDING_CACHE_PATH) or "redis".
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            store: Any = None
+            store_type = os.environ.get("JIVAS_EMBEDDING_CACHE_STORE", "").lower()
+            try:
+                if store_type == "disk":
+                    store = SQLiteEmbeddingStore(
+                        os.environ.get(
+                            "JIVAS_EMBEDDING_CACHE_PATH", ".jvdata/embeddings.db"
+                        )
+                    )
+                elif store_type == "redis":
+                    store = RedisEmbeddingStore(
+                        ttl=int(os.environ.get("JIVAS_EMBEDDING_CACHE_TTL", 0))
+                    )
+            except Exception as e:
+                logger.error(f"Unable to initialize {store_type} embedding store: {e}")
+
+            _default_cache = EmbeddingCache(
+                max_entries=int(os.environ.get("JIVAS_EMBEDDING_CACHE_SIZE", 10000)),
+                store=store,
+            )
+
+        return _default_cache
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper which serves repeated texts from an EmbeddingCache."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model_name: str,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
+        """Wrap an embeddings model; texts are cached per model_name.
+
+        The model_name must distinguish every model and deployment which can produce
+        different vectors for the same text, e.g. by including the endpoint.
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.cache = cache if cache is not None else get_embedding_cache()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate any other attribute to the wrapped embeddings model."""
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _lookup(
+        self, texts: List[str], role: str = "document"
+    ) -> tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        """Return the keys of texts, the cached vectors found and the unique uncached texts by key."""
+        keys = [embedding_cache_key(self.model_name, text, role=role) for text in texts]
+        found = self.cache.get_many(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        return keys, found, missing
+
+    def _collect(
+        self,
+        keys: List[str],
+        found: Dict[str, List[float]],
+        missing: Dict[str, str],
+        vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """Cache freshly embedded vectors and return all vectors in the order of keys."""
+        if len(vectors) != len(missing):
+            # the wrapped model failed; do not cache or return a misaligned result
+            return []
+        embedded = dict(zip(missing, vectors))
+        self.cache.set_many(embedded)
+        found.update(embedded)
+        return [found[key] for key in keys]
+
+    def embed_documents(self, texts: List[str], **kwargs: Any) -> List[List[float]]:
+        """Embed search documents, embedding only texts not already cached."""
+        keys, found, missing = self._lookup(texts)
+        vectors = (
+            self.embeddings.embed_documents(list(missing.values()), **kwargs)
+            if missing
+            else []
+        )
+        return self._collect(keys, found, missing, vectors)
+
+    def embed_query(self, text: str, **kwargs: Any) -> List[float]:
+        """Embed query text, serving repeated queries from the cache."""
+        key = embedding_cache_key(self.model_name, text, role="query")
+        if (vector := self.cache.get_many([key]).get(key)) is not None:
+            return vector
+        vector = self.embeddings.embed_query(text, **kwargs)
+        if vector:
+            self.cache.set_many({key: vector})
+        return vector
+
+    async def aembed_documents(
+        self, texts: List[str], **kwargs: Any
+    ) -> List[List[float]]:
+        """Asynchronously embed search documents, embedding only texts not already cached."""
+        keys, found, missing = self._lookup(texts)
+        vectors = (
+            await self.embeddings.aembed_documents(list(missing.values()), **kwargs)
+            if missing
+            else []
+        )
+        return self._collect(keys, found, missing, vectors)
+
+    async def aembed_query(self, text: str, **kwargs: Any) -> List[float]:
+        """Asynchronously embed query text, serving repeated queries from the cache."""
+        key = embedding_cache_key(self.model_name, text, role="query")
+        if (vector := self.cache.get_many([key]).get(key)) is not None:
+            return vector
+        vector = await self.embeddings.aembed_query(text, **kwargs)
+        if vector:
+            self.cache.set_many({key: vector})
+        return vector
+
+    async def aembed_queries(
+        self, texts: List[str], **kwargs: Any
+    ) -> List[List[float]]:
+        """Asynchronously embed several query texts, embedding uncached ones concurrently.
+
+        Vectors are cached as queries, so later embed_query calls for the same texts are hits.
+        """
+        keys, found, missing = self._lookup(texts, role="query")
+        vectors = await asyncio.gather(
+            *[self.embeddings.aembed_query(text, **kwargs) for text in missing.values()]
+        )
+        if not all(vectors):
+            return []
+        return self._collect(keys, found, missing, list(vectors))
@@ -1,21 +1,51 @@
 """Module for Jivas Embeddings."""
 
 import json
-from typing import List
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from langchain_core.embeddings import Embeddings
-from openai import OpenAI
-from transformers import AutoTokenizer
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+
+from jivas.agent.modules.embeddings.registry import get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+# errors raised by the embeddings endpoint which are worth retrying
+RETRYABLE_ERRORS = (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
 
 
 class JivasEmbeddings(Embeddings):
-    """Class for handling Jivas Embeddings."""
+    """Class for handling Jivas Embeddings.
+
+    Documents are sent in batches of at most batch_size texts and max_batch_tokens
+    tokens; batches are dispatched concurrently on up to max_workers threads and
+    retried with exponential backoff on transient errors. A limit of 0 disables it.
+    """
 
     def __init__(
         self,
         base_url: str,
         api_key: str,
         model: str = "intfloat/multilingual-e5-large-instruct",
+        batch_size: int = 64,
+        max_batch_tokens: int = 16384,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
     ) -> None:
         """Initialize the JivasEmbeddings class."""
         # init args
@@ -23,39 +53,110 @@ class JivasEmbeddings(Embeddings):
         self.model_name = "-".join(model.split("/"))
         self.base_url = base_url
         self.api_key = api_key
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
 
         # create client
         self.client = OpenAI(api_key=api_key, base_url=base_url)
 
-        # Load the tokenizer
-        self.tokenizer = AutoTokenizer.from_pretrained(model)
+        # Load the tokenizer; shared by all instances using the same model
+        self.tokenizer = get_tokenizer(model)
         self.token_limit = self.tokenizer.model_max_length
 
+    def tokenize(self, texts: List[str]) -> List[List[int]]:
+        """Tokenize texts in a single batched call, returning the token ids of each."""
+        # truncation is applied by slicing rather than through the tokenizer's
+        # truncation settings, which would mutate state shared across threads
+        return list(self.tokenizer(texts)["input_ids"])
+
+    def trim_texts(self, texts: List[str]) -> Tuple[List[str], List[int]]:
+        """Trim texts exceeding the token limit; returns the texts and their token counts."""
+        trimmed = list(texts)
+        counts = []
+        for i, ids in enumerate(self.tokenize(texts)):
+            if len(ids) > self.token_limit:
+                ids = ids[: self.token_limit]
+                trimmed[i] = self.tokenizer.decode(ids, skip_special_tokens=True)
+            counts.append(len(ids))
+        return trimmed, counts
+
     def trim_text_if_needed(self, text: str) -> str:
         """Trim text if it exceeds the token limit."""
-        tokenized = self.tokenizer(text, return_tensors="pt")
-        num_tokens = len(tokenized["input_ids"][0])
+        return self.trim_texts([text])[0][0]
 
-        if num_tokens > self.token_limit:
-            truncated_tokens = tokenized["input_ids"][0][: self.token_limit]
-            return self.tokenizer.decode(truncated_tokens, skip_special_tokens=True)
+    def batch_ranges(self, token_counts: List[int]) -> List[Tuple[int, int]]:
+        """Split texts into (start, end) ranges within the batch size and token limits."""
+        ranges = []
+        start = tokens = 0
+        for i, count in enumerate(token_counts):
+            if i > start and (
+                (self.batch_size and i - start >= self.batch_size)
+                or (self.max_batch_tokens and tokens + count > self.max_batch_tokens)
+            ):
+                ranges.append((start, i))
+                start, tokens = i, 0
+            tokens += count
+        if start < len(token_counts):
+            ranges.append((start, len(token_counts)))
+        return ranges
 
-        return text
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a single batch of texts, retrying transient errors with backoff."""
+        attempt = 0
+        while True:
+            try:
+                # grab embeddings
+                response = self.client.embeddings.create(
+                    input=texts, model=self.model_name
+                )
+                break
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"Transient error embedding documents, retrying [{attempt}/{self.max_retries}]: {e}"
+                )
+                time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+
+        # set response to json
+        data = json.loads(response.json())["data"]
+        # return embeddings in input order
+        data.sort(key=lambda embd: embd.get("index", 0))
+        return [embd["embedding"] for embd in data]
 
     def embed_documents(
         self, texts: List[str], handle_overflow: bool = False
     ) -> List[List[float]]:
         """Embed search documents."""
-        if handle_overflow:
-            texts = [self.trim_text_if_needed(text) for text in texts]
+        if not texts:
+            return []
 
         try:
-            # grab embeddings
-            response = self.client.embeddings.create(input=texts, model=self.model_name)
-            # set response to json
-            response = json.loads(response.json())
-            # return embeddings
-            return [embd["embedding"] for embd in response["data"]]
+            if handle_overflow:
+                texts, token_counts = self.trim_texts(texts)
+            elif self.max_batch_tokens:
+                token_counts = [len(ids) for ids in self.tokenize(texts)]
+            else:
+                token_counts = [0] * len(texts)
+
+            batches = [
+                texts[start:end] for start, end in self.batch_ranges(token_counts)
+            ]
+
+            if len(batches) == 1 or self.max_workers <= 1:
+                results = [self.embed_batch(batch) for batch in batches]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(batches))
+                ) as executor:
+                    # map yields results in submission order
+                    results = list(executor.map(self.embed_batch, batches))
+
+            return [embedding for result in results for embedding in result]
         except Exception as e:
             # Handle potential errors
             print(f"Error embedding documents: {e}")
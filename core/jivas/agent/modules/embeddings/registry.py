@@ -0,0 +1,76 @@
+"""Process-wide registries for embedding models and tokenizers."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from transformers import AutoTokenizer
+
+_tokenizers: Dict[str, Any] = {}
+_tokenizer_locks: Dict[str, threading.Lock] = {}
+_tokenizers_lock = threading.Lock()
+
+_embedding_models: Dict[str, Tuple[Hashable, Any]] = {}
+_embedding_model_locks: Dict[str, threading.Lock] = {}
+_embedding_models_lock = threading.Lock()
+
+
+def _key_lock(
+    locks: Dict[str, threading.Lock], guard: threading.Lock, key: str
+) -> threading.Lock:
+    """Return the lock serializing loads for key, so loads of other keys run concurrently."""
+    with guard:
+        return locks.setdefault(key, threading.Lock())
+
+
+def get_tokenizer(model: str) -> Any:
+    """Return the tokenizer for a model, loading it once per process."""
+    if (tokenizer := _tokenizers.get(model)) is not None:
+        return tokenizer
+
+    with _key_lock(_tokenizer_locks, _tokenizers_lock, model):
+        if (tokenizer := _tokenizers.get(model)) is None:
+            tokenizer = AutoTokenizer.from_pretrained(model)
+            with _tokenizers_lock:
+                _tokenizers[model] = tokenizer
+        return tokenizer
+
+
+def clear_tokenizers() -> None:
+    """Drop all loaded tokenizers."""
+    with _tokenizers_lock:
+        _tokenizers.clear()
+
+
+def get_embedding_model(
+    owner: str, config: Hashable, factory: Callable[[], Any]
+) -> Any:
+    """Return the embedding model built for owner, rebuilding it only when config changes.
+
+    Args:
+        owner: Identifier of the model's owner, e.g. the id of a vector store action.
+        config: Hashable settings the model was built from (provider, endpoint, model, key...).
+        factory: Builds a new model; its result is not registered if it is None.
+
+    Builds are serialized per owner only, so a slow build (e.g. a model download) does
+    not hold up the lookups and builds of other owners.
+    """
+    if (entry := _embedding_models.get(owner)) and entry[0] == config:
+        return entry[1]
+
+    with _key_lock(_embedding_model_locks, _embedding_models_lock, owner):
+        if (entry := _embedding_models.get(owner)) and entry[0] == config:
+            return entry[1]
+
+        model = factory()
+        with _embedding_models_lock:
+            if model is not None:
+                _embedding_models[owner] = (config, model)
+            else:
+                _embedding_models.pop(owner, None)
+        return model
+
+
+def release_embedding_model(owner: str) -> None:
+    """Drop the embedding model registered for owner so that it is rebuilt on next use."""
+    with _embedding_models_lock:
+        _embedding_models.pop(owner, None)
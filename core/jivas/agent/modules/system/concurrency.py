@@ -0,0 +1,29 @@
+"""Utilities for running asynchronous code from synchronous abilities."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code and return its result.
+
+    The coroutine always runs on a new event loop, never on the caller's: in the calling
+    thread when it has no running loop (as in jac-cloud walker endpoints, which run on
+    FastAPI's threadpool), otherwise in a worker thread, with a copy of the caller's
+    context so that context-bound state (e.g. the Jac execution context) remains
+    available.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    def run() -> T:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(copy_context().run, run).result()
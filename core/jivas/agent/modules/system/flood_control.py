@@ -0,0 +1,102 @@
+"""Flood control backed by atomic Redis counters."""
+
+import logging
+import os
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+"""
+# counts messages per agent and session in a fixed window, blocking senders over the threshold
+flood_control = RedisFloodControl()
+if flood_control.is_flood_active(f"{agent_id}:{session_id}", threshold=4, window_time=20, block_time=300):
+    ...  # reject the message
+"""
+
+
+class RedisFloodControl:
+    """Flood control shared across processes, using Redis INCR on expiring keys.
+
+    Each key gets a message counter which lives for window_time seconds from the first
+    message in the window, and a block marker which lives for block_time seconds once the
+    counter goes over the threshold. Counting and the block check are done in a single
+    MULTI/EXEC round trip, so concurrent requests for the same session are counted exactly.
+    """
+
+    def __init__(self, client: Any = None, prefix: str = "jivas:flood:") -> None:
+        """Initialize with a redis client, defaulting to the jac-cloud connection."""
+        if client is None:
+            from jac_cloud.jaseci.datasources.redis import Redis
+
+            client = Redis().get_rd()
+        self.client = client
+        self.prefix = prefix
+
+    def is_flood_active(
+        self, key: str, threshold: int, window_time: int, block_time: int
+    ) -> bool:
+        """Count a message for key and return True if flood control is in effect for it.
+
+        Args:
+            key: Identifies the sender, e.g. the agent and session ids.
+            threshold: Messages allowed per window; the message after them is blocked.
+            window_time: Length of the counting window in seconds; 0 disables flood control.
+            block_time: Seconds a sender stays blocked once over the threshold; with 0,
+                messages are only blocked until the window ends.
+        """
+        # redis rejects SET with EX 0
+        if window_time <= 0:
+            return False
+
+        block_key = f"{self.prefix}block:{key}"
+        count_key = f"{self.prefix}count:{key}"
+
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.exists(block_key)
+        # SET NX starts a window with its expiry; INCR keeps the expiry of an open one
+        pipeline.set(count_key, 0, ex=window_time, nx=True)
+        pipeline.incr(count_key)
+        blocked, _, count = pipeline.execute()
+
+        if blocked:
+            return True
+        if int(count) > threshold:
+            if block_time <= 0:
+                return True
+            pipeline = self.client.pipeline(transaction=True)
+            pipeline.set(block_key, 1, ex=block_time)
+            pipeline.delete(count_key)
+            pipeline.execute()
+            return True
+        return False
+
+    def reset(self, key: str) -> None:
+        """Clear the counter and any block for key."""
+        self.client.delete(f"{self.prefix}block:{key}", f"{self.prefix}count:{key}")
+
+
+_default_flood_control: Optional[RedisFloodControl] = None
+_default_flood_control_lock = threading.Lock()
+_default_flood_control_loaded = False
+
+
+def get_flood_control() -> Optional[RedisFloodControl]:
+    """Return the shared flood control, or None to track floods on the frame.
+
+    Setting JIVAS_FLOOD_CONTROL_STORE to "redis" counts messages in Redis; otherwise, or
+    if Redis is unavailable, the interact walker falls back to the frame's data.
+    """
+    global _default_flood_control, _default_flood_control_loaded
+
+    with _default_flood_control_lock:
+        if not _default_flood_control_loaded:
+            _default_flood_control_loaded = True
+            store_type = os.environ.get("JIVAS_FLOOD_CONTROL_STORE", "").lower()
+            if store_type == "redis":
+                try:
+                    _default_flood_control = RedisFloodControl()
+                except Exception as e:
+                    logger.error(f"Unable to initialize redis flood control: {e}")
+
+        return _default_flood_control
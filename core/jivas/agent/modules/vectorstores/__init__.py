@@ -0,0 +1 @@
+"""Vector store utils package"""
@@ -0,0 +1,842 @@
+"""Local vector store backed by a NumPy float32 matrix."""
+
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from langchain_core.vectorstores.utils import maximal_marginal_relevance
+
+logger = logging.getLogger(__name__)
+
+"""
+# an index persisted under .jvdata/vectors/agent; vectors are memory-mapped on load
+index = get_local_vector_index(".jvdata/vectors/agent", metric="cosine")
+index.upsert([{"id": "1", "text": "hello", "metadata": {"lang": "en"}, "vec": [0.1, 0.2]}])
+index.search([0.1, 0.2], k=5, filter="metadata.lang:=en")
+
+# batch writes and save once
+with index.deferred_save():
+    for batch in batches:
+        index.upsert(batch)
+
+# train the inverted file index up front, e.g. after a bulk import, instead of in the background
+index.build_ivf()
+
+# as a langchain vectorstore
+store = LocalVectorStore(index, OpenAIEmbeddings())
+store.similarity_search_with_score("hello", k=3)
+"""
+
+METRICS = ("cosine", "dot")
+INDEX_TYPES = ("auto", "flat", "ivf")
+
+_FILTER_CLAUSE = re.compile(r"^\s*([\w.]+)\s*:\s*(!=|=)?\s*(.+?)\s*$")
+
+
+def _filter_values(raw: str) -> List[str]:
+    """Parse the value of a filter clause: a single value or a [a, b] list."""
+    if raw.startswith("[") and raw.endswith("]"):
+        values = raw[1:-1].split(",")
+    else:
+        values = [raw]
+    return [value.strip().strip("`'\"") for value in values]
+
+
+def _value_matches(value: Any, expected: str) -> bool:
+    """Check whether a stored field value matches a filter value."""
+    if isinstance(value, (list, tuple, set)):
+        return any(_value_matches(item, expected) for item in value)
+    if isinstance(value, bool):
+        return str(value).lower() == expected.lower()
+    return str(value) == expected
+
+
+def _resolve(doc: dict, path: List[str]) -> Any:
+    """Resolve a dotted field path on a stored document."""
+    value: Any = doc
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compile_filter(filter: Any) -> Optional[Callable[[dict], bool]]:
+    """Compile a document filter into a predicate over stored documents.
+
+    Accepts a callable, a dict of metadata values to match exactly, or a filter_by style
+    expression of && joined equality clauses, e.g. "metadata.document_type:!=cache_response"
+    or "metadata.tags:=[a, b]". Fields without a metadata., id or text prefix refer to metadata.
+    """
+    if not filter:
+        return None
+    if callable(filter):
+        return filter
+    if isinstance(filter, dict):
+        items = list(filter.items())
+        return lambda doc: all(
+            doc["metadata"].get(key) == value for key, value in items
+        )
+
+    clauses = []
+    for clause in str(filter).split("&&"):
+        match = _FILTER_CLAUSE.match(clause)
+        if not match or match.group(3)[0] in "<>":
+            raise ValueError(f"Unsupported filter clause: {clause.strip()!r}")
+        field, operator, raw = match.groups()
+        path = field.split(".")
+        if path[0] not in ("metadata", "id", "text"):
+            path = ["metadata", *path]
+        clauses.append((path, operator == "!=", _filter_values(raw)))
+
+    def predicate(doc: dict) -> bool:
+        for path, negate, values in clauses:
+            value = _resolve(doc, path)
+            if any(_value_matches(value, expected) for expected in values) == negate:
+                return False
+        return True
+
+    return predicate
+
+
+class LocalVectorIndex:
+    """An in-process vector index persisted as a .npy matrix with a JSONL document sidecar.
+
+    Vectors are kept as rows of a float32 matrix which grows geometrically; deletes move the
+    last row into the freed slot. Queries are scored exactly with a single matrix product,
+    or, once the index holds ivf_threshold documents (index_type "auto") or always (index_type
+    "ivf"), through an inverted file index which only scores the rows of the ivf_nprobe lists
+    closest to the query. The inverted file index is trained by build_ivf, or on a background
+    thread once a search needs it; searches stay exact until it is ready and while it is
+    retrained as the index grows. Saved matrices are memory-mapped on load and copied into
+    memory on the first write. Scores are distances: 1 - cosine similarity, or 1 - dot product.
+
+    Writes are saved by a background timer at most save_interval seconds after they are
+    made, and at exit, rather than rewriting the files on every write; autosave=True saves
+    synchronously after each write instead, and a save_interval of 0 leaves saving to the
+    caller.
+    """
+
+    def __init__(
+        self,
+        path: str = "",
+        metric: str = "cosine",
+        index_type: str = "auto",
+        ivf_threshold: int = 100000,
+        ivf_nprobe: int = 8,
+        autosave: bool = False,
+        save_interval: float = 5.0,
+    ) -> None:
+        """Initialize the index, loading any previously saved state from path."""
+        self.path = path
+        self.autosave = autosave
+        self.save_interval = save_interval
+        self._lock = threading.RLock()
+        self._defer = 0
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._ivf_thread: Optional[threading.Thread] = None
+        self._reset()
+        self.configure(metric, index_type, ivf_threshold, ivf_nprobe)
+        if path:
+            self.load()
+
+    def _reset(self, dimension: int = 0) -> None:
+        """Drop all documents, vectors and index structures."""
+        self._vectors: np.ndarray = np.empty((0, dimension), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._lists = np.empty(0, dtype=np.int32)
+        self._count = 0
+        self._ids: List[str] = []
+        self._docs: List[dict] = []
+        self._rows: Dict[str, int] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._ivf_size = 0
+
+    def configure(
+        self,
+        metric: str = "cosine",
+        index_type: str = "auto",
+        ivf_threshold: int = 100000,
+        ivf_nprobe: int = 8,
+    ) -> None:
+        """Set the scoring metric and index policy."""
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unsupported metric {metric!r}, expected one of {METRICS}"
+            )
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unsupported index type {index_type!r}, expected one of {INDEX_TYPES}"
+            )
+        with self._lock:
+            if getattr(self, "metric", metric) != metric:
+                # centroids are trained for a metric
+                self._centroids = None
+            self.metric = metric
+            self.index_type = index_type
+            self.ivf_threshold = ivf_threshold
+            self.ivf_nprobe = ivf_nprobe
+
+    def __len__(self) -> int:
+        """Return the number of documents in the index."""
+        return self._count
+
+    @property
+    def dimension(self) -> int:
+        """Return the dimension of the stored vectors, or 0 if unknown."""
+        return self._vectors.shape[1]
+
+    # persistence
+
+    def _files(self) -> Tuple[str, str]:
+        return (
+            os.path.join(self.path, "vectors.npy"),
+            os.path.join(self.path, "documents.jsonl"),
+        )
+
+    def load(self) -> None:
+        """Load the saved index, memory-mapping its vectors."""
+        vectors_path, documents_path = self._files()
+        if not os.path.exists(documents_path):
+            return
+
+        with open(documents_path, encoding="utf-8") as file:
+            docs = [json.loads(line) for line in file if line.strip()]
+
+        with self._lock:
+            self._reset()
+            if not docs:
+                return
+            vectors = np.load(vectors_path, mmap_mode="r")
+            if len(vectors) != len(docs):
+                raise ValueError(
+                    f"Vector index at {self.path} is inconsistent: {len(vectors)} vectors for {len(docs)} documents"
+                )
+            self._vectors = vectors
+            self._norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+            self._lists = np.zeros(len(docs), dtype=np.int32)
+            self._count = len(docs)
+            self._ids = [str(doc["id"]) for doc in docs]
+            self._docs = [
+                {"text": doc.get("text", ""), "metadata": doc.get("metadata") or {}}
+                for doc in docs
+            ]
+            self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+
+    def save(self) -> None:
+        """Write the index to its path, replacing the saved files atomically."""
+        if not self.path:
+            return
+
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            vectors_path, documents_path = self._files()
+
+            with open(f"{vectors_path}.tmp", "wb") as file:
+                np.save(file, np.ascontiguousarray(self._vectors[: self._count]))
+            with open(f"{documents_path}.tmp", "w", encoding="utf-8") as file:
+                for doc_id, doc in zip(self._ids, self._docs):
+                    file.write(
+                        json.dumps(
+                            {
+                                "id": doc_id,
+                                "text": doc["text"],
+                                "metadata": doc["metadata"],
+                            }
+                        )
+                        + "\n"
+                    )
+
+            # documents are replaced last; load() only reads the vectors when documents exist
+            os.replace(f"{vectors_path}.tmp", vectors_path)
+            os.replace(f"{documents_path}.tmp", documents_path)
+            self._dirty = False
+
+    @contextmanager
+    def deferred_save(self) -> Generator["LocalVectorIndex", None, None]:
+        """Defer saving until the outermost deferred block exits, e.g. across an import."""
+        with self._lock:
+            self._defer += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._defer -= 1
+                if not self._defer and self._dirty:
+                    self.save()
+
+    def flush(self) -> None:
+        """Save the index if it has unsaved writes."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def _changed(self) -> None:
+        self._dirty = True
+        if self._defer or not self.path:
+            return
+        if self.autosave:
+            self.save()
+        elif self.save_interval and self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_interval, self._timed_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _timed_save(self) -> None:
+        with self._lock:
+            self._save_timer = None
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Unable to save vector index at {self.path}: {e}")
+
+    # writes
+
+    def _reserve(self, extra: int, dimension: int) -> None:
+        """Ensure writable capacity for extra rows of the given dimension."""
+        if dimension != self.dimension:
+            if self._count:
+                raise ValueError(
+                    f"Expected vectors of dimension {self.dimension}, received {dimension}"
+                )
+            self._reset(dimension)
+
+        needed = self._count + extra
+        if needed > len(self._vectors) or not self._vectors.flags.writeable:
+            capacity = max(needed, 2 * len(self._vectors), 64)
+            vectors = np.empty((capacity, dimension), dtype=np.float32)
+            vectors[: self._count] = self._vectors[: self._count]
+            norms = np.empty(capacity, dtype=np.float32)
+            norms[: self._count] = self._norms[: self._count]
+            lists = np.zeros(capacity, dtype=np.int32)
+            lists[: self._count] = self._lists[: self._count]
+            self._vectors, self._norms, self._lists = vectors, norms, lists
+
+    def upsert(self, docs: List[dict]) -> List[str]:
+        """Insert or replace documents with 'vec', 'text', 'metadata' and optional 'id'; returns their ids."""
+        if not docs:
+            return []
+
+        ids = [str(doc.get("id") or uuid4()) for doc in docs]
+        if any(doc.get("vec") is None for doc in docs):
+            raise ValueError("Documents require a 'vec' embedding")
+        vectors = np.asarray([doc["vec"] for doc in docs], dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("Documents require embeddings of a single dimension")
+
+        with self._lock:
+            self._reserve(len(docs), vectors.shape[1])
+            rows = []
+            for doc_id, doc in zip(ids, docs):
+                row = self._rows.get(doc_id)
+                if row is None:
+                    row = self._count
+                    self._count += 1
+                    self._rows[doc_id] = row
+                    self._ids.append(doc_id)
+                    self._docs.append({})
+                self._docs[row] = {
+                    "text": str(doc.get("text", "")),
+                    "metadata": dict(doc.get("metadata") or {}),
+                }
+                rows.append(row)
+
+            self._vectors[rows] = vectors
+            self._norms[rows] = np.linalg.norm(vectors, axis=1)
+            if self._centroids is not None:
+                self._lists[rows] = self._nearest_lists(vectors)
+            self._changed()
+
+        return ids
+
+    def update(self, id: str, data: dict) -> Optional[dict]:
+        """Update the text, metadata and/or vector of a document; returns the updated document."""
+        with self._lock:
+            if (row := self._rows.get(id)) is None:
+                return None
+            doc = {
+                "id": id,
+                "text": data.get("text", self._docs[row]["text"]),
+                "metadata": data.get("metadata", self._docs[row]["metadata"]),
+                "vec": (
+                    data.get("vec")
+                    if data.get("vec") is not None
+                    else self._vectors[row]
+                ),
+            }
+            self.upsert([doc])
+            return self.get(id)
+
+    def remove(self, id: str) -> Optional[dict]:
+        """Remove a document; returns the removed document."""
+        with self._lock:
+            if (doc := self.get(id)) is None:
+                return None
+            self.delete([id])
+            return doc
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove documents by id; returns the number removed."""
+        removed = 0
+        with self._lock:
+            for id in ids:
+                if (row := self._rows.pop(id, None)) is None:
+                    continue
+                if not removed:
+                    self._reserve(0, self.dimension)
+                last = self._count - 1
+                if row != last:
+                    # move the last row into the freed slot
+                    self._vectors[row] = self._vectors[last]
+                    self._norms[row] = self._norms[last]
+                    self._lists[row] = self._lists[last]
+                    self._ids[row] = self._ids[last]
+                    self._docs[row] = self._docs[last]
+                    self._rows[self._ids[row]] = row
+                self._ids.pop()
+                self._docs.pop()
+                self._count -= 1
+                removed += 1
+
+            if removed:
+                self._changed()
+        return removed
+
+    def clear(self) -> None:
+        """Remove all documents, including the saved files."""
+        with self._lock:
+            self._reset()
+            self._dirty = False
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self.path:
+                for path in self._files():
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    # reads
+
+    def _document(self, row: int, with_embeddings: bool = False) -> dict:
+        doc = {
+            "id": self._ids[row],
+            "text": self._docs[row]["text"],
+            "metadata": dict(self._docs[row]["metadata"]),
+        }
+        if with_embeddings:
+            doc["vec"] = self._vectors[row].tolist()
+        return doc
+
+    def get(self, id: str, with_embeddings: bool = False) -> Optional[dict]:
+        """Return a document by id."""
+        with self._lock:
+            if (row := self._rows.get(id)) is None:
+                return None
+            return self._document(row, with_embeddings)
+
+    def list_documents(
+        self, page: int = 1, per_page: int = 10, with_embeddings: bool = False
+    ) -> dict:
+        """Return a page of documents."""
+        with self._lock:
+            start = max(page - 1, 0) * per_page
+            rows = range(start, min(start + per_page, self._count))
+            return {
+                "page": page,
+                "per_page": per_page,
+                "total": self._count,
+                "documents": [self._document(row, with_embeddings) for row in rows],
+            }
+
+    def metadata_search(self, metadata: Any, k: int = 10) -> List[dict]:
+        """Return up to k documents matching a metadata dict or filter expression."""
+        predicate = compile_filter(metadata)
+        with self._lock:
+            rows = self._filter_rows(predicate, np.arange(self._count))
+            return [self._document(row) for row in rows[:k]]
+
+    def vectors(self, ids: List[str]) -> np.ndarray:
+        """Return the vectors of documents by id."""
+        with self._lock:
+            return np.array(self._vectors[[self._rows[id] for id in ids]])
+
+    def _filter_rows(
+        self, predicate: Optional[Callable[[dict], bool]], rows: np.ndarray
+    ) -> np.ndarray:
+        if predicate is None:
+            return rows
+        return np.fromiter(
+            (
+                row
+                for row in rows
+                if predicate(
+                    {
+                        "id": self._ids[row],
+                        "text": self._docs[row]["text"],
+                        "metadata": self._docs[row]["metadata"],
+                    }
+                )
+            ),
+            dtype=np.int64,
+        )
+
+    def _similarities(
+        self, query: np.ndarray, rows: Optional[np.ndarray]
+    ) -> np.ndarray:
+        vectors = self._vectors[: self._count] if rows is None else self._vectors[rows]
+        similarities = vectors @ query
+        if self.metric == "cosine":
+            norms = self._norms[: self._count] if rows is None else self._norms[rows]
+            similarities /= np.maximum(norms * np.linalg.norm(query), 1e-12)
+        return similarities
+
+    def search(
+        self, vector: List[float], k: int = 4, filter: Any = None
+    ) -> List[Tuple[dict, float]]:
+        """Return up to k (document, distance) pairs nearest to vector, closest first."""
+        predicate = compile_filter(filter)
+        query = np.asarray(vector, dtype=np.float32)
+
+        with self._lock:
+            if not self._count or k <= 0:
+                return []
+            if query.shape != (self.dimension,):
+                raise ValueError(
+                    f"Expected a query vector of dimension {self.dimension}, received {query.shape}"
+                )
+
+            rows: Optional[np.ndarray] = None
+            if self._use_ivf() and not self._ivf_ready():
+                # search exactly while the inverted file index is trained
+                self._build_ivf_in_background()
+            elif self._use_ivf():
+                rows = self._filter_rows(predicate, self._probe(query))
+                if len(rows) < k:
+                    # too few candidates in the probed lists; fall back to an exact scan
+                    rows = None
+            if rows is None and predicate is not None:
+                rows = self._filter_rows(predicate, np.arange(self._count))
+            if rows is not None and not len(rows):
+                return []
+
+            similarities = self._similarities(query, rows)
+            k = min(k, len(similarities))
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top], kind="stable")]
+
+            return [
+                (
+                    self._document(int(index if rows is None else rows[index])),
+                    float(1.0 - similarities[index]),
+                )
+                for index in top
+            ]
+
+    # inverted file index
+
+    def _use_ivf(self) -> bool:
+        return self.index_type == "ivf" or (
+            self.index_type == "auto" and self._count >= self.ivf_threshold
+        )
+
+    def _unit(self, vectors: np.ndarray) -> np.ndarray:
+        if self.metric != "cosine":
+            return vectors
+        return vectors / np.maximum(
+            np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12
+        )
+
+    def _nearest_lists(self, vectors: np.ndarray) -> np.ndarray:
+        assert self._centroids is not None
+        lists = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), 8192):
+            chunk = self._unit(np.asarray(vectors[start : start + 8192]))
+            lists[start : start + len(chunk)] = np.argmax(
+                chunk @ self._centroids.T, axis=1
+            )
+        return lists
+
+    def _ivf_ready(self) -> bool:
+        """Return True if the inverted file index is trained and not outgrown."""
+        return self._centroids is not None and self._count <= 2 * self._ivf_size
+
+    def _build_ivf_in_background(self) -> None:
+        """Start training the inverted file index on a worker thread, unless already training."""
+        if self._ivf_thread is not None and self._ivf_thread.is_alive():
+            return
+        self._ivf_thread = threading.Thread(
+            target=self._background_build_ivf, name="ivf-build", daemon=True
+        )
+        self._ivf_thread.start()
+
+    def _background_build_ivf(self) -> None:
+        try:
+            self.build_ivf()
+        except Exception as e:
+            logger.error(f"Unable to build the inverted file index at {self.path}: {e}")
+
+    def build_ivf(
+        self,
+        n_lists: int = 0,
+        iterations: int = 10,
+        sample_size: int = 0,
+        seed: int = 0,
+    ) -> None:
+        """Train the inverted file index with k-means over a sample of the vectors.
+
+        n_lists defaults to sqrt(n) and sample_size to 256 vectors per list. k-means runs
+        on a copy of the sample outside the index lock, so searches and writes proceed
+        meanwhile; only assigning the rows to their lists holds the lock.
+        """
+        with self._lock:
+            if not self._count:
+                return
+            metric = self.metric
+            n_lists = min(n_lists or max(int(np.sqrt(self._count)), 1), self._count)
+            rng = np.random.default_rng(seed)
+            size = min(self._count, sample_size or n_lists * 256)
+            sample = self._unit(
+                np.array(
+                    self._vectors[np.sort(rng.choice(self._count, size, replace=False))]
+                )
+            )
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=n_lists)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+            centroids = self._unit(centroids)
+
+        with self._lock:
+            if (
+                not self._count
+                or self.metric != metric
+                or centroids.shape[1] != self.dimension
+            ):
+                # cleared, reconfigured or rebuilt with another dimension meanwhile
+                return
+            self._reserve(0, self.dimension)
+            self._centroids = centroids.astype(np.float32)
+            self._lists[: self._count] = self._nearest_lists(
+                self._vectors[: self._count]
+            )
+            self._ivf_size = self._count
+
+    def _probe(self, query: np.ndarray) -> np.ndarray:
+        """Return the rows of the lists closest to the query."""
+        assert self._centroids is not None
+
+        scores = self._centroids @ self._unit(query[None, :])[0]
+        nprobe = min(self.ivf_nprobe, len(scores))
+        probed = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return np.flatnonzero(np.isin(self._lists[: self._count], probed))
+
+
+_indexes: Dict[str, LocalVectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_local_vector_index(path: str, **options: Any) -> LocalVectorIndex:
+    """Return the process-wide index stored at path, loading it on first use.
+
+    options (metric, index_type, ivf_threshold, ivf_nprobe) are applied to the index.
+    """
+    key = os.path.abspath(path)
+    with _indexes_lock:
+        if (index := _indexes.get(key)) is None:
+            index = _indexes[key] = LocalVectorIndex(path, **options)
+        elif options:
+            index.configure(**options)
+        return index
+
+
+def release_local_vector_index(path: str) -> None:
+    """Drop the process-wide index stored at path, e.g. after deleting it, saving unsaved writes."""
+    with _indexes_lock:
+        index = _indexes.pop(os.path.abspath(path), None)
+    if index is not None:
+        index.flush()
+
+
+@atexit.register
+def flush_local_vector_indexes() -> None:
+    """Save every process-wide index with unsaved writes."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        try:
+            index.flush()
+        except Exception as e:
+            logger.error(f"Unable to save vector index at {index.path}: {e}")
+
+
+class LocalVectorStore(VectorStore):
+    """LangChain vectorstore over a LocalVectorIndex."""
+
+    def __init__(self, index: LocalVectorIndex, embedding: Embeddings) -> None:
+        """Initialize the vectorstore with its index and embedding model."""
+        self.index = index
+        self.embedding = embedding
+
+    @property
+    def embeddings(self) -> Embeddings:
+        """Return the embedding model."""
+        return self.embedding
+
+    @staticmethod
+    def _to_document(doc: dict) -> Document:
+        return Document(
+            page_content=doc["text"], metadata=doc["metadata"], id=doc["id"]
+        )
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Embed texts and add them to the index."""
+        texts = list(texts)
+        vectors = self.embedding.embed_documents(texts)
+        if len(vectors) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} embeddings, received {len(vectors)}"
+            )
+
+        return self.index.upsert(
+            [
+                {
+                    "id": ids[i] if ids and i < len(ids) else None,
+                    "text": text,
+                    "metadata": (
+                        metadatas[i] if metadatas and i < len(metadatas) else {}
+                    ),
+                    "vec": vector,
+                }
+                for i, (text, vector) in enumerate(zip(texts, vectors))
+            ]
+        )
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        """Delete documents by id."""
+        if ids is None:
+            return False
+        self.index.delete(ids)
+        return True
+
+    def get_by_ids(self, ids: Iterable[str], /) -> List[Document]:
+        """Return the documents found for ids."""
+        return [
+            self._to_document(doc)
+            for id in ids
+            if (doc := self.index.get(id)) is not None
+        ]
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: Any = None, **kwargs: Any
+    ) -> List[Document]:
+        """Return the documents most similar to query."""
+        return [
+            doc
+            for doc, _ in self.similarity_search_with_score(query, k, filter, **kwargs)
+        ]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: Any = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """Return the documents most similar to query with their distances."""
+        return self.similarity_search_with_score_by_vector(
+            self.embedding.embed_query(query), k, filter, **kwargs
+        )
+
+    def similarity_search_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Any = None, **kwargs: Any
+    ) -> List[Document]:
+        """Return the documents most similar to an embedding."""
+        return [
+            doc
+            for doc, _ in self.similarity_search_with_score_by_vector(
+                embedding, k, filter, **kwargs
+            )
+        ]
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Any = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """Return the documents most similar to an embedding with their distances."""
+        return [
+            (self._to_document(doc), score)
+            for doc, score in self.index.search(embedding, k, filter)
+        ]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        return lambda distance: 1.0 - distance
+
+    def max_marginal_relevance_search(
+        self,
+        query: str,
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: Any = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """Return documents selected by maximal marginal relevance to query."""
+        return self.max_marginal_relevance_search_by_vector(
+            self.embedding.embed_query(query), k, fetch_k, lambda_mult, filter, **kwargs
+        )
+
+    def max_marginal_relevance_search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: Any = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """Return documents selected by maximal marginal relevance to an embedding."""
+        # VectorStoreAction passes lamda_mult
+        lambda_mult = kwargs.pop("lamda_mult", lambda_mult)
+        if not (hits := self.index.search(embedding, fetch_k, filter)):
+            return []
+
+        selected = maximal_marginal_relevance(
+            np.asarray(embedding, dtype=np.float32),
+            list(self.index.vectors([doc["id"] for doc, _ in hits])),
+            lambda_mult=lambda_mult,
+            k=k,
+        )
+        return [self._to_document(hits[i][0]) for i in selected]
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> "LocalVectorStore":
+        """Create a vectorstore over a new index (in memory unless a path is given) from texts."""
+        store = cls(LocalVectorIndex(**kwargs), embedding)
+        store.add_texts(texts, metadatas, ids=ids)
+        return store
@@ -61,6 +61,7 @@ setup(
         "setuptools==80.9.0",
         "transformers==4.57.1",
         "ftfy==6.3.1",
+        "numpy==2.2.6",
     ],
     extras_require={
         "dev": [
@@ -9,10 +9,15 @@ import os
 import shutil
 import tempfile
 import unittest
+from dataclasses import dataclass, field
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
-from jivas.agent.modules.action.cleaning import clean_action, clean_context
+from jivas.agent.modules.action.cleaning import (
+    clean_action,
+    clean_context,
+    get_archetype_context,
+)
 
 
 class TestCleanAction(unittest.TestCase):
@@ -297,6 +302,80 @@ class TestCleanContext(unittest.TestCase):
         # The field should be removed because normalized strings match
         self.assertNotIn("text_field", result)
 
+    @patch("jivas.agent.modules.action.cleaning.normalize_text")
+    def test_clean_context_skips_normalizing_identical_strings(
+        self, mock_normalize: MagicMock
+    ) -> None:
+        """Test that identical strings are removed without normalization."""
+        node_context = {"prompt": "You are a helpful agent."}
+        archetype_context = {"prompt": "You are a helpful agent."}
+
+        result = clean_context(node_context, archetype_context, [])
+
+        mock_normalize.assert_not_called()
+        self.assertEqual(result, {})
+
+    @patch("jivas.agent.modules.action.cleaning.normalize_text")
+    def test_clean_context_with_normalized_context(
+        self, mock_normalize: MagicMock
+    ) -> None:
+        """Test that supplied normalized defaults are not normalized again."""
+        node_context = {"text_field": "  Test Text  "}
+        archetype_context = {"text_field": "test text"}
+        mock_normalize.return_value = "testtext"
+
+        result = clean_context(
+            node_context,
+            archetype_context,
+            [],
+            normalized_context={"text_field": "testtext"},
+        )
+
+        mock_normalize.assert_called_once_with("  Test Text  ")
+        self.assertNotIn("text_field", result)
+
+
+class TestGetArchetypeContext(unittest.TestCase):
+    """Test cases for the get_archetype_context function."""
+
+    def test_get_archetype_context_is_computed_once(self) -> None:
+        """Test that defaults, factories and normalization run once per class."""
+        factory = MagicMock(return_value=["item"])
+
+        @dataclass
+        class Archetype:
+            required: str
+            prompt: str = "  Hello, World!  "
+            count: int = 3
+            items: list = field(default_factory=factory)
+
+        archetype_context, normalized_context = get_archetype_context(Archetype)
+
+        self.assertEqual(
+            archetype_context,
+            {"prompt": "  Hello, World!  ", "count": 3, "items": ["item"]},
+        )
+        self.assertEqual(normalized_context, {"prompt": "HelloWorld"})
+
+        with patch("jivas.agent.modules.action.cleaning.normalize_text") as mock:
+            self.assertIs(get_archetype_context(Archetype)[0], archetype_context)
+            mock.assert_not_called()
+        factory.assert_called_once()
+
+    def test_get_archetype_context_per_subclass(self) -> None:
+        """Test that subclasses get their own defaults."""
+
+        @dataclass
+        class Base:
+            name: str = "base"
+
+        @dataclass
+        class Derived(Base):
+            name: str = "derived"
+
+        self.assertEqual(get_archetype_context(Base)[0], {"name": "base"})
+        self.assertEqual(get_archetype_context(Derived)[0], {"name": "derived"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@
 from typing import Any, Dict
 
 from jivas.agent.modules.action.interview_interact_action_utils import (
+    compile_conditional_expression,
     evaluate_conditional_expression,
     evaluate_single_condition,
     parse_condition_string,
@@ -364,3 +365,39 @@ class TestEvaluateConditionalExpression:
 
         expr = "  name = John  &&  age > 20  "
         assert evaluate_conditional_expression(expr, responses) is True
+
+    def test_evaluate_fully_parenthesized_expression(self) -> None:
+        """Test evaluating an expression wrapped entirely in parentheses."""
+        responses = {"a": "1", "b": "2"}
+
+        assert evaluate_conditional_expression("(a = 1)", responses) is True
+        assert evaluate_conditional_expression("((a = 1 && b = 2))", responses) is True
+        assert evaluate_conditional_expression("(a = 2)", responses) is False
+
+    def test_evaluate_unopened_closing_parenthesis(self) -> None:
+        """Test that a ')' with no '(' open is part of the condition value."""
+        responses = {"a": "x)"}
+
+        assert evaluate_conditional_expression("a = x)", responses) is True
+        assert evaluate_conditional_expression("(a = 1) b", responses) is False
+
+
+class TestCompileConditionalExpression:
+    """Test the compile_conditional_expression function."""
+
+    def test_compiled_expression_is_cached(self) -> None:
+        """Test that an expression is compiled once and reused."""
+        expr = "age >= 18 && (country: [US, CA] || vip = true)"
+        condition = compile_conditional_expression(expr)
+
+        assert compile_conditional_expression(expr) is condition
+        assert condition({"age": "30", "country": "CA"}) is True
+        assert condition({"age": "30", "country": "DE", "vip": "false"}) is False
+        assert condition({"age": "12", "country": "US"}) is False
+
+    def test_compiled_expression_with_invalid_numbers(self) -> None:
+        """Test that comparisons against non-numeric values evaluate to False."""
+        condition = compile_conditional_expression("age > 18 || score: [1..x]")
+
+        assert condition({"age": "unknown", "score": "5"}) is False
+        assert condition({"age": "19"}) is True
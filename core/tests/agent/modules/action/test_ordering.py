@@ -257,6 +257,40 @@ class TestOrderInteractActions(unittest.TestCase):
         result = order_interact_actions(actions)
         self.assert_order(result, ["test/action1", "test/action3", "test/action2"])
 
+    def test_circular_dependency_names_cycle(self) -> None:
+        """Test that the error names the actions on the cycle, skipping others."""
+        actions = [
+            self.create_action("test/action1", order_config={"after": "action3"}),
+            self.create_action("test/action2", order_config={"after": "action1"}),
+            self.create_action("test/action3", order_config={"after": "action2"}),
+            self.create_action("test/action4", order_config={"after": "action3"}),
+        ]
+        with self.assertRaisesRegex(
+            ValueError,
+            "test/action1 -> test/action2 -> test/action3 -> test/action1$",
+        ):
+            order_interact_actions(actions)
+
+    def test_circular_dependency_through_all(self) -> None:
+        """Test that cycles through before:all and after:all constraints are detected."""
+        actions = [
+            self.create_action("test/action1", order_config={"before": "all"}),
+            self.create_action("test/action2"),
+            self.create_action("test/action3", order_config={"after": "all"}),
+            self.create_action("test/action4", order_config={"before": "action1"}),
+        ]
+        with self.assertRaisesRegex(ValueError, "Circular dependency detected"):
+            order_interact_actions(actions)
+
+    def test_before_all_and_after_all_with_many_actions(self) -> None:
+        """Test that all constraints hold with many unconstrained actions."""
+        actions = [self.create_action(f"test/action{i}") for i in range(200)]
+        actions[150]["context"]["_package"]["config"]["order"] = {"before": "all"}
+        actions[10]["context"]["_package"]["config"]["order"] = {"after": "all"}
+        result = order_interact_actions(actions)
+        names = [f"test/action{i}" for i in range(200) if i not in (10, 150)]
+        self.assert_order(result, ["test/action150", *names, "test/action10"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,177 @@
+"""Tests for jivas.agent.modules.action.response_cache."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from jivas.agent.modules.action.response_cache import ResponseCache
+
+
+class FakeCollection:
+    """In-memory stand-in for the pymongo collection methods used by ResponseCache."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collection."""
+        self.docs: Dict[str, dict] = {}
+
+    def matches(self, doc: dict, query: dict) -> bool:
+        """Return True if doc satisfies the equality, $in, $gte and $lt clauses of query."""
+        for field, condition in query.items():
+            value = doc.get(field)
+            if not isinstance(condition, dict):
+                if value != condition:
+                    return False
+                continue
+            values = value if isinstance(value, list) else [value]
+            if "$in" in condition and not set(values) & set(condition["$in"]):
+                return False
+            if "$gte" in condition and not value >= condition["$gte"]:
+                return False
+            if "$lt" in condition and not value < condition["$lt"]:
+                return False
+        return True
+
+    def insert_one(self, doc: dict) -> None:
+        """Insert a document."""
+        self.docs[doc["_id"]] = dict(doc)
+
+    def find(self, query: dict, projection: Optional[dict] = None) -> Iterator[dict]:
+        """Return the documents matching query."""
+        return (dict(doc) for doc in self.docs.values() if self.matches(doc, query))
+
+    def find_one(
+        self, query: dict, projection: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Return the first document matching query, or None."""
+        return next(self.find(query), None)
+
+    def delete_many(self, query: dict) -> Any:
+        """Delete the documents matching query."""
+        stale = [_id for _id, doc in self.docs.items() if self.matches(doc, query)]
+        for _id in stale:
+            del self.docs[_id]
+        return SimpleNamespace(deleted_count=len(stale))
+
+    def count_documents(self, query: dict) -> int:
+        """Return the number of documents matching query."""
+        return len(list(self.find(query)))
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    """Return a response cache over an in-memory collection."""
+    return ResponseCache(FakeCollection())
+
+
+def store(cache: ResponseCache, vector: List[float], name: str, **kwargs: Any) -> str:
+    """Cache response r<name> to query q<name>, sourced from k<name>, in agent/s1."""
+    return cache.store(
+        "agent", "s1", vector, f"q{name}", f"r{name}", [f"k{name}"], **kwargs
+    )
+
+
+class TestResponseCache:
+    """Test class for ResponseCache."""
+
+    def test_lookup_hits_near_duplicates_only(self, cache: ResponseCache) -> None:
+        """Test that lookups hit above the similarity threshold and miss below it."""
+        cache.store("agent", "s1", [1.0, 0.0], "q", "9 to 5", ["k1"], tokens=120)
+
+        entry = cache.lookup("agent", "s1", [0.99, 0.05], threshold=0.95)
+        assert entry is not None
+        assert entry["response"] == "9 to 5"
+        assert entry["query"] == "q"
+        assert entry["sources"] == ["k1"]
+        assert entry["similarity"] >= 0.95
+
+        assert cache.lookup("agent", "s1", [0.5, 0.5], threshold=0.95) is None
+        assert ResponseCache(FakeCollection()).lookup("agent", "s1", [1.0]) is None
+
+    def test_lookup_is_scoped(self, cache: ResponseCache) -> None:
+        """Test that entries are only found by the agent and scope they were stored in."""
+        store(cache, [1.0, 0.0], "1")
+
+        assert cache.lookup("agent", "s1", [1.0, 0.0]) is not None
+        assert cache.lookup("agent", "s2", [1.0, 0.0]) is None
+        assert cache.lookup("other", "s1", [1.0, 0.0]) is None
+
+    def test_shared_across_instances(self, cache: ResponseCache) -> None:
+        """Test that caches over the same collection see each other's changes."""
+        other = ResponseCache(cache.collection)
+        store(cache, [1.0, 0.0], "1")
+
+        assert other.lookup("agent", "s1", [1.0, 0.0])["response"] == "r1"
+        assert other.invalidate("agent", ["k1"]) == 1
+        assert cache.lookup("agent", "s1", [1.0, 0.0]) is None
+
+    def test_stats(self, cache: ResponseCache) -> None:
+        """Test hit ratio and saved token accounting."""
+        store(cache, [1.0, 0.0], "1", tokens=120)
+        cache.lookup("agent", "s1", [1.0, 0.0])
+        cache.lookup("agent", "s1", [1.0, 0.0])
+        cache.lookup("agent", "s1", [0.0, 1.0])
+
+        stats = cache.stats("agent")
+        assert stats["entries"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+        assert stats["saved_tokens"] == 240
+        assert stats["stores"] == 1
+
+        cache.reset_stats()
+        assert cache.stats("agent")["hits"] == 0
+        assert cache.stats("agent")["hit_ratio"] == 0.0
+
+    def test_ttl_expires_entries(
+        self, cache: ResponseCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that entries older than the ttl miss and are removed on the next store."""
+        monkeypatch.setattr("time.time", lambda: 1000.0)
+        store(cache, [1.0, 0.0], "1")
+
+        monkeypatch.setattr("time.time", lambda: 1050.0)
+        assert cache.lookup("agent", "s1", [1.0, 0.0], ttl=100) is not None
+
+        monkeypatch.setattr("time.time", lambda: 1200.0)
+        assert cache.lookup("agent", "s1", [1.0, 0.0], ttl=100) is None
+        store(cache, [0.0, 1.0], "2", ttl=100)
+        assert cache.stats("agent")["entries"] == 1
+
+    def test_invalidate_by_source(self, cache: ResponseCache) -> None:
+        """Test that entries are invalidated with any of their source documents."""
+        cache.store("agent", "s1", [1.0, 0.0], "q1", "r1", ["k1", "k2"])
+        cache.store("agent", "s2", [0.0, 1.0], "q2", "r2", ["k3"])
+
+        assert cache.invalidate("agent", []) == 0
+        assert cache.invalidate("agent", ["k9"]) == 0
+        assert cache.invalidate("other", ["k2"]) == 0
+        assert cache.invalidate("agent", ["k2"]) == 1
+        assert cache.lookup("agent", "s1", [1.0, 0.0]) is None
+        assert cache.lookup("agent", "s2", [0.0, 1.0])["response"] == "r2"
+        assert cache.stats("agent")["invalidations"] == 1
+
+    def test_invalidate_all(self, cache: ResponseCache) -> None:
+        """Test that invalidating without ids removes all of the agent's entries."""
+        store(cache, [1.0, 0.0], "1")
+        cache.store("agent", "s2", [0.0, 1.0], "q2", "r2", ["k2"])
+        cache.store("other", "s1", [0.0, 1.0], "q3", "r3", ["k3"])
+
+        assert cache.invalidate("agent") == 2
+        assert cache.stats("agent")["entries"] == 0
+        assert cache.stats("other")["entries"] == 1
+
+    def test_max_entries_evicts_oldest(
+        self, cache: ResponseCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that storing beyond max_entries evicts the scope's oldest entries."""
+        cache.store("agent", "s2", [1.0, 0.0], "q", "r", ["k"])
+        for i, vector in enumerate(([1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, -1.0])):
+            monkeypatch.setattr("time.time", lambda i=i: 1000.0 + i)
+            store(cache, vector, str(i), max_entries=3)
+
+        assert cache.stats("agent")["entries"] == 4
+        assert cache.lookup("agent", "s1", [1.0, 0.0]) is None
+        assert cache.lookup("agent", "s1", [1.0, -1.0])["response"] == "r3"
+        assert cache.lookup("agent", "s2", [1.0, 0.0]) is not None
@@ -0,0 +1,53 @@
+"""Tests for jivas.agent.modules.action.retrieval."""
+
+from langchain_core.documents import Document
+
+from jivas.agent.modules.action.retrieval import (
+    document_key,
+    merge_documents,
+    merge_scored_documents,
+)
+
+
+class TestRetrieval:
+    """Test class for merging multi-query retrieval results."""
+
+    def test_document_key_prefers_id(self) -> None:
+        """Test that documents are identified by id, falling back to content."""
+        assert document_key(Document(page_content="a", id="1")) == "1"
+        assert document_key(Document(page_content="a", metadata={"id": "2"})) == "2"
+        assert document_key(Document(page_content="a")) == "a"
+
+    def test_merge_scored_documents_dedupes_keeping_best_score(self) -> None:
+        """Test that a document found by several queries is kept once with its best score."""
+        a, b, c = (Document(page_content=text) for text in "abc")
+
+        merged = merge_scored_documents([[(a, 0.2), (b, 0.1)], [(a, 0.05), (c, 0.3)]])
+
+        assert [(doc.page_content, score) for doc, score in merged] == [
+            ("a", 0.05),
+            ("b", 0.1),
+            ("c", 0.3),
+        ]
+
+    def test_merge_scored_documents_applies_threshold_and_limit(self) -> None:
+        """Test that the score threshold and limit apply to the merged results."""
+        a, b, c = (Document(page_content=text) for text in "abc")
+
+        merged = merge_scored_documents(
+            [[(a, 0.1), (c, 0.5)], None, [(b, 0.2)]], score_threshold=0.3, limit=1
+        )
+
+        assert [doc.page_content for doc, _ in merged] == ["a"]
+
+    def test_merge_documents_interleaves_and_dedupes(self) -> None:
+        """Test that ranked results are interleaved across queries without duplicates."""
+        a, b, c, d = (Document(page_content=text) for text in "abcd")
+
+        merged = merge_documents([[a, b, c], [b, d], None])
+
+        assert [doc.page_content for doc in merged] == ["a", "b", "d", "c"]
+        assert [doc.page_content for doc in merge_documents([[a, b], [c]], 2)] == [
+            "a",
+            "c",
+        ]
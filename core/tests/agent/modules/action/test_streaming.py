@@ -0,0 +1,113 @@
+"""Tests for jivas.agent.modules.action.streaming."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, List
+
+from jivas.agent.modules.action.streaming import (
+    TokenStream,
+    chunk_text,
+    chunk_tokens,
+    is_token_stream,
+    keep_result,
+)
+
+
+async def consume(stream: TokenStream) -> List[str]:
+    """Return the pieces of text a stream yields."""
+    return [text async for text in stream]
+
+
+class TestStreamingUtils:
+    """Test the chunk helpers."""
+
+    def test_is_token_stream(self) -> None:
+        """Test that iterators are streams and content values are not."""
+
+        async def agen() -> AsyncIterator[str]:
+            yield "a"
+
+        assert is_token_stream(iter(["a"]))
+        assert is_token_stream(agen())
+        assert not is_token_stream("text")
+        assert not is_token_stream(["a"])
+        assert not is_token_stream(None)
+
+    def test_chunk_text_and_tokens(self) -> None:
+        """Test reading text and usage from strings, dicts and message chunks."""
+        chunk = SimpleNamespace(content="Hi", usage_metadata={"total_tokens": 7})
+
+        assert chunk_text("Hi") == "Hi"
+        assert chunk_text({"content": "Hi"}) == "Hi"
+        assert chunk_text(chunk) == "Hi"
+        assert chunk_text({"content": [{"text": "H"}, {"text": "i"}]}) == "Hi"
+        assert chunk_tokens(chunk) == 7
+        assert chunk_tokens("Hi") == 0
+
+
+class TestTokenStream:
+    """Test class for TokenStream."""
+
+    def test_sync_iterator(self) -> None:
+        """Test that a blocking iterator is streamed, skipping empty chunks, with metrics."""
+        chunks: List[Any] = [
+            "Hel",
+            {"content": ""},
+            SimpleNamespace(content="lo", usage_metadata={"output_tokens": 2}),
+        ]
+        stream = TokenStream(iter(chunks))
+
+        assert asyncio.run(consume(stream)) == ["Hel", "lo"]
+        assert stream.text == "Hello"
+        metrics = stream.metrics()
+        assert metrics["chunks"] == 3
+        assert metrics["tokens"] == 2
+        assert metrics["total_time"] >= metrics["time_to_first_token"] >= 0
+
+    def test_async_iterator(self) -> None:
+        """Test that an async iterator is streamed."""
+
+        async def chunks() -> AsyncIterator[str]:
+            for piece in ["a", "b"]:
+                await asyncio.sleep(0)
+                yield piece
+
+        stream = TokenStream(chunks())
+
+        assert asyncio.run(consume(stream)) == ["a", "b"]
+        assert stream.text == "ab"
+
+    def test_empty_stream(self) -> None:
+        """Test that a stream without text has no time to first token."""
+        stream = TokenStream(iter([]))
+
+        assert asyncio.run(consume(stream)) == []
+        assert stream.metrics()["time_to_first_token"] is None
+
+    def test_read_returns_full_text(self) -> None:
+        """Test that read consumes what remains of the stream and counts its tokens."""
+        chunks: List[Any] = [
+            "Hel",
+            {"content": "lo", "usage_metadata": {"total_tokens": 5}},
+        ]
+        stream = TokenStream(iter(chunks))
+
+        assert asyncio.run(stream.read()) == "Hello"
+        assert stream.tokens == 5
+
+    def test_model_result_kept_with_chunks(self) -> None:
+        """Test that a result kept with sync or async chunks is exposed by the stream."""
+
+        async def chunks() -> AsyncIterator[str]:
+            yield "a"
+
+        result = SimpleNamespace(result=None)
+        for source, text in ((iter(["a", "b"]), "ab"), (chunks(), "a")):
+            kept = keep_result(source, result)
+            stream = TokenStream(kept)
+
+            assert is_token_stream(kept)
+            assert stream.model_result is result
+            assert asyncio.run(stream.read()) == text
+
+        assert TokenStream(iter([])).model_result is None
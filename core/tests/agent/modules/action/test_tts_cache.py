@@ -0,0 +1,164 @@
+"""Tests for jivas.agent.modules.action.tts_cache."""
+
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from jivas.agent.modules.action.tts_cache import TTSCache, tts_cache_key
+
+
+class FakeCollection:
+    """In-memory stand-in for the pymongo collection methods used by TTSCache."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collection."""
+        self.docs: Dict[str, dict] = {}
+
+    def find_one_and_update(
+        self, query: dict, update: dict, projection: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Apply a $set to the document with the queried _id, returning it as it was."""
+        if (doc := self.docs.get(query["_id"])) is None:
+            return None
+        before = dict(doc)
+        doc.update(update["$set"])
+        return before
+
+    def update_one(self, query: dict, update: dict, upsert: bool = False) -> None:
+        """Apply a $set to the document with the queried _id, inserting it if missing."""
+        self.docs.setdefault(query["_id"], {"_id": query["_id"]}).update(update["$set"])
+
+    def find(self, query: dict, projection: Optional[dict] = None) -> Iterator[dict]:
+        """Return the documents of the queried agent."""
+        return (
+            dict(doc)
+            for doc in self.docs.values()
+            if doc.get("agent_id") == query["agent_id"]
+        )
+
+    def find_one(
+        self, query: dict, projection: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Return the document with the queried _id, or None."""
+        doc = self.docs.get(query["_id"])
+        return dict(doc) if doc else None
+
+    def delete_one(self, query: dict) -> None:
+        """Delete the document with the queried _id."""
+        self.docs.pop(query["_id"], None)
+
+    def delete_many(self, query: dict) -> None:
+        """Delete the documents with the queried _ids."""
+        for _id in query["_id"]["$in"]:
+            self.docs.pop(_id, None)
+
+
+@pytest.fixture
+def cache() -> TTSCache:
+    """Return a TTS cache over an in-memory collection."""
+    return TTSCache(FakeCollection())
+
+
+class TestTTSCache:
+    """Test class for TTSCache."""
+
+    def test_cache_key_depends_on_text_and_settings(self) -> None:
+        """Test that keys differ by text and settings but not by settings order."""
+        key = tts_cache_key("hello", {"model": "m", "voice": "v"})
+
+        assert key == tts_cache_key("hello", {"voice": "v", "model": "m"})
+        assert key != tts_cache_key("hello!", {"model": "m", "voice": "v"})
+        assert key != tts_cache_key("hello", {"model": "m", "voice": "w"})
+
+    def test_lookup_after_store(self, cache: TTSCache) -> None:
+        """Test that stored audio is found for its agent only, and counted."""
+        cache.store("agent", "k1", "tts/k1.mp3")
+
+        assert cache.lookup("agent", "k1") == "tts/k1.mp3"
+        assert cache.lookup("agent", "k2") is None
+        assert cache.lookup("other", "k1") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_lookup_misses_expired_entries(self, cache: TTSCache) -> None:
+        """Test that entries older than ttl are misses."""
+        cache.store("agent", "k1", "tts/k1.mp3")
+        cache.collection.docs["agent:k1"]["created"] -= 100
+
+        assert cache.lookup("agent", "k1", ttl=50) is None
+        assert cache.lookup("agent", "k1", ttl=500) == "tts/k1.mp3"
+
+    def test_prune_removes_expired_and_least_recently_used(
+        self, cache: TTSCache
+    ) -> None:
+        """Test that pruning deletes expired files, then the least recently used beyond max_entries."""
+        for key in ["k1", "k2", "k3", "k4"]:
+            cache.store("agent", key, f"tts/{key}.mp3")
+        docs = cache.collection.docs
+        docs["agent:k1"]["created"] -= 1000
+        for i, key in enumerate(["k2", "k3", "k4"]):
+            docs[f"agent:{key}"]["last_used"] = i
+        deleted: List[str] = []
+
+        assert cache.prune("agent", deleted.append, max_entries=2, ttl=500) == 2
+        assert sorted(deleted) == ["tts/k1.mp3", "tts/k2.mp3"]
+        assert sorted(docs) == ["agent:k3", "agent:k4"]
+        assert cache.prune("agent", deleted.append, max_entries=2, ttl=500) == 0
+
+    def test_submit_runs_one_synthesis_per_key(self, cache: TTSCache) -> None:
+        """Test that concurrent submissions for a key share one background synthesis."""
+        release = threading.Event()
+        calls: List[Any] = []
+
+        def synthesize() -> str:
+            calls.append(1)
+            release.wait(5)
+            return "tts/k1.mp3"
+
+        first = cache.submit("agent", "k1", synthesize)
+        assert cache.submit("agent", "k1", synthesize) is first
+        assert cache.is_pending("agent", "k1")
+        assert not cache.is_pending("other", "k1")
+
+        release.set()
+        assert first.result(5) == "tts/k1.mp3"
+        assert calls == [1]
+        # the done callback may run just after result() returns
+        for _ in range(500):
+            if not cache.is_pending("agent", "k1"):
+                break
+            time.sleep(0.01)
+        assert not cache.is_pending("agent", "k1")
+        cache.submit("agent", "k1", synthesize).result(5)
+        assert len(calls) == 2
+
+    def test_pending_is_shared_through_the_collection(self, cache: TTSCache) -> None:
+        """Test that a synthesis in flight is pending for other caches on the collection."""
+        release = threading.Event()
+        other = TTSCache(cache.collection)
+
+        future = cache.submit("agent", "k1", lambda: release.wait(5))
+        assert other.is_pending("agent", "k1")
+        assert cache.lookup("agent", "k1") is None
+        assert cache.prune("agent", lambda path: None, max_entries=1, ttl=1) == 0
+
+        release.set()
+        future.result(5)
+        for _ in range(500):
+            if not other.is_pending("agent", "k1"):
+                break
+            time.sleep(0.01)
+        assert not other.is_pending("agent", "k1")
+
+    def test_stale_pending_markers_are_ignored(self, cache: TTSCache) -> None:
+        """Test that a marker older than the timeout, e.g. of a lost process, is not pending."""
+        cache.collection.update_one(
+            {"_id": "pending:agent:k1"},
+            {"$set": {"started": time.time() - 600}},
+            upsert=True,
+        )
+
+        assert not cache.is_pending("agent", "k1")
+        assert cache.is_pending("agent", "k1", timeout=900)
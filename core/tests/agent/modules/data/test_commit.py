@@ -0,0 +1,101 @@
+"""Tests for jivas.agent.modules.data.commit."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jivas.agent.modules.data import commit as module
+from jivas.agent.modules.data.commit import CommitBuffer, commit, get_commit_buffer
+
+
+def make_anchor(anchor_id: int) -> MagicMock:
+    """Return an anchor stand-in whose build_query records it on the bulk write."""
+    anchor = MagicMock(id=anchor_id)
+    anchor.build_query.side_effect = lambda bulk_write: bulk_write.anchors.append(
+        anchor_id
+    )
+    return anchor
+
+
+@pytest.fixture
+def executed(mocker: MockerFixture) -> list:
+    """Patch BulkWrite and execute_bulk_write; return the anchor ids of each execution."""
+    executions: list = []
+
+    def bulk_write() -> MagicMock:
+        return MagicMock(anchors=[])
+
+    mocker.patch.object(module, "BulkWrite", side_effect=bulk_write)
+    mocker.patch.object(
+        module,
+        "execute_bulk_write",
+        side_effect=lambda bulk_write: executions.append(bulk_write.anchors),
+    )
+    return executions
+
+
+class TestCommitBuffer:
+    """Test class for CommitBuffer."""
+
+    def test_flushes_on_exit(self, executed: list) -> None:
+        """Test that commits in the block are deferred and written once on exit."""
+        with CommitBuffer(max_ops=0, max_interval=0) as buffer:
+            for anchor_id in (1, 2, 1):
+                commit(make_anchor(anchor_id))
+            assert executed == []
+            assert buffer.pending == 2
+
+        assert executed == [[1, 2]]
+        assert buffer.stats.flushes == 1
+        assert buffer.stats.operations == 2
+        assert get_commit_buffer() is None
+
+    def test_flushes_at_max_ops(self, executed: list) -> None:
+        """Test that the buffer flushes each time max_ops anchors are pending."""
+        with CommitBuffer(max_ops=2, max_interval=0):
+            for anchor_id in range(5):
+                commit(make_anchor(anchor_id))
+
+        assert executed == [[0, 1], [2, 3], [4]]
+
+    def test_discards_pending_when_block_raises(self, executed: list) -> None:
+        """Test that the block's exception propagates and nothing is written."""
+        buffer = CommitBuffer(max_ops=0, max_interval=0)
+        with pytest.raises(KeyError), buffer:
+            commit(make_anchor(1))
+            raise KeyError("boom")
+
+        assert executed == []
+        assert buffer.pending == 0
+        assert buffer.stats.discarded == 1
+        assert get_commit_buffer() is None
+
+    def test_flush_failure_is_counted_and_raised(self, mocker: MockerFixture) -> None:
+        """Test that a failing write is raised once, without retrying in the buffer."""
+        mocker.patch.object(module, "BulkWrite")
+        execute_bulk_write = mocker.patch.object(
+            module, "execute_bulk_write", side_effect=RuntimeError("down")
+        )
+
+        buffer = CommitBuffer(max_ops=0, max_interval=0)
+        with pytest.raises(RuntimeError), buffer:
+            commit(make_anchor(1))
+
+        execute_bulk_write.assert_called_once()
+        assert buffer.stats.failures == 1
+        assert buffer.stats.flushes == 0
+
+    def test_decorator_uses_fresh_buffer_per_call(self, executed: list) -> None:
+        """Test that each decorated call flushes its own buffer into shared stats."""
+        decorator = CommitBuffer(max_ops=0, max_interval=0)
+
+        @decorator
+        def save(anchor_id: int) -> None:
+            commit(make_anchor(anchor_id))
+
+        save(1)
+        save(2)
+
+        assert executed == [[1], [2]]
+        assert decorator.stats.flushes == 2
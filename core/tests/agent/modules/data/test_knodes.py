@@ -0,0 +1,130 @@
+"""Tests for jivas.agent.modules.data.knodes."""
+
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from jivas.agent.modules.data.knodes import (
+    VectorRowWriter,
+    pack_vector,
+    parse_knodes,
+    read_knodes_with_vectors,
+    to_knode,
+    unpack_vector,
+    write_knodes,
+    write_knodes_with_vectors,
+)
+
+DOCS = [
+    {"id": "1", "text": "first\nline", "metadata": {"source": "a"}, "vec": [0.5, 1.0]},
+    {"id": "2", "text": "second", "metadata": {}, "vec": [-2.0, 0.25]},
+]
+
+
+class TestKnodes:
+    """Test class for knode serialization utils."""
+
+    def test_pack_vector_round_trip(self) -> None:
+        """Test that packed vectors unpack to the same float32 values."""
+        packed = pack_vector([0.5, -1.25, 3.0])
+
+        assert isinstance(packed, str)
+        assert unpack_vector(packed) == [0.5, -1.25, 3.0]
+        assert unpack_vector([0.5, 1.0]) == [0.5, 1.0]
+
+    def test_to_knode(self) -> None:
+        """Test that ids and vectors are only kept when requested."""
+        assert to_knode(DOCS[0]) == {"text": "first\nline", "metadata": {"source": "a"}}
+        assert to_knode(DOCS[0], with_embeddings=True, with_ids=True) == DOCS[0]
+        assert to_knode(DOCS[0], with_embeddings=True, pack_vectors=True)[
+            "vec"
+        ] == pack_vector([0.5, 1.0])
+
+    def test_write_yaml_loads_as_list(self) -> None:
+        """Test that YAML output loads as a list of knodes."""
+        sink = io.BytesIO()
+        knodes = (to_knode(doc, with_ids=True) for doc in DOCS)
+
+        assert write_knodes(knodes, sink) == 2
+        assert yaml.safe_load(sink.getvalue()) == [
+            {"text": "first\nline", "metadata": {"source": "a"}, "id": "1"},
+            {"text": "second", "metadata": {}, "id": "2"},
+        ]
+
+    def test_write_jsonl(self) -> None:
+        """Test that JSON lines output holds one knode per line."""
+        sink = io.BytesIO()
+
+        assert write_knodes(DOCS, sink, format="jsonl") == 2
+        lines = sink.getvalue().decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == DOCS
+
+    def test_write_unsupported_format(self) -> None:
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            write_knodes(DOCS, io.BytesIO(), format="csv")
+
+    def test_parse_knodes_formats(self) -> None:
+        """Test parsing JSON, JSON lines and YAML serializations."""
+        sink = io.BytesIO()
+        write_knodes(DOCS, sink, format="jsonl")
+        jsonl = sink.getvalue().decode("utf-8")
+
+        sink = io.BytesIO()
+        write_knodes(DOCS, sink)
+        yaml_text = sink.getvalue().decode("utf-8")
+
+        assert parse_knodes(json.dumps(DOCS)) == DOCS
+        assert parse_knodes(jsonl) == DOCS
+        assert parse_knodes(yaml_text) == DOCS
+
+        with pytest.raises(ValueError):
+            parse_knodes("- a: [unclosed")
+
+    def test_knodes_with_vectors_round_trip(self, tmp_path: Path) -> None:
+        """Test that vectors are moved into a float32 .npy array and restored on read."""
+        knowledge_path = tmp_path / "knowledge.jsonl"
+        vectors_path = tmp_path / "vectors.npy"
+        knodes = [*DOCS, {"text": "no vector", "metadata": {}}]
+
+        with VectorRowWriter() as vectors:
+            with open(knowledge_path, "wb") as sink:
+                assert write_knodes_with_vectors(iter(knodes), sink, vectors) == 3
+            with open(vectors_path, "wb") as sink:
+                vectors.write_to(sink)
+
+        lines = knowledge_path.read_text().splitlines()
+        assert "vec" not in json.loads(lines[0])
+        assert json.loads(lines[1])["vec_row"] == 1
+        assert "vec_row" not in json.loads(lines[2])
+
+        array = np.load(vectors_path)
+        assert array.dtype == np.float32
+        assert array.shape == (2, 2)
+
+        restored = read_knodes_with_vectors(str(knowledge_path), str(vectors_path))
+        assert [unpack_vector(knode["vec"]) for knode in restored[:2]] == [
+            doc["vec"] for doc in DOCS
+        ]
+        assert restored[2] == {"text": "no vector", "metadata": {}}
+
+    def test_vector_row_writer_rejects_mixed_dimensions(self) -> None:
+        """Test that vectors must share a dimension."""
+        with VectorRowWriter() as vectors:
+            assert vectors.append([1.0, 2.0]) == 0
+            with pytest.raises(ValueError):
+                vectors.append([1.0, 2.0, 3.0])
+
+    def test_read_knodes_with_vectors_invalid_row(self, tmp_path: Path) -> None:
+        """Test that rows outside the vectors array are rejected."""
+        (tmp_path / "knowledge.jsonl").write_text('{"text": "t", "vec_row": 1}\n')
+        np.save(tmp_path / "vectors.npy", np.zeros((1, 2), dtype=np.float32))
+
+        with pytest.raises(ValueError):
+            read_knodes_with_vectors(
+                str(tmp_path / "knowledge.jsonl"), str(tmp_path / "vectors.npy")
+            )
@@ -0,0 +1,124 @@
+"""Tests for jivas.agent.modules.data.node_get."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from bson import ObjectId
+from jac_cloud.core.archetype import NodeAnchor, Root
+from jac_cloud.core.memory import MongoDB
+from pytest_mock import MockerFixture
+
+from jivas.agent.modules.data import node_get as module
+from jivas.agent.modules.data.node_get import iter_nodes, node_get
+
+
+class FakeCollection:
+    """Collection returning its documents from find, recording the arguments."""
+
+    def __init__(self, docs: List[Dict[str, Any]]) -> None:
+        """Initialize the collection with its documents."""
+        self.docs = docs
+        self.calls: List[Dict[str, Any]] = []
+
+    def find(self, query: Dict[str, Any], projection: Any = None, **kwargs: Any) -> Any:
+        """Return an iterator over copies of the documents, as hydration consumes _id."""
+        self.calls.append({"query": query, "projection": projection, **kwargs})
+        return (dict(doc) for doc in self.docs)
+
+
+def node_doc() -> Dict[str, Any]:
+    """Return the serialized document of a new root node."""
+    anchor = Root().__jac__
+    anchor.id = ObjectId()
+    return anchor.serialize()
+
+
+@pytest.fixture
+def mem(mocker: MockerFixture) -> MongoDB:
+    """Patch the Jac context with a fresh jac-cloud memory and return it."""
+    mem = MongoDB()
+    mocker.patch.object(
+        module.Jac, "get_context", return_value=SimpleNamespace(mem=mem)
+    )
+    return mem
+
+
+def setup_collection(mocker: MockerFixture, docs: List[dict]) -> FakeCollection:
+    """Patch the node collection with one holding docs."""
+    collection = FakeCollection(docs)
+    mocker.patch.object(
+        module.BaseCollection, "get_collection", return_value=collection
+    )
+    return collection
+
+
+class TestIterNodes:
+    """Test class for node_get and iter_nodes."""
+
+    def test_hydrates_and_caches_uncached_nodes(
+        self, mocker: MockerFixture, mem: MongoDB
+    ) -> None:
+        """Test that uncached documents are hydrated and registered in memory."""
+        docs = [node_doc(), node_doc()]
+        collection = setup_collection(mocker, docs)
+
+        nodes = node_get({"name": "Root"}, sort=[("_id", 1)], limit=2)
+
+        assert [node.__jac__.id for node in nodes] == [doc["_id"] for doc in docs]
+        assert all(isinstance(node, Root) for node in nodes)
+        assert set(mem.__mem__) == {doc["_id"] for doc in docs}
+        assert mem.__mem__[docs[0]["_id"]] is nodes[0].__jac__
+        assert collection.calls[0]["sort"] == [("_id", 1)]
+        assert collection.calls[0]["limit"] == 2
+
+    def test_cache_disabled(self, mocker: MockerFixture, mem: MongoDB) -> None:
+        """Test that nodes are not registered in memory when cache is False."""
+        setup_collection(mocker, [node_doc()])
+
+        nodes = list(iter_nodes({"name": "Root"}, batch_size=10, cache=False))
+
+        assert len(nodes) == 1
+        assert mem.__mem__ == {}
+
+    def test_yields_cached_anchor(self, mocker: MockerFixture, mem: MongoDB) -> None:
+        """Test that nodes already in memory are yielded from there."""
+        doc = node_doc()
+        cached = NodeAnchor.Collection.__document__(node_doc())
+        cached.id = doc["_id"]
+        mem.set(cached.id, cached)
+        setup_collection(mocker, [doc])
+
+        assert list(iter_nodes({"name": "Root"})) == [cached.archetype]
+
+    def test_skips_destroyed_nodes(self, mocker: MockerFixture, mem: MongoDB) -> None:
+        """Test that nodes destroyed in the current context are skipped."""
+        destroyed, cached_destroyed, kept = node_doc(), node_doc(), node_doc()
+        mem.__gc__.add(NodeAnchor.Collection.__document__(dict(destroyed)))
+        anchor = NodeAnchor.Collection.__document__(dict(cached_destroyed))
+        mem.set(anchor.id, anchor)
+        mem.__gc__.add(anchor)
+        setup_collection(mocker, [destroyed, cached_destroyed, kept])
+
+        nodes = node_get({"name": "Root"})
+
+        assert [node.__jac__.id for node in nodes] == [kept["_id"]]
+        assert destroyed["_id"] not in mem.__mem__
+
+    def test_projection_returns_documents(
+        self, mocker: MockerFixture, mem: MongoDB
+    ) -> None:
+        """Test that projected documents are returned as is, without hydration."""
+        docs = [{"_id": ObjectId()}]
+        setup_collection(mocker, docs)
+
+        assert node_get({"name": "Root"}, projection={"_id": 1}) == docs
+        assert mem.__mem__ == {}
+
+    def test_no_filter(self, mocker: MockerFixture, mem: MongoDB) -> None:
+        """Test that no query is made without a filter."""
+        collection = setup_collection(mocker, [node_doc()])
+
+        assert node_get() == []
+        assert list(iter_nodes()) == []
+        assert collection.calls == []
@@ -0,0 +1,216 @@
+"""Tests for jivas.agent.modules.data.node_purge."""
+
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+from jac_cloud.core.archetype import EdgeAnchor, NodeAnchor
+from pytest_mock import MockerFixture
+
+from jivas.agent.modules.data import node_purge as module
+from jivas.agent.modules.data.node_purge import node_purge
+
+OWNER = ObjectId()
+STRANGER = ObjectId()
+
+
+class FakeCollection:
+    """Collection answering find queries on _id with $in over a dict of documents."""
+
+    def __init__(self, docs: List[Dict[str, Any]]) -> None:
+        """Initialize the collection with its documents."""
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.projections: List[Any] = []
+
+    def find(self, query: Dict[str, Any], projection: Any = None) -> List[dict]:
+        """Return the documents whose ids are listed in the query."""
+        self.projections.append(projection)
+        return [self.docs[_id] for _id in query["_id"]["$in"] if _id in self.docs]
+
+
+class Graph:
+    """Node and edge documents, connected with add_edge."""
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: List[Dict[str, Any]] = []
+
+    def add_node(self, name: str, owner: ObjectId = OWNER) -> ObjectId:
+        """Add a node owned by owner and return its id."""
+        node_id = ObjectId()
+        self.nodes[name] = {"_id": node_id, "name": name, "edges": [], "root": owner}
+        return node_id
+
+    def add_edge(self, source: str, target: str) -> ObjectId:
+        """Connect source to target, referencing the edge from both nodes."""
+        edge_id = ObjectId()
+        self.edges.append(
+            {
+                "_id": edge_id,
+                "source": f"n:{source}:{self.nodes[source]['_id']}",
+                "target": f"n:{target}:{self.nodes[target]['_id']}",
+            }
+        )
+        self.nodes[source]["edges"].append(f"e::{edge_id}")
+        self.nodes[target]["edges"].append(f"e::{edge_id}")
+        return edge_id
+
+
+@pytest.fixture
+def graph() -> Graph:
+    """Return a graph: outside -> root -> child -> grandchild, and child -> foreign."""
+    graph = Graph()
+    for name in ("outside", "root", "child", "grandchild"):
+        graph.add_node(name)
+    graph.add_node("foreign", owner=STRANGER)
+    graph.add_edge("outside", "root")
+    graph.add_edge("root", "child")
+    graph.add_edge("child", "grandchild")
+    graph.add_edge("child", "foreign")
+    return graph
+
+
+class TestNodePurge:
+    """Test class for node_purge."""
+
+    def setup_purge(
+        self,
+        mocker: MockerFixture,
+        graph: Graph,
+        current_root: ObjectId = OWNER,
+        system: bool = False,
+    ) -> MagicMock:
+        """Patch the collections, context and bulk write; return the bulk write mock."""
+        self.collections = {
+            "node": FakeCollection(list(graph.nodes.values())),
+            "edge": FakeCollection(graph.edges),
+        }
+        mocker.patch.object(
+            NodeAnchor.Collection,
+            "get_collection",
+            side_effect=lambda name: self.collections[name],
+        )
+
+        context = MagicMock()
+        context.mem.__mem__ = {}
+        context.root_state = MagicMock(id=current_root)
+        context.system_root = context.root_state if system else MagicMock()
+        mocker.patch.object(module.Jac, "get_context", return_value=context)
+        return mocker.patch.object(module, "execute_bulk_write")
+
+    def deleted(self, execute_bulk_write: MagicMock, anchor_type: type) -> set:
+        """Return the ids deleted for anchor_type by the committed bulk write."""
+        bulk_write = execute_bulk_write.call_args.args[0]
+        ids = set()
+        for operation in bulk_write.operations[anchor_type]:
+            if type(operation).__name__ == "DeleteMany":
+                ids.update(operation._filter["_id"]["$in"])
+        return ids
+
+    def pulled(self, execute_bulk_write: MagicMock) -> tuple:
+        """Return the nodes edges are pulled from and the edge references pulled."""
+        for operation in execute_bulk_write.call_args.args[0].operations[NodeAnchor]:
+            if type(operation).__name__ == "UpdateMany":
+                return (
+                    set(operation._filter["_id"]["$in"]),
+                    set(operation._doc["$pull"]["edges"]["$in"]),
+                )
+        return set(), set()
+
+    def test_removes_owned_subgraph(self, mocker: MockerFixture, graph: Graph) -> None:
+        """Test that the root and its owned descendants go, and foreign nodes stay."""
+        execute_bulk_write = self.setup_purge(mocker, graph)
+        nodes = graph.nodes
+
+        removed = node_purge(nodes["root"]["_id"])
+
+        assert removed == [
+            f"n:{name}:{nodes[name]['_id']}" for name in ("root", "child", "grandchild")
+        ]
+        assert self.deleted(execute_bulk_write, NodeAnchor) == {
+            nodes[name]["_id"] for name in ("root", "child", "grandchild")
+        }
+        assert self.deleted(execute_bulk_write, EdgeAnchor) == {
+            edge["_id"] for edge in graph.edges
+        }
+        sources, refs = self.pulled(execute_bulk_write)
+        assert sources == {nodes["outside"]["_id"], nodes["foreign"]["_id"]}
+        assert refs == {f"e::{edge['_id']}" for edge in graph.edges}
+
+    def test_system_root_removes_foreign_nodes(
+        self, mocker: MockerFixture, graph: Graph
+    ) -> None:
+        """Test that the system root removes descendants of any owner."""
+        execute_bulk_write = self.setup_purge(mocker, graph, system=True)
+
+        node_purge(graph.nodes["root"]["_id"])
+
+        assert graph.nodes["foreign"]["_id"] in self.deleted(
+            execute_bulk_write, NodeAnchor
+        )
+
+    def test_skips_roots_without_write_access(
+        self, mocker: MockerFixture, graph: Graph
+    ) -> None:
+        """Test that nothing is removed when the root is not writable."""
+        execute_bulk_write = self.setup_purge(mocker, graph, current_root=STRANGER)
+
+        assert node_purge(graph.nodes["root"]["_id"]) == []
+        execute_bulk_write.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "root_access, owner_access",
+        [
+            ({"all": "NO_ACCESS", "roots": {"anchors": {str(STRANGER): "WRITE"}}}, {}),
+            ({"all": "WRITE", "roots": {"anchors": {}}}, {}),
+            ({}, {"all": "READ", "roots": {"anchors": {str(STRANGER): "WRITE"}}}),
+            ({}, {"all": "WRITE"}),
+        ],
+    )
+    def test_access_granted_by_root_or_owner(
+        self,
+        mocker: MockerFixture,
+        graph: Graph,
+        root_access: Dict[str, Any],
+        owner_access: Dict[str, Any],
+    ) -> None:
+        """Test that write access granted on the root, or on its owner's root, is honoured."""
+        graph.nodes["root"]["access"] = root_access
+        execute_bulk_write = self.setup_purge(mocker, graph, current_root=STRANGER)
+        self.collections["node"].docs[OWNER] = {"_id": OWNER, "access": owner_access}
+
+        node_purge(graph.nodes["root"]["_id"])
+
+        assert self.deleted(execute_bulk_write, NodeAnchor) == {
+            graph.nodes[name]["_id"]
+            for name in ("root", "child", "grandchild", "foreign")
+        }
+
+    def test_reads_only_access_fields(
+        self, mocker: MockerFixture, graph: Graph
+    ) -> None:
+        """Test that every node query is projected, so full documents are never loaded."""
+        self.setup_purge(mocker, graph)
+
+        node_purge(graph.nodes["root"]["_id"])
+
+        projections = self.collections["node"].projections
+        assert projections
+        assert all(projection for projection in projections)
+        assert {"_id": 1, "root": 1, "access": 1} in projections
+
+    def test_keeps_root_when_excluded(
+        self, mocker: MockerFixture, graph: Graph
+    ) -> None:
+        """Test that include_root=False keeps the root and its incoming edge."""
+        execute_bulk_write = self.setup_purge(mocker, graph)
+        nodes = graph.nodes
+
+        node_purge(nodes["root"]["_id"], include_root=False)
+
+        assert nodes["root"]["_id"] not in self.deleted(execute_bulk_write, NodeAnchor)
+        assert graph.edges[0]["_id"] not in self.deleted(execute_bulk_write, EdgeAnchor)
+        sources, _ = self.pulled(execute_bulk_write)
+        assert nodes["root"]["_id"] in sources
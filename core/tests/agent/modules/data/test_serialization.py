@@ -1,19 +1,27 @@
 """Test module for serialization utilities and data transformation functions."""
 
+import datetime
 import json
 from collections import namedtuple
 from enum import Enum
 from typing import Any, Dict
 from unittest.mock import patch
 
+import pytest
 import yaml
 
 from jivas.agent.modules.data.serialization import (
+    ContentWrappingEncoder,
+    LongStringDumper,
+    LongStringRepresenter,
     convert_str_to_json,
     export_to_dict,
+    json_dumps,
+    json_loads,
     make_serializable,
     safe_json_dump,
     yaml_dumps,
+    yaml_loads,
 )
 
 
@@ -201,6 +209,60 @@ class TestSerializationUtils:
         result = export_to_dict(obj)
         assert result == {"value": "Slotted(x=1, y=2)"}
 
+    def test_export_to_dict_with_shared_references(self) -> None:
+        """Test that objects referenced twice, but not cyclically, are exported twice."""
+        shared = {"x": [1, 2]}
+        result = export_to_dict({"a": shared, "b": shared, "c": [shared]})
+        assert result == {"a": {"x": [1, 2]}, "b": {"x": [1, 2]}, "c": [{"x": [1, 2]}]}
+
+    def test_export_to_dict_with_object_cycle(self) -> None:
+        """Test cycles through objects and namedtuples are detected."""
+
+        class Node:
+            def __init__(self) -> None:
+                self.name = "node"
+                self.children: list = []
+
+        node = Node()
+        node.children.append(node)
+        assert export_to_dict(node) == {
+            "name": "node",
+            "children": ["<cycle detected>"],
+        }
+
+        Pair = namedtuple("Pair", ["left", "right"])
+        pair = Pair([], 1)
+        pair.left.append(pair)
+        assert export_to_dict(pair) == {"left": ["<cycle detected>"], "right": 1}
+
+    def test_export_to_dict_with_deep_nesting(self) -> None:
+        """Test that deeply nested data does not exhaust the recursion limit."""
+        data: Dict[str, Any] = {}
+        node = data
+        for _ in range(5000):
+            node["child"] = {}
+            node = node["child"]
+        node["leaf"] = Color.RED
+
+        result = export_to_dict(data)
+        for _ in range(5000):
+            result = result["child"]
+        assert result == {"leaf": "red"}
+
+    def test_json_round_trip(self) -> None:
+        """Test that exports round-trip through json_dumps and json_loads."""
+
+        class Generic:
+            def __init__(self) -> None:
+                self.a = 1
+                self.__jac__ = "anchor"
+                self.b = {"colors": (Color.RED, Color.GREEN)}
+
+        result = json_loads(json_dumps(export_to_dict(Generic())))
+        assert result == export_to_dict(Generic())
+        assert result == {"a": 1, "b": {"colors": ["red", 3]}}
+        assert json_loads(json_dumps({1: "one"})) == {"1": "one"}
+
     # ==========================================================================
     # Tests for safe_json_dump
     # ==========================================================================
@@ -268,6 +330,34 @@ class TestSerializationUtils:
         result = safe_json_dump({})
         assert result == "{}"
 
+    def test_safe_json_dump_does_not_modify_input(self) -> None:
+        """Test safe_json_dump wraps values while encoding, leaving the input as is."""
+        data = {"a": {"b": 1, "c": [{"d": "x"}, 2]}, "e": None, 1: True}
+        result = safe_json_dump(data)
+        assert result is not None
+
+        assert json.loads(result) == {
+            "a": {"b": {"content": 1}, "c": [{"d": {"content": "x"}}, 2]},
+            "e": None,
+            "1": {"content": True},
+        }
+        assert data == {"a": {"b": 1, "c": [{"d": "x"}, 2]}, "e": None, 1: True}
+
+    def test_safe_json_dump_with_cycle(self) -> None:
+        """Test safe_json_dump returns None for data with circular references."""
+        data: Dict[str, Any] = {"items": []}
+        data["items"].append(data)
+        assert safe_json_dump(data) is None
+
+    def test_content_wrapping_encoder_separators(self) -> None:
+        """Test that the encoder honours the separators and indent of json.dumps."""
+        data = {"a": {"b": 1}, "c": [1, 2]}
+        assert (
+            json.dumps(data, cls=ContentWrappingEncoder, separators=(",", ":"))
+            == '{"a":{"b":{"content":1}},"c":[1,2]}'
+        )
+        assert json.dumps([1, 2], cls=ContentWrappingEncoder) == "[1, 2]"
+
     # ==========================================================================
     # Tests for convert_str_to_json
     # ==========================================================================
@@ -433,3 +523,75 @@ class TestSerializationUtils:
         result = yaml_dumps(data)
         assert result is not None
         assert "你好世界" in result
+
+    def test_yaml_dumps_matches_make_serializable(self) -> None:
+        """Test yaml_dumps represents values as make_serializable converts them."""
+        data = {
+            "set": {1},
+            "tuple": (1, 2),
+            "color": Color.RED,
+            "date": datetime.datetime(2025, 1, 2, 3, 4, 5),
+            "bytes": b"raw",
+            "nested": [{"frozen": frozenset()}, None, 1.5, True],
+        }
+        result = yaml_dumps(data)
+        assert result is not None
+        assert yaml.safe_load(result) == make_serializable(data)
+
+    def test_yaml_dumps_without_aliases(self) -> None:
+        """Test yaml_dumps writes repeated objects out in full."""
+        shared = {"key": "value"}
+        result = yaml_dumps({"first": shared, "second": shared})
+        assert result is not None
+        assert "&" not in result and "*" not in result
+        assert yaml.safe_load(result) == {"first": shared, "second": shared}
+
+    def test_yaml_dumps_with_str_enum(self) -> None:
+        """Test yaml_dumps represents str enums by their value."""
+
+        class Kind(str, Enum):
+            TEXT = "TEXT"
+
+        result = yaml_dumps({"kind": Kind.TEXT})
+        assert result is not None
+        assert yaml.safe_load(result) == {"kind": "TEXT"}
+
+    def test_long_string_dumper_matches_pure_python_dumper(self) -> None:
+        """Test LongStringDumper writes what it would on the pure Python SafeDumper."""
+
+        class PyLongStringDumper(LongStringRepresenter, yaml.SafeDumper):
+            yaml_representers = LongStringDumper.yaml_representers
+            yaml_multi_representers = LongStringDumper.yaml_multi_representers
+
+        data = {
+            "multiline": "first line  \nsecond line\t\n\n",
+            "long": "word " * 60,
+            "indented": "  leading\nspace",
+            "quoted": "'yes'",
+            "reserved": "yes",
+            "control": "bell\x07",
+            "unicode": "你好世界",
+            "values": [1, 1.5, True, None, (1, 2), ""],
+        }
+        for allow_unicode in (True, False):
+            options: Dict[str, Any] = {
+                "allow_unicode": allow_unicode,
+                "default_flow_style": False,
+                "sort_keys": False,
+            }
+            assert yaml.dump(data, Dumper=LongStringDumper, **options) == yaml.dump(
+                data, Dumper=PyLongStringDumper, **options
+            )
+
+    def test_yaml_loads(self) -> None:
+        """Test yaml_loads parses YAML like yaml.safe_load."""
+        text = yaml_dumps({"key": "value\nwith lines", "items": [1, 2.5, None]})
+        assert text is not None
+        assert yaml_loads(text) == yaml.safe_load(text)
+        assert yaml_loads(text.encode("utf-8")) == yaml.safe_load(text)
+
+        with pytest.raises(yaml.YAMLError):
+            yaml_loads("key: [unclosed")
+
+        with pytest.raises(yaml.constructor.ConstructorError):
+            yaml_loads("!!python/object/apply:os.system ['true']")
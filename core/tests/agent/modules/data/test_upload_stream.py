@@ -0,0 +1,63 @@
+"""Tests for jivas.agent.modules.data.upload_stream."""
+
+import asyncio
+
+import pytest
+
+from jivas.agent.modules.data.upload_stream import (
+    UploadStream,
+    UploadTooLargeError,
+    read_stream,
+)
+
+
+class FakeUpload:
+    """Async readable upload over in-memory bytes, recording the reads made."""
+
+    def __init__(self, content: bytes) -> None:
+        """Initialize the upload with its content."""
+        self.content = content
+        self.position = 0
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return up to size bytes from the current position."""
+        self.reads += 1
+        end = len(self.content) if size < 0 else self.position + size
+        chunk = self.content[self.position : end]
+        self.position += len(chunk)
+        return chunk
+
+
+class TestUploadStream:
+    """Test class for UploadStream."""
+
+    def test_reads_upload_in_chunks(self) -> None:
+        """Test that the upload is read in chunk_size pieces and reassembled."""
+        upload = FakeUpload(b"x" * 10000)
+        stream = UploadStream(upload, chunk_size=4096)
+
+        assert asyncio.run(read_stream(stream)) == b"x" * 10000
+        # three chunks, then the empty read ending the stream
+        assert upload.reads == 4
+        metrics = stream.metrics()
+        assert metrics["bytes"] == 10000
+        assert metrics["read_latency"] >= metrics["first_chunk_latency"] >= 0
+
+    def test_rejects_oversized_upload_while_streaming(self) -> None:
+        """Test that reading stops at the first chunk over max_size."""
+        upload = FakeUpload(b"x" * 10000)
+        stream = UploadStream(upload, max_size=5000, chunk_size=4096)
+
+        with pytest.raises(UploadTooLargeError):
+            asyncio.run(read_stream(stream))
+        assert upload.reads == 2
+        assert upload.position < len(upload.content)
+
+    def test_empty_upload(self) -> None:
+        """Test that an empty upload yields no bytes."""
+        stream = UploadStream(FakeUpload(b""), max_size=10)
+
+        assert asyncio.run(read_stream(stream)) == b""
+        assert stream.metrics()["bytes"] == 0
+        assert stream.metrics()["first_chunk_latency"] is None
@@ -0,0 +1,184 @@
+"""Tests for jivas.agent.modules.embeddings.embedding_cache."""
+
+import asyncio
+from pathlib import Path
+from typing import Any, List
+
+from pytest_mock import MockerFixture
+
+from jivas.agent.modules.embeddings.embedding_cache import (
+    CachedEmbeddings,
+    EmbeddingCache,
+    SQLiteEmbeddingStore,
+    embedding_cache_key,
+    pack_vector,
+    unpack_vector,
+)
+
+
+class TestEmbeddingCache:
+    """Test class for EmbeddingCache and its stores."""
+
+    def test_cache_key_depends_on_model_and_text(self) -> None:
+        """Test that cache keys are namespaced by model and stable per text."""
+        assert embedding_cache_key("m1", "hello") == embedding_cache_key("m1", "hello")
+        assert embedding_cache_key("m1", "hello") != embedding_cache_key("m2", "hello")
+        assert embedding_cache_key("m1", "hello") != embedding_cache_key("m1", "world")
+
+    def test_cache_key_depends_on_role(self) -> None:
+        """Test that queries and documents of the same text do not share a key."""
+        assert embedding_cache_key("m1", "hello", role="query") != embedding_cache_key(
+            "m1", "hello"
+        )
+
+    def test_pack_unpack_roundtrip(self) -> None:
+        """Test that vectors survive float32 packing."""
+        assert unpack_vector(pack_vector([0.5, -1.25, 2.0])) == [0.5, -1.25, 2.0]
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        """Test that the LRU tier evicts beyond capacity, keeping recently read keys."""
+        cache = EmbeddingCache(max_entries=2)
+        cache.set_many({"a": [1.0], "b": [2.0]})
+        cache.get_many(["a"])
+        cache.set_many({"c": [3.0]})
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+    def test_stats_track_hits_and_misses(self) -> None:
+        """Test that hit and miss counters are reported."""
+        cache = EmbeddingCache()
+        cache.set_many({"a": [1.0]})
+        cache.get_many(["a", "b"])
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_sqlite_store_backs_lru_misses(self, tmp_path: Path) -> None:
+        """Test that the persistent tier serves vectors evicted from or absent in the LRU."""
+        store = SQLiteEmbeddingStore(str(tmp_path / "cache" / "embeddings.db"))
+        EmbeddingCache(store=store).set_many({"a": [1.0, 2.0]})
+
+        cache = EmbeddingCache(store=store)
+        assert cache.get_many(["a"]) == {"a": [1.0, 2.0]}
+        assert cache.stats()["store_hits"] == 1
+
+
+class TestCachedEmbeddings:
+    """Test class for CachedEmbeddings."""
+
+    def _embedder(self, mocker: MockerFixture) -> Any:
+        embedder = mocker.Mock()
+        embedder.embed_documents.side_effect = lambda texts: [
+            [float(len(text))] for text in texts
+        ]
+        embedder.embed_query.side_effect = lambda text: [float(len(text))]
+        return embedder
+
+    def test_embed_documents_only_embeds_uncached_unique_texts(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that cached and duplicate texts are not sent to the wrapped model."""
+        embedder = self._embedder(mocker)
+        embeddings = CachedEmbeddings(embedder, "model", cache=EmbeddingCache())
+
+        first = embeddings.embed_documents(["a", "bb", "a"])
+        second = embeddings.embed_documents(["bb", "ccc"])
+
+        assert first == [[1.0], [2.0], [1.0]]
+        assert second == [[2.0], [3.0]]
+        assert embedder.embed_documents.call_args_list[0].args[0] == ["a", "bb"]
+        assert embedder.embed_documents.call_args_list[1].args[0] == ["ccc"]
+
+    def test_embed_documents_failure_is_not_cached(self, mocker: MockerFixture) -> None:
+        """Test that a failed embedding call returns nothing and caches nothing."""
+        embedder = mocker.Mock()
+        embedder.embed_documents.return_value = []
+        cache = EmbeddingCache()
+        embeddings = CachedEmbeddings(embedder, "model", cache=cache)
+
+        assert embeddings.embed_documents(["a", "b"]) == []
+        assert cache.stats()["entries"] == 0
+
+    def test_embed_query_served_from_cache(self, mocker: MockerFixture) -> None:
+        """Test that repeated queries are embedded once."""
+        embedder = self._embedder(mocker)
+        embeddings = CachedEmbeddings(embedder, "model", cache=EmbeddingCache())
+
+        assert embeddings.embed_query("hello") == [5.0]
+        assert embeddings.embed_query("hello") == [5.0]
+        embedder.embed_query.assert_called_once_with("hello")
+
+    def test_query_and_document_vectors_cached_separately(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that a cached document vector is not served for a query of the same text."""
+        embedder = self._embedder(mocker)
+        embedder.embed_query.side_effect = lambda text: [-float(len(text))]
+        embeddings = CachedEmbeddings(embedder, "model", cache=EmbeddingCache())
+
+        assert embeddings.embed_documents(["hello"]) == [[5.0]]
+        assert embeddings.embed_query("hello") == [-5.0]
+        assert embeddings.embed_documents(["hello"]) == [[5.0]]
+
+    def test_async_embed_documents(self, mocker: MockerFixture) -> None:
+        """Test that the async variant shares the cache with the sync one."""
+        embedder = self._embedder(mocker)
+
+        async def aembed_documents(texts: List[str]) -> List[List[float]]:
+            return embedder.embed_documents(texts)
+
+        embedder.aembed_documents = aembed_documents
+        embeddings = CachedEmbeddings(embedder, "model", cache=EmbeddingCache())
+        embeddings.embed_documents(["a"])
+
+        result = asyncio.run(embeddings.aembed_documents(["a", "bb"]))
+
+        assert result == [[1.0], [2.0]]
+        assert embedder.embed_documents.call_args_list[-1].args[0] == ["bb"]
+
+    def test_async_embed_queries_share_the_query_cache(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that batch query embeddings are cached as queries, not documents."""
+        embedder = self._embedder(mocker)
+        embedder.embed_query.side_effect = lambda text: [-float(len(text))]
+
+        async def aembed_query(text: str) -> List[float]:
+            return embedder.embed_query(text)
+
+        embedder.aembed_query = aembed_query
+        embeddings = CachedEmbeddings(embedder, "model", cache=EmbeddingCache())
+        embeddings.embed_query("a")
+        embeddings.embed_documents(["bb"])
+
+        result = asyncio.run(embeddings.aembed_queries(["a", "bb", "a"]))
+
+        assert result == [[-1.0], [-2.0], [-1.0]]
+        assert [call.args[0] for call in embedder.embed_query.call_args_list] == [
+            "a",
+            "bb",
+        ]
+        assert embeddings.embed_query("bb") == [-2.0]
+        assert embedder.embed_query.call_count == 2
+
+    def test_async_embed_queries_failure_is_not_cached(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that a failed query embedding returns nothing and caches nothing."""
+        embedder = mocker.Mock()
+        embedder.aembed_query = mocker.AsyncMock(side_effect=[[1.0], []])
+        cache = EmbeddingCache()
+        embeddings = CachedEmbeddings(embedder, "model", cache=cache)
+
+        assert asyncio.run(embeddings.aembed_queries(["a", "b"])) == []
+        assert cache.stats()["entries"] == 0
+
+    def test_attributes_delegate_to_wrapped_model(self, mocker: MockerFixture) -> None:
+        """Test that unknown attributes resolve on the wrapped model."""
+        embedder = self._embedder(mocker)
+        embedder.token_limit = 512
+        embeddings = CachedEmbeddings(embedder, "model", cache=EmbeddingCache())
+
+        assert embeddings.token_limit == 512
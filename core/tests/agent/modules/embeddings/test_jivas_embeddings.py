@@ -1,11 +1,23 @@
 """Tests for jivas.agent.modules.embeddings.jivas_embeddings."""
 
 import json
-from unittest.mock import call
+from typing import Generator
+from unittest.mock import MagicMock
 
+import pytest
+from openai import APIConnectionError
 from pytest_mock import MockerFixture
 
 from jivas.agent.modules.embeddings.jivas_embeddings import JivasEmbeddings
+from jivas.agent.modules.embeddings.registry import clear_tokenizers
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokenizers() -> Generator[None, None, None]:
+    """Ensure each test loads its own (possibly mocked) tokenizer."""
+    clear_tokenizers()
+    yield
+    clear_tokenizers()
 
 
 class TestJivasEmbeddings:
@@ -38,8 +50,7 @@ class TestJivasEmbeddings:
         mock_tokenizer = mocker.patch("transformers.AutoTokenizer.from_pretrained")
         mock_tokenizer_instance = mock_tokenizer.return_value
         mock_tokenizer_instance.model_max_length = 5
-        mock_tokenizer_instance.return_tensors = "pt"
-        mock_tokenizer_instance.side_effect = lambda text, return_tensors: {
+        mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
             "input_ids": [[1, 2, 3, 4, 5, 6, 7]]
         }
         mock_tokenizer_instance.decode.return_value = "trimmed text"
@@ -63,8 +74,7 @@ class TestJivasEmbeddings:
         mock_tokenizer = mocker.patch("transformers.AutoTokenizer.from_pretrained")
         mock_tokenizer_instance = mock_tokenizer.return_value
         mock_tokenizer_instance.model_max_length = 10
-        mock_tokenizer_instance.return_tensors = "pt"
-        mock_tokenizer_instance.side_effect = lambda text, return_tensors: {
+        mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
             "input_ids": [[1, 2, 3, 4, 5]]
         }
         mock_tokenizer_instance.decode.return_value = "This is a long text"
@@ -86,8 +96,7 @@ class TestJivasEmbeddings:
         mock_tokenizer = mocker.patch("transformers.AutoTokenizer.from_pretrained")
         mock_tokenizer_instance = mock_tokenizer.return_value
         mock_tokenizer_instance.model_max_length = 5
-        mock_tokenizer_instance.return_tensors = "pt"
-        mock_tokenizer_instance.side_effect = lambda text, return_tensors: {
+        mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
             "input_ids": [[1, 2, 3, 4, 5]]
         }
         mock_tokenizer_instance.decode.return_value = "exact length text"
@@ -145,8 +154,10 @@ class TestJivasEmbeddings:
             base_url="http://example.com",
             api_key="dummy_key",  # pragma: allowlist secret
         )
-        mocker.patch.object(
-            jivas_embeddings, "trim_text_if_needed", return_value="trimmed"
+        trim_texts = mocker.patch.object(
+            jivas_embeddings,
+            "trim_texts",
+            return_value=(["trimmed", "trimmed"], [1, 1]),
         )
 
         # Act
@@ -156,8 +167,9 @@ class TestJivasEmbeddings:
 
         # Assert
         assert result == [[0.1, 0.2, 0.3]]
-        jivas_embeddings.trim_text_if_needed.assert_has_calls(
-            [call("long text1"), call("long text2")]
+        trim_texts.assert_called_once_with(["long text1", "long text2"])
+        mock_instance.embeddings.create.assert_called_once_with(
+            input=["trimmed", "trimmed"], model=jivas_embeddings.model_name
         )
 
     def test_embed_documents_handles_exception(self, mocker: MockerFixture) -> None:
@@ -222,8 +234,7 @@ class TestJivasEmbeddings:
 
         mock_tokenizer = mocker.patch("transformers.AutoTokenizer.from_pretrained")
         mock_tokenizer_instance = mock_tokenizer.return_value
-        mock_tokenizer_instance.return_tensors = "pt"
-        mock_tokenizer_instance.side_effect = lambda text, return_tensors: {
+        mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
             "input_ids": [[1, 2, 3, 4, 5, 6, 7]]
         }
         mock_tokenizer_instance.decode.return_value = "trimmed text"
@@ -283,3 +294,131 @@ class TestJivasEmbeddings:
 
         # Assert
         assert result == []
+
+    def _mock_batched(self, mocker: MockerFixture) -> MagicMock:
+        """Mock a tokenizer counting words and a client embedding each text by its number."""
+        mock_tokenizer = mocker.patch("transformers.AutoTokenizer.from_pretrained")
+        mock_tokenizer_instance = mock_tokenizer.return_value
+        mock_tokenizer_instance.model_max_length = 512
+        mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
+            "input_ids": [[1] * len(text.split()) for text in texts]
+        }
+
+        def create(input: list, model: str) -> object:
+            response = mocker.Mock()
+            response.json.return_value = json.dumps(
+                {
+                    "data": [
+                        {"index": i, "embedding": [float(text.split()[-1])]}
+                        for i, text in reversed(list(enumerate(input)))
+                    ]
+                }
+            )
+            return response
+
+        mock_client = mocker.patch(
+            "jivas.agent.modules.embeddings.jivas_embeddings.OpenAI"
+        )
+        mock_client.return_value.embeddings.create.side_effect = create
+        return mock_client.return_value
+
+    def test_embed_documents_batches_by_count(self, mocker: MockerFixture) -> None:
+        """Test that documents are split into batches of batch_size, preserving order."""
+        # Arrange
+        mock_instance = self._mock_batched(mocker)
+        jivas_embeddings = JivasEmbeddings(
+            base_url="http://example.com",
+            api_key="dummy_key",  # pragma: allowlist secret
+            batch_size=2,
+        )
+
+        # Act
+        result = jivas_embeddings.embed_documents([f"text {i}" for i in range(5)])
+
+        # Assert
+        assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert mock_instance.embeddings.create.call_count == 3
+
+    def test_embed_documents_batches_by_tokens(self, mocker: MockerFixture) -> None:
+        """Test that a batch is closed before it exceeds max_batch_tokens."""
+        # Arrange
+        mock_instance = self._mock_batched(mocker)
+        jivas_embeddings = JivasEmbeddings(
+            base_url="http://example.com",
+            api_key="dummy_key",  # pragma: allowlist secret
+            max_batch_tokens=4,
+            max_workers=1,
+        )
+
+        # Act
+        result = jivas_embeddings.embed_documents(["a 0", "b c 1", "d 2", "e 3"])
+
+        # Assert
+        assert result == [[0.0], [1.0], [2.0], [3.0]]
+        batches = [
+            c.kwargs["input"] for c in mock_instance.embeddings.create.call_args_list
+        ]
+        assert batches == [["a 0"], ["b c 1"], ["d 2", "e 3"]]
+
+    def test_embed_documents_tokenizes_in_one_call(self, mocker: MockerFixture) -> None:
+        """Test that all documents are tokenized by a single batched tokenizer call."""
+        # Arrange
+        self._mock_batched(mocker)
+        jivas_embeddings = JivasEmbeddings(
+            base_url="http://example.com",
+            api_key="dummy_key",  # pragma: allowlist secret
+            batch_size=1,
+        )
+
+        # Act
+        jivas_embeddings.embed_documents(["text 0", "text 1", "text 2"])
+
+        # Assert
+        assert jivas_embeddings.tokenizer.call_count == 1
+
+    def test_trim_texts_only_decodes_exceeding_texts(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that trim_texts decodes only texts over the token limit."""
+        # Arrange
+        self._mock_batched(mocker)
+        jivas_embeddings = JivasEmbeddings(
+            base_url="http://example.com",
+            api_key="dummy_key",  # pragma: allowlist secret
+        )
+        jivas_embeddings.token_limit = 2
+        jivas_embeddings.tokenizer.decode.return_value = "trimmed"
+
+        # Act
+        texts, counts = jivas_embeddings.trim_texts(["short 0", "much too long 1"])
+
+        # Assert
+        assert texts == ["short 0", "trimmed"]
+        assert counts == [2, 2]
+        jivas_embeddings.tokenizer.decode.assert_called_once_with(
+            [1, 1], skip_special_tokens=True
+        )
+
+    def test_embed_documents_retries_transient_errors(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that a batch is retried after a transient error."""
+        # Arrange
+        mock_instance = self._mock_batched(mocker)
+        create = mock_instance.embeddings.create.side_effect
+        mock_instance.embeddings.create.side_effect = [
+            APIConnectionError(request=mocker.Mock()),
+            create(input=["text 0"], model="model"),
+        ]
+        mocker.patch("jivas.agent.modules.embeddings.jivas_embeddings.time.sleep")
+        jivas_embeddings = JivasEmbeddings(
+            base_url="http://example.com",
+            api_key="dummy_key",  # pragma: allowlist secret
+        )
+
+        # Act
+        result = jivas_embeddings.embed_documents(["text 0"])
+
+        # Assert
+        assert result == [[0.0]]
+        assert mock_instance.embeddings.create.call_count == 2
@@ -0,0 +1,122 @@
+"""Tests for jivas.agent.modules.embeddings.registry."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jivas.agent.modules.embeddings.registry import (
+    clear_tokenizers,
+    get_embedding_model,
+    get_tokenizer,
+    release_embedding_model,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokenizers() -> Generator[None, None, None]:
+    """Ensure each test starts with an empty tokenizer registry."""
+    clear_tokenizers()
+    yield
+    clear_tokenizers()
+
+
+class TestRegistry:
+    """Test class for the embedding model and tokenizer registries."""
+
+    def test_tokenizer_loaded_once_per_model(self, mocker: MockerFixture) -> None:
+        """Test that tokenizers are loaded once and shared per model."""
+        from_pretrained = mocker.patch("transformers.AutoTokenizer.from_pretrained")
+        from_pretrained.side_effect = lambda model: mocker.Mock(name=model)
+
+        first = get_tokenizer("model-a")
+        second = get_tokenizer("model-a")
+        other = get_tokenizer("model-b")
+
+        assert first is second
+        assert other is not first
+        assert from_pretrained.call_count == 2
+
+    def test_embedding_model_reused_until_config_changes(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that a model is only rebuilt when its owner's configuration changes."""
+        factory = mocker.Mock(side_effect=lambda: object())
+
+        first = get_embedding_model("action-1", ("openai", "m1"), factory)
+        again = get_embedding_model("action-1", ("openai", "m1"), factory)
+        changed = get_embedding_model("action-1", ("openai", "m2"), factory)
+
+        assert first is again
+        assert changed is not first
+        assert factory.call_count == 2
+        release_embedding_model("action-1")
+
+    def test_release_embedding_model_forces_rebuild(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that releasing an owner's model rebuilds it on next use."""
+        factory = mocker.Mock(side_effect=lambda: object())
+
+        first = get_embedding_model("action-2", ("openai", "m1"), factory)
+        release_embedding_model("action-2")
+        second = get_embedding_model("action-2", ("openai", "m1"), factory)
+
+        assert first is not second
+        release_embedding_model("action-2")
+
+    def test_failed_build_is_not_registered(self, mocker: MockerFixture) -> None:
+        """Test that a factory returning None is retried on next use."""
+        factory = mocker.Mock(side_effect=[None, "model"])
+
+        assert get_embedding_model("action-3", ("jivas",), factory) is None
+        assert get_embedding_model("action-3", ("jivas",), factory) == "model"
+        release_embedding_model("action-3")
+
+    def test_build_does_not_block_other_owners(self) -> None:
+        """Test that a slow build for one owner leaves other owners' lookups free."""
+        building = threading.Event()
+        release = threading.Event()
+
+        def slow_factory() -> str:
+            building.set()
+            assert release.wait(5)
+            return "slow"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            slow = executor.submit(
+                get_embedding_model, "action-4", ("openai",), slow_factory
+            )
+            assert building.wait(5)
+            assert (
+                get_embedding_model("action-5", ("openai",), lambda: "fast") == "fast"
+            )
+            release.set()
+            assert slow.result(5) == "slow"
+
+        release_embedding_model("action-4")
+        release_embedding_model("action-5")
+
+    def test_concurrent_lookups_build_once_per_owner(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that concurrent first lookups for one owner share a single build."""
+        started = threading.Barrier(4)
+
+        def factory() -> Any:
+            return object()
+
+        build = mocker.Mock(side_effect=factory)
+
+        def lookup() -> Any:
+            started.wait(5)
+            return get_embedding_model("action-6", ("openai",), build)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            models = list(executor.map(lambda _: lookup(), range(4)))
+
+        assert build.call_count == 1
+        assert all(model is models[0] for model in models)
+        release_embedding_model("action-6")
@@ -0,0 +1,42 @@
+"""Tests for jivas.agent.modules.system.concurrency."""
+
+import asyncio
+import threading
+from contextvars import ContextVar
+
+from jivas.agent.modules.system.concurrency import run_coroutine
+
+marker: ContextVar[str] = ContextVar("marker", default="")
+
+
+async def read_marker() -> tuple:
+    """Return the context marker and the thread the coroutine ran on."""
+    await asyncio.sleep(0)
+    return marker.get(), threading.get_ident()
+
+
+class TestRunCoroutine:
+    """Test class for run_coroutine."""
+
+    def test_runs_without_event_loop(self) -> None:
+        """Test that a coroutine runs on the calling thread when no loop is running."""
+        token = marker.set("caller")
+        try:
+            value, thread = run_coroutine(read_marker())
+        finally:
+            marker.reset(token)
+
+        assert value == "caller"
+        assert thread == threading.get_ident()
+
+    def test_runs_inside_running_event_loop(self) -> None:
+        """Test that a coroutine runs in a worker thread, keeping the caller's context, when a loop is running."""
+
+        async def caller() -> tuple:
+            marker.set("async caller")
+            return run_coroutine(read_marker()), threading.get_ident()
+
+        (value, thread), caller_thread = asyncio.run(caller())
+
+        assert value == "async caller"
+        assert thread != caller_thread
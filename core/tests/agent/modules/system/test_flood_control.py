@@ -0,0 +1,149 @@
+"""Tests for jivas.agent.modules.system.flood_control."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from jivas.agent.modules.system.flood_control import RedisFloodControl
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis commands used by flood control, with a manual clock."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store at time 0."""
+        self.now = 0.0
+        self.data: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+    def _get(self, key: str) -> Any:
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and expires <= self.now:
+            del self.data[key]
+            return None
+        return value
+
+    def exists(self, key: str) -> int:
+        """Return 1 if key is set."""
+        return int(self._get(key) is not None)
+
+    def set(
+        self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False
+    ) -> Any:
+        """Set key, optionally expiring in ex seconds and only if it is not set."""
+        if ex is not None and ex <= 0:
+            raise ValueError("invalid expire time in 'set' command")
+        if nx and self._get(key) is not None:
+            return None
+        self.data[key] = (value, self.now + ex if ex else None)
+        return True
+
+    def incr(self, key: str) -> int:
+        """Increment key, keeping its expiry."""
+        value = int(self._get(key) or 0) + 1
+        self.data[key] = (value, self.data.get(key, (None, None))[1])
+        return value
+
+    def delete(self, *keys: str) -> None:
+        """Remove keys."""
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        """Return a pipeline running commands on execute."""
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on execute."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        """Initialize an empty queue."""
+        self.client = client
+        self.commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        """Queue the named command."""
+
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self) -> List[Any]:
+        """Run the queued commands and return their results."""
+        return [
+            getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class TestRedisFloodControl:
+    """Test class for RedisFloodControl."""
+
+    def flood(self, control: RedisFloodControl, key: str = "agent:session") -> bool:
+        """Count a message with a threshold of 3 per 20 seconds and a 300 second block."""
+        return control.is_flood_active(key, threshold=3, window_time=20, block_time=300)
+
+    def test_blocks_after_threshold_in_window(self) -> None:
+        """Test that the message after the threshold is blocked until the block expires."""
+        client = FakeRedis()
+        control = RedisFloodControl(client=client)
+
+        assert [self.flood(control) for _ in range(4)] == [False, False, False, True]
+        client.now = 100
+        assert self.flood(control) is True
+        client.now = 301
+        assert self.flood(control) is False
+
+    def test_window_expiry_resets_count(self) -> None:
+        """Test that the count starts again once the window expires."""
+        client = FakeRedis()
+        control = RedisFloodControl(client=client)
+
+        assert [self.flood(control) for _ in range(3)] == [False, False, False]
+        client.now = 21
+        assert [self.flood(control) for _ in range(3)] == [False, False, False]
+
+    def test_keys_are_counted_separately(self) -> None:
+        """Test that sessions do not share a count."""
+        control = RedisFloodControl(client=FakeRedis())
+
+        for _ in range(4):
+            self.flood(control, "agent:one")
+        assert self.flood(control, "agent:one") is True
+        assert self.flood(control, "agent:two") is False
+
+    def test_reset_clears_block(self) -> None:
+        """Test that reset lifts a block."""
+        control = RedisFloodControl(client=FakeRedis())
+
+        for _ in range(4):
+            self.flood(control)
+        control.reset("agent:session")
+        assert self.flood(control) is False
+
+    def test_zero_window_disables_flood_control(self) -> None:
+        """Test that a window_time of 0 never blocks and sets no keys."""
+        client = FakeRedis()
+        control = RedisFloodControl(client=client)
+
+        for _ in range(5):
+            assert (
+                control.is_flood_active(
+                    "agent:session", threshold=3, window_time=0, block_time=300
+                )
+                is False
+            )
+        assert client.data == {}
+
+    def test_zero_block_time_blocks_until_window_ends(self) -> None:
+        """Test that a block_time of 0 blocks messages over the threshold in the window only."""
+        client = FakeRedis()
+        control = RedisFloodControl(client=client)
+
+        def flood() -> bool:
+            return control.is_flood_active(
+                "agent:session", threshold=3, window_time=20, block_time=0
+            )
+
+        assert [flood() for _ in range(5)] == [False, False, False, True, True]
+        client.now = 21
+        assert flood() is False
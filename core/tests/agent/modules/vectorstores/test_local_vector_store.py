@@ -0,0 +1,284 @@
+"""Tests for jivas.agent.modules.vectorstores.local_vector_store."""
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from jivas.agent.modules.vectorstores.local_vector_store import (
+    LocalVectorIndex,
+    LocalVectorStore,
+    compile_filter,
+    get_local_vector_index,
+    release_local_vector_index,
+)
+
+
+def docs(*vectors: List[float], **metadata: str) -> List[dict]:
+    """Build documents with ids d0, d1... for the given vectors."""
+    return [
+        {"id": f"d{i}", "text": f"text {i}", "metadata": dict(metadata), "vec": vec}
+        for i, vec in enumerate(vectors)
+    ]
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts by counting the keywords a, b and c."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts as keyword counts."""
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a text as keyword counts."""
+        words = text.split()
+        return [float(words.count(word)) + 0.01 for word in "abc"]
+
+
+class TestCompileFilter:
+    """Test class for compile_filter."""
+
+    def test_filter_expressions(self) -> None:
+        """Test equality, inequality and list clauses joined with &&."""
+        doc = {"id": "1", "text": "t", "metadata": {"type": "faq", "tags": ["x", "y"]}}
+
+        assert compile_filter("metadata.type:=faq")(doc)
+        assert compile_filter("type:faq")(doc)
+        assert not compile_filter("metadata.type:!=faq")(doc)
+        assert compile_filter("metadata.document_type:!=cache_response")(doc)
+        assert compile_filter("metadata.type:=[faq, doc] && metadata.tags:=y")(doc)
+        assert not compile_filter("metadata.type:=faq && metadata.tags:=z")(doc)
+        assert compile_filter({"type": "faq"})(doc)
+        assert compile_filter("") is None
+
+    def test_unsupported_filter_raises(self) -> None:
+        """Test that range clauses are rejected rather than misread."""
+        with pytest.raises(ValueError):
+            compile_filter("metadata.count:>5")
+
+
+class TestLocalVectorIndex:
+    """Test class for LocalVectorIndex."""
+
+    def test_search_ranks_by_cosine_distance(self) -> None:
+        """Test that results are ordered by cosine distance."""
+        index = LocalVectorIndex()
+        index.upsert(docs([1, 0], [0, 1], [1, 1]))
+
+        results = index.search([1, 0.1], k=2)
+
+        assert [doc["id"] for doc, _ in results] == ["d0", "d2"]
+        assert results[0][1] == pytest.approx(1 - 1 / np.sqrt(1.01), abs=1e-6)
+
+    def test_dot_metric(self) -> None:
+        """Test that the dot metric favours larger vectors."""
+        index = LocalVectorIndex(metric="dot")
+        index.upsert(docs([1, 0], [3, 0]))
+
+        assert [doc["id"] for doc, _ in index.search([1, 0], k=2)] == ["d1", "d0"]
+
+    def test_search_with_filter(self) -> None:
+        """Test that filters restrict the scored documents."""
+        index = LocalVectorIndex()
+        index.upsert(docs([1, 0], [0.9, 0.1], type="faq"))
+        index.upsert(
+            [
+                {
+                    "id": "c",
+                    "text": "cached",
+                    "metadata": {"document_type": "cache_response"},
+                    "vec": [1, 0],
+                }
+            ]
+        )
+
+        results = index.search(
+            [1, 0], k=5, filter="metadata.document_type:!=cache_response"
+        )
+
+        assert [doc["id"] for doc, _ in results] == ["d0", "d1"]
+
+    def test_upsert_replaces_and_delete_moves_last_row(self) -> None:
+        """Test that upserts replace by id and deletes keep the remaining rows consistent."""
+        index = LocalVectorIndex()
+        index.upsert(docs([1, 0], [0, 1], [1, 1]))
+        index.upsert([{"id": "d0", "text": "new", "metadata": {}, "vec": [-1, 0]}])
+
+        assert len(index) == 3
+        assert index.get("d0")["text"] == "new"
+
+        assert index.delete(["d0", "missing"]) == 1
+        assert index.get("d0") is None
+        assert index.get("d2", with_embeddings=True)["vec"] == [1.0, 1.0]
+        assert [doc["id"] for doc, _ in index.search([0, 1], k=1)] == ["d1"]
+
+    def test_dimension_mismatch_raises(self) -> None:
+        """Test that vectors of another dimension are rejected."""
+        index = LocalVectorIndex()
+        index.upsert(docs([1, 0]))
+
+        with pytest.raises(ValueError):
+            index.upsert([{"id": "x", "text": "", "vec": [1, 0, 0]}])
+
+    def test_list_documents_and_metadata_search(self) -> None:
+        """Test paging and metadata search."""
+        index = LocalVectorIndex()
+        index.upsert(docs([1, 0], [0, 1], [1, 1], type="faq"))
+
+        page = index.list_documents(page=2, per_page=2)
+        assert page["total"] == 3
+        assert [doc["id"] for doc in page["documents"]] == ["d2"]
+        assert len(index.metadata_search({"type": "faq"}, k=2)) == 2
+        assert index.metadata_search({"type": "other"}) == []
+
+    def test_save_and_memory_mapped_load(self, tmp_path: Path) -> None:
+        """Test that a saved index loads memory-mapped and copies on first write."""
+        path = str(tmp_path / "collection")
+        index = LocalVectorIndex(path, autosave=True)
+        index.upsert(docs([1, 0], [0, 1], type="faq"))
+
+        loaded = LocalVectorIndex(path)
+        assert isinstance(loaded._vectors, np.memmap)
+        assert loaded.get("d1") == {
+            "id": "d1",
+            "text": "text 1",
+            "metadata": {"type": "faq"},
+        }
+        assert [doc["id"] for doc, _ in loaded.search([0, 1], k=1)] == ["d1"]
+
+        loaded.delete(["d0"])
+        loaded.flush()
+        assert len(LocalVectorIndex(path)) == 1
+
+    def test_writes_saved_by_timer(self, tmp_path: Path) -> None:
+        """Test that writes are saved once by the background timer, not on every write."""
+        path = str(tmp_path / "collection")
+        index = LocalVectorIndex(path, save_interval=0.05)
+        index.upsert(docs([1, 0]))
+        index.upsert(docs([0, 1], [1, 1]))
+        assert len(LocalVectorIndex(path)) == 0
+
+        timer = index._save_timer
+        assert timer is not None
+        timer.join(5)
+        assert len(LocalVectorIndex(path)) == 2
+        assert index._save_timer is None
+
+    def test_save_interval_zero_leaves_saving_to_caller(self, tmp_path: Path) -> None:
+        """Test that with no timer, writes are only saved by flush."""
+        path = str(tmp_path / "collection")
+        index = LocalVectorIndex(path, save_interval=0)
+        index.upsert(docs([1, 0]))
+
+        assert index._save_timer is None
+        assert len(LocalVectorIndex(path)) == 0
+        index.flush()
+        assert len(LocalVectorIndex(path)) == 1
+
+    def test_deferred_save(self, tmp_path: Path) -> None:
+        """Test that writes within deferred_save are saved once on exit."""
+        path = str(tmp_path / "collection")
+        index = LocalVectorIndex(path)
+
+        with index.deferred_save():
+            index.upsert(docs([1, 0]))
+            assert len(LocalVectorIndex(path)) == 0
+
+        assert len(LocalVectorIndex(path)) == 1
+
+    def test_ivf_matches_exact_search_on_clustered_data(self) -> None:
+        """Test that the inverted file index finds the exact nearest neighbour on clustered data."""
+        rng = np.random.default_rng(1)
+        centers = rng.normal(size=(8, 16))
+        vectors = np.repeat(centers, 50, axis=0) + rng.normal(
+            scale=0.05, size=(400, 16)
+        )
+        exact = LocalVectorIndex(index_type="flat")
+        ivf = LocalVectorIndex(index_type="ivf", ivf_nprobe=2)
+        for index in (exact, ivf):
+            index.upsert(docs(*vectors.tolist()))
+        ivf.build_ivf()
+
+        for query in centers:
+            assert (
+                ivf.search(query.tolist(), k=1)[0][0]["id"]
+                == exact.search(query.tolist(), k=1)[0][0]["id"]
+            )
+        assert ivf._centroids is not None
+
+    def test_search_trains_ivf_in_background(self) -> None:
+        """Test that a search needing the inverted file index is exact while it is trained."""
+        rng = np.random.default_rng(2)
+        index = LocalVectorIndex(index_type="ivf", ivf_nprobe=1)
+        index.upsert(docs(*rng.normal(size=(200, 8)).tolist()))
+
+        query = index.vectors(["d7"])[0].tolist()
+        assert index.search(query, k=1)[0][0]["id"] == "d7"
+
+        thread = index._ivf_thread
+        assert thread is not None
+        thread.join(5)
+        assert index._ivf_ready()
+
+        index.upsert(
+            [
+                {"id": f"e{i}", "vec": vec}
+                for i, vec in enumerate(rng.normal(size=(201, 8)))
+            ]
+        )
+        assert not index._ivf_ready()
+
+    def test_registry_shares_indexes_by_path(self, tmp_path: Path) -> None:
+        """Test that indexes are shared per path until released."""
+        path = str(tmp_path / "collection")
+        index = get_local_vector_index(path)
+
+        assert get_local_vector_index(path, metric="dot") is index
+        assert index.metric == "dot"
+        release_local_vector_index(path)
+        assert get_local_vector_index(path) is not index
+        release_local_vector_index(path)
+
+
+class TestLocalVectorStore:
+    """Test class for LocalVectorStore."""
+
+    def test_add_texts_and_search(self) -> None:
+        """Test the langchain search API over the index."""
+        store = LocalVectorStore.from_texts(
+            ["a a", "b", "c"],
+            KeywordEmbeddings(),
+            metadatas=[{"n": 1}, {"n": 2}, {"n": 3}],
+            ids=["1", "2", "3"],
+        )
+
+        results = store.similarity_search_with_score("a", k=2)
+
+        assert results[0][0].page_content == "a a"
+        assert results[0][0].id == "1"
+        assert results[0][0].metadata == {"n": 1}
+        assert results[0][1] < results[1][1]
+        assert [doc.id for doc in store.get_by_ids(["3", "missing"])] == ["3"]
+
+    def test_max_marginal_relevance_search_prefers_diversity(self) -> None:
+        """Test that MMR skips near-duplicates of already selected documents."""
+        store = LocalVectorStore.from_texts(
+            ["a b", "a b", "a c"], KeywordEmbeddings(), ids=["1", "2", "3"]
+        )
+
+        results = store.max_marginal_relevance_search(
+            "a b", k=2, fetch_k=3, lamda_mult=0.1
+        )
+
+        assert [doc.id for doc in results] == ["1", "3"]
+
+    def test_delete(self) -> None:
+        """Test deleting documents by id."""
+        store = LocalVectorStore.from_texts(
+            ["a", "b"], KeywordEmbeddings(), ids=["1", "2"]
+        )
+
+        assert store.delete(["1"])
+        assert [doc.id for doc in store.similarity_search("a", k=5)] == ["2"]
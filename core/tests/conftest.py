@@ -0,0 +1,5 @@
+"""Shared pytest configuration for the jivas tests."""
+
+# jaclang registers its plugins (jac_cloud among them) on import; loading it before any
+# test imports jac_cloud directly avoids a circular import between the two packages
+import jaclang  # noqa: F401
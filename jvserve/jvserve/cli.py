@@ -289,6 +289,10 @@ def run_jivas(filename: str, host: str = "localhost", port: int = 8000) -> None:
             request=request,
         )
 
+    @app.post("/interact/stream", response_model=None)
+    async def interact_stream(request: Request) -> StreamingResponse | JSONResponse:
+        return await agent_interface.interact_stream(request=request)
+
     # Ensure the local file directory exists if that's the interface
     if FILE_INTERFACE == "local":
         directory = os.environ.get("JIVAS_FILES_ROOT_PATH", DEFAULT_FILES_ROOT)
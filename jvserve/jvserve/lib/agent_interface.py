@@ -1,15 +1,30 @@
 """Agent Interface class and methods for interaction with Jivas."""
 
+import asyncio
+import json
 import logging
 import os
+import time
 import traceback
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 
 import requests
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from jvserve.lib.jac_interface import JacInterface
+from jvserve.lib.jac_interface import JacInterface, WalkerError
+
+# interact attributes clients may set, as on /walker/interact
+INTERACT_FIELDS = (
+    "agent_id",
+    "session_id",
+    "utterance",
+    "channel",
+    "data",
+    "verbose",
+    "tts",
+    "tts_async",
+)
 
 
 class AgentInterface:
@@ -22,6 +37,8 @@ class AgentInterface:
     def __init__(self, host: str = "localhost", port: int = 8000) -> None:
         """Initialize the AgentInterface with JacInterface."""
         self._jac = JacInterface(host, port)
+        # references to background finalizations, so they are not collected mid-run
+        self._background_tasks: set[asyncio.Task] = set()
 
     @classmethod
     def get_instance(
@@ -134,23 +151,125 @@ class AgentInterface:
 
         return {}
 
-    async def _finalize_interaction(
-        self, interaction_node: Any, full_text: str, total_tokens: int
-    ) -> None:
-        """Finalize interaction in background"""
+    async def interact_stream(
+        self, request: Request
+    ) -> StreamingResponse | JSONResponse:
+        """Run interact and stream the reply as Server-Sent Events - async compatible
+
+        Emits a "response" event with the interact response, a "token" event per piece
+        of text as the model produces it, then a "done" event with the full text and
+        latency metrics. The interaction is finalized with the text in the background.
+        Replies which are not streamed are returned as plain JSON.
+
+        As on /walker/interact, only the public interact fields are taken from the
+        payload and the walker runs from the caller's root with the caller's access, so
+        unpublished or invalid agents are refused with the walker's own 404 or 400.
+        """
+        started = time.perf_counter()
         try:
-            interaction_node.set_text_message(message=full_text)
-            interaction_node.add_tokens(total_tokens)
+            try:
+                payload = await request.json()
+                if not isinstance(payload, dict):
+                    payload = {}
+            except Exception:
+                payload = {}
 
+            if not payload.get("agent_id"):
+                return JSONResponse(
+                    content={"error": "Missing Agent ID"}, status_code=400
+                )
+
+            # only the public interact fields are taken from the client
+            attributes = {
+                field: payload[field] for field in INTERACT_FIELDS if field in payload
+            }
+            attributes.update(streaming=True, stream_events=True, reporting=False)
+
+            walker_obj = await self._jac.spawn_walker_as_caller_async(
+                walker_name="interact",
+                module_name="jivas.agent.action.interact",
+                attributes=attributes,
+                request=request,
+            )
+            if not walker_obj:
+                self.logger.error("Interact execution failed")
+                return JSONResponse(
+                    content={"error": "Interact execution failed"}, status_code=500
+                )
+
+            stream = getattr(walker_obj, "stream", None)
+            if stream is None:
+                return JSONResponse(content=walker_obj.response)
+            # measure from the request rather than from the end of the walk
+            stream.started = started
+
+        except WalkerError as e:
+            self.logger.warning(f"Interact stream refused: {e}")
+            return JSONResponse(
+                content={"error": e.reports[0] if e.reports else "Interact failed"},
+                status_code=e.status,
+            )
+        except Exception as e:
+            self._jac.reset()
+            self.logger.error(f"Interact stream error: {e}\n{traceback.format_exc()}")
+            return JSONResponse(
+                content={"error": "Internal server error"}, status_code=500
+            )
+
+        return StreamingResponse(
+            self._stream_events(walker_obj, stream),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _stream_events(self, walker_obj: Any, stream: Any) -> AsyncIterator[str]:
+        """Yield the events of a streamed interact reply, then finalize the interaction"""
+        yield format_sse(walker_obj.response, event="response")
+        try:
+            async for text in stream:
+                yield format_sse({"content": text}, event="token")
+        except Exception as e:
+            self.logger.error(f"Token stream error: {e}\n{traceback.format_exc()}")
+            yield format_sse({"error": "Token stream interrupted"}, event="error")
+
+        metrics = stream.metrics()
+        self.logger.info(f"Interact stream metrics: {metrics}")
+        yield format_sse(
+            {"content": stream.text, "tokens": stream.tokens, "metrics": metrics},
+            event="done",
+        )
+
+        if interaction_node := getattr(walker_obj, "interaction_node", None):
+            task = asyncio.create_task(
+                self._finalize_interaction(interaction_node, stream)
+            )
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _finalize_interaction(self, interaction_node: Any, stream: Any) -> None:
+        """Finalize interaction in background with the text of the consumed stream"""
+        try:
+            # sets the message and tokens, and records the model result streamed
+            interaction_node.set_streamed_message(stream)
+
+            # update_interaction acts on the interaction it is spawned on
             await self._jac.spawn_walker_async(
                 walker_name="update_interaction",
                 module_name="jivas.agent.memory.update_interaction",
                 attributes={"interaction_data": interaction_node.export()},
+                node_id=interaction_node.id,
             )
         except Exception as e:
             self.logger.error(f"Finalize error: {e}")
 
 
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """Format data as a Server-Sent Event, JSON encoded"""
+    lines = [f"event: {event}"] if event else []
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
 # Module-level functions
 def do_pulse(action_label: str, agent_id: str) -> dict:
     """Execute pulse action synchronously"""
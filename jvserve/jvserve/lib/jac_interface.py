@@ -22,6 +22,16 @@ from jac_cloud.plugin.jaseci import JacPlugin
 from jaclang.runtimelib.machine import JacMachine
 
 
+class WalkerError(Exception):
+    """Raised when a walker spawned for a caller sets an error status"""
+
+    def __init__(self, status: int, reports: list) -> None:
+        """Initialize with the status and reports of the walker's context."""
+        super().__init__(f"Walker failed with status {status}: {reports}")
+        self.status = status
+        self.reports = reports
+
+
 class JacInterface:
     """Thread-safe connection and context state provider for Jac Runtime with auto-authentication."""
 
@@ -111,8 +121,12 @@ class JacInterface:
         module_name: str,
         attributes: dict = {},  # noqa: B006
         request: Request | None = None,  # noqa: B006
+        node_id: str | None = None,
     ) -> Optional[WalkerArchetype]:
-        """Spawn walker with proper context handling and thread safety"""
+        """Spawn walker with proper context handling and thread safety
+
+        The walker starts at the root, or at the node with id node_id if given.
+        """
 
         if not all([walker_name, module_name]):
             self.logger.error("Missing required parameters for spawning walker")
@@ -127,7 +141,13 @@ class JacInterface:
                 self.logger.error(f"Module {module_name} not found")
                 return None
 
-            entry_node = ctx.entry_node.archetype
+            if node_id:
+                entry_node = JacMachine.get_object(node_id)
+                if not entry_node:
+                    self.logger.error(f"Node {node_id} not found")
+                    return None
+            else:
+                entry_node = ctx.entry_node.archetype
 
             return JacPlugin.spawn(
                 JacMachine.spawn_walker(walker_name, attributes, module_name),
@@ -142,6 +162,52 @@ class JacInterface:
                 if JASECI_CONTEXT.get(None) == ctx:
                     JASECI_CONTEXT.set(None)
 
+    def spawn_walker_as_caller(
+        self,
+        walker_name: str,
+        module_name: str,
+        attributes: dict,
+        request: Request,
+    ) -> Optional[WalkerArchetype]:
+        """Spawn walker with the access of the request's caller
+
+        The walker starts at the root of the request (the public root for anonymous
+        callers) rather than the JIVAS_USER root, as jac-cloud runs /walker/{name}, so
+        its own routing and checks apply, e.g. agent_graph_walker only visiting
+        published agents. Raises WalkerError if the walker sets an error status.
+        """
+
+        if not all([walker_name, module_name]):
+            self.logger.error("Missing required parameters for spawning walker")
+            return None
+
+        ctx = None
+        try:
+            if module_name not in JacMachine.list_modules():
+                self.logger.error(f"Module {module_name} not found")
+                return None
+
+            ctx = JaseciContext.create(request)
+            JASECI_CONTEXT.set(ctx)
+
+            walker = JacPlugin.spawn(
+                JacMachine.spawn_walker(walker_name, attributes, module_name),
+                ctx.entry_node.archetype,
+            )
+            if ctx.status >= 400:
+                raise WalkerError(ctx.status, ctx.reports)
+            return walker
+        except WalkerError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error spawning walker: {e}\n{traceback.format_exc()}")
+            return None
+        finally:
+            if ctx:
+                ctx.close()
+                if JASECI_CONTEXT.get(None) == ctx:
+                    JASECI_CONTEXT.set(None)
+
     def _authenticate(self) -> None:
         """Thread-safe authentication with retry logic and improved error handling"""
         user = os.environ.get("JIVAS_USER")
@@ -220,9 +286,34 @@ class JacInterface:
         module_name: str,
         attributes: dict,
         request: Request | None = None,
+        node_id: str | None = None,
     ) -> Optional[WalkerArchetype]:
         """Asynchronous wrapper for walker spawning"""
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self.spawn_walker, walker_name, module_name, attributes, request
+            None,
+            self.spawn_walker,
+            walker_name,
+            module_name,
+            attributes,
+            request,
+            node_id,
+        )
+
+    async def spawn_walker_as_caller_async(
+        self,
+        walker_name: str,
+        module_name: str,
+        attributes: dict,
+        request: Request,
+    ) -> Optional[WalkerArchetype]:
+        """Asynchronous wrapper for spawning walkers with the caller's access"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self.spawn_walker_as_caller,
+            walker_name,
+            module_name,
+            attributes,
+            request,
         )
@@ -0,0 +1,172 @@
+"""Tests for AgentInterface streaming"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jvserve.lib.agent_interface import AgentInterface, format_sse
+from jvserve.lib.jac_interface import WalkerError
+
+
+class FakeStream:
+    """Token stream yielding fixed pieces of text"""
+
+    def __init__(self, pieces: List[str]) -> None:
+        """Initialize the stream with its pieces."""
+        self.pieces = pieces
+        self.text = "".join(pieces)
+        self.tokens = len(pieces)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        """Yield the pieces."""
+        for piece in self.pieces:
+            yield piece
+
+    def metrics(self) -> dict:
+        """Return fixed metrics."""
+        return {"time_to_first_token": 0.1}
+
+
+def parse_events(events: List[str]) -> List[tuple]:
+    """Parse formatted events into (event, data) pairs."""
+    parsed = []
+    for event in events:
+        name, data = event.strip().split("\n")
+        parsed.append((name[len("event: ") :], json.loads(data[len("data: ") :])))
+    return parsed
+
+
+class TestAgentInterfaceStreaming:
+    """Test streamed interact replies"""
+
+    def test_format_sse(self) -> None:
+        """Test that events are named, JSON encoded and terminated by a blank line."""
+        assert format_sse({"content": "hi"}, event="token") == (
+            'event: token\ndata: {"content": "hi"}\n\n'
+        )
+        assert format_sse([1, 2]) == "data: [1, 2]\n\n"
+
+    def test_stream_events_then_finalize(self, mocker: MockerFixture) -> None:
+        """Test that tokens are emitted between the response and done events, then the interaction is finalized."""
+        agent_interface = AgentInterface()
+        finalize = mocker.patch.object(
+            agent_interface, "_finalize_interaction", mocker.AsyncMock()
+        )
+        walker_obj = mocker.MagicMock()
+        walker_obj.response = {"response": {"session_id": "s1"}}
+
+        stream = FakeStream(["Hel", "lo"])
+
+        async def consume() -> List[Any]:
+            events = [
+                event
+                async for event in agent_interface._stream_events(walker_obj, stream)
+            ]
+            await asyncio.gather(*agent_interface._background_tasks)
+            return events
+
+        events = parse_events(asyncio.run(consume()))
+
+        assert events == [
+            ("response", {"response": {"session_id": "s1"}}),
+            ("token", {"content": "Hel"}),
+            ("token", {"content": "lo"}),
+            (
+                "done",
+                {
+                    "content": "Hello",
+                    "tokens": 2,
+                    "metrics": {"time_to_first_token": 0.1},
+                },
+            ),
+        ]
+        finalize.assert_awaited_once_with(walker_obj.interaction_node, stream)
+
+    def test_finalize_records_streamed_message(self, mocker: MockerFixture) -> None:
+        """Test that the interaction is completed from the stream, then saved with update_interaction."""
+        agent_interface = AgentInterface()
+        spawn_walker = mocker.patch.object(
+            agent_interface._jac, "spawn_walker_async", mocker.AsyncMock()
+        )
+        interaction_node = mocker.MagicMock(id="n:Interaction:1")
+        stream = FakeStream(["Hel", "lo"])
+
+        asyncio.run(agent_interface._finalize_interaction(interaction_node, stream))
+
+        interaction_node.set_streamed_message.assert_called_once_with(stream)
+        kwargs = spawn_walker.await_args.kwargs
+        assert kwargs["walker_name"] == "update_interaction"
+        assert kwargs["node_id"] == "n:Interaction:1"
+        assert kwargs["attributes"] == {
+            "interaction_data": interaction_node.export.return_value
+        }
+
+    def interact_stream(self, mocker: MockerFixture, payload: Any, spawn: Any) -> tuple:
+        """Call interact_stream with payload; return its response and the spawn mock."""
+        agent_interface = AgentInterface()
+        spawn_walker = mocker.patch.object(
+            agent_interface._jac,
+            "spawn_walker_as_caller_async",
+            mocker.AsyncMock(**spawn),
+        )
+        request = mocker.MagicMock()
+        request.json = mocker.AsyncMock(return_value=payload)
+        return asyncio.run(agent_interface.interact_stream(request)), spawn_walker
+
+    def test_interact_stream_passes_public_fields_only(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that only public interact fields reach the walker, run as the caller."""
+        walker_obj = mocker.MagicMock(stream=None, response={"response": "hi"})
+        payload = {
+            "agent_id": "n:Agent:1",
+            "utterance": "hello",
+            "session_id": "s1",
+            "context_data": {"injected": True},
+            "stream": "x",
+            "reporting": True,
+        }
+
+        response, spawn_walker = self.interact_stream(
+            mocker, payload, {"return_value": walker_obj}
+        )
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"response": "hi"}
+        kwargs = spawn_walker.await_args.kwargs
+        assert "node_id" not in kwargs
+        assert kwargs["attributes"] == {
+            "agent_id": "n:Agent:1",
+            "utterance": "hello",
+            "session_id": "s1",
+            "streaming": True,
+            "stream_events": True,
+            "reporting": False,
+        }
+
+    @pytest.mark.parametrize(
+        "status, report",
+        [(404, "Agent is not published"), (400, "Invalid agent id")],
+    )
+    def test_interact_stream_returns_walker_errors(
+        self, mocker: MockerFixture, status: int, report: str
+    ) -> None:
+        """Test that agents refused by the walker get its status, not a 500."""
+        response, _ = self.interact_stream(
+            mocker,
+            {"agent_id": "n:Agent:1"},
+            {"side_effect": WalkerError(status, [report])},
+        )
+
+        assert response.status_code == status
+        assert json.loads(response.body) == {"error": report}
+
+    def test_interact_stream_requires_agent_id(self, mocker: MockerFixture) -> None:
+        """Test that a payload without an agent id is rejected before spawning."""
+        response, spawn_walker = self.interact_stream(mocker, ["not a dict"], {})
+
+        assert response.status_code == 400
+        spawn_walker.assert_not_awaited()
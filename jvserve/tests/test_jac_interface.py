@@ -0,0 +1,65 @@
+"""Tests for JacInterface"""
+
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jvserve.lib import jac_interface as module
+from jvserve.lib.jac_interface import JacInterface, WalkerError
+
+
+class TestSpawnWalkerAsCaller:
+    """Test class for JacInterface.spawn_walker_as_caller"""
+
+    def setup_spawn(self, mocker: MockerFixture, status: int = 200) -> tuple:
+        """Patch the Jac runtime; the walker sets status on the context. Return the context and spawn mocks."""
+        ctx = mocker.MagicMock(status=200, reports=[])
+        mocker.patch.object(module.JaseciContext, "create", return_value=ctx)
+        mocker.patch.object(
+            module.JacMachine,
+            "list_modules",
+            return_value=["jivas.agent.action.interact"],
+        )
+        mocker.patch.object(module.JacMachine, "spawn_walker")
+
+        def walk(walker: Any, node: Any) -> Any:
+            if status >= 400:
+                ctx.status = status
+                ctx.reports.append("Agent is not published")
+            return walker
+
+        spawn = mocker.patch.object(module.JacPlugin, "spawn", side_effect=walk)
+        return ctx, spawn
+
+    def spawn_walker(self, mocker: MockerFixture, request: Any) -> Any:
+        """Spawn interact as the caller of request."""
+        return JacInterface().spawn_walker_as_caller(
+            walker_name="interact",
+            module_name="jivas.agent.action.interact",
+            attributes={"agent_id": "n:Agent:1"},
+            request=request,
+        )
+
+    def test_spawns_at_callers_root(self, mocker: MockerFixture) -> None:
+        """Test that the walker starts at the request's root, so it routes to the agent itself."""
+        ctx, spawn = self.setup_spawn(mocker)
+        request = mocker.MagicMock()
+
+        walker = self.spawn_walker(mocker, request)
+
+        assert walker is module.JacMachine.spawn_walker.return_value
+        module.JaseciContext.create.assert_called_once_with(request)
+        assert spawn.call_args.args[1] is ctx.entry_node.archetype
+        ctx.close.assert_called_once()
+
+    def test_raises_walker_error_status(self, mocker: MockerFixture) -> None:
+        """Test that an error status set by the walker, e.g. for unpublished agents, is raised."""
+        ctx, _ = self.setup_spawn(mocker, status=404)
+
+        with pytest.raises(WalkerError) as error:
+            self.spawn_walker(mocker, mocker.MagicMock())
+
+        assert error.value.status == 404
+        assert error.value.reports == ["Agent is not published"]
+        ctx.close.assert_called_once()